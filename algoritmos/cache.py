@@ -0,0 +1,126 @@
+# Cache (LRU) de resultados para chamadas repetidas sobre o mesmo conjunto de pontos.
+# A chave é uma impressão digital das coordenadas: hash BLAKE2b (16 bytes) do buffer float64 (n, 2),
+# junto com o nome da função e os demais parâmetros (seed, metodo, prefiltro...).
+# É opcional: os algoritmos continuam sem cache; quem quiser usa CacheResultados.memoizar.
+
+import hashlib
+import sys
+from collections import OrderedDict
+import numpy as np
+from geometria import Ponto, Circulo, como_coordenadas
+
+def impressao_digital(pontos) -> bytes:
+    """
+    Hash (BLAKE2b, 16 bytes) das coordenadas de um conjunto de pontos (lista de Ponto,
+    PontoArray ou array (n, 2)). Conjuntos com as mesmas coordenadas na mesma ordem têm o mesmo hash.
+    """
+    coordenadas = como_coordenadas(pontos)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.int64(len(coordenadas)).tobytes())
+    h.update(memoryview(coordenadas).cast('B'))
+    return h.digest()
+
+def _tamanho(objeto) -> int:
+    """Estimativa, em bytes, da memória ocupada por um resultado guardado no cache."""
+    if isinstance(objeto, np.ndarray):
+        return sys.getsizeof(objeto) + (0 if objeto.base is None else objeto.nbytes)
+    if isinstance(objeto, Circulo):
+        return sys.getsizeof(objeto) + _tamanho(objeto.centro) + sys.getsizeof(objeto.raio)
+    if isinstance(objeto, Ponto):
+        return sys.getsizeof(objeto) + sys.getsizeof(objeto.x) + sys.getsizeof(objeto.y)
+    if isinstance(objeto, (tuple, list)):
+        return sys.getsizeof(objeto) + sum(_tamanho(item) for item in objeto)
+    return sys.getsizeof(objeto)
+
+class CacheResultados:
+    """
+    Cache LRU de resultados, limitado por número de entradas e por bytes.
+
+    Parâmetros
+    ----------
+    max_entradas : número máximo de resultados guardados
+    max_bytes : memória máxima (estimada) dos resultados guardados
+
+    Os contadores acertos, falhas e descartes podem ser lidos em estatisticas().
+    Os resultados são devolvidos sem cópia (Ponto e Circulo são imutáveis; arrays não devem ser alterados).
+    """
+    def __init__(self, max_entradas: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._entradas: OrderedDict = OrderedDict()  # chave -> (resultado, bytes)
+        self.bytes = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def chave(self, nome: str, pontos, *args, **kwargs) -> tuple:
+        """Chave de uma chamada: nome da função, impressão digital dos pontos e demais parâmetros."""
+        return (nome, impressao_digital(pontos), args, tuple(sorted(kwargs.items())))
+
+    def obter(self, chave):
+        """Resultado guardado para a chave (marcado como usado recentemente), ou None."""
+        entrada = self._entradas.get(chave)
+        if entrada is None:
+            self.falhas += 1
+            return None
+        self.acertos += 1
+        self._entradas.move_to_end(chave)
+        return entrada[0]
+
+    def guardar(self, chave, resultado):
+        """Guarda um resultado, descartando os menos usados recentemente se passar dos limites."""
+        tamanho = _tamanho(resultado) + sys.getsizeof(chave)
+        if tamanho > self.max_bytes:
+            return
+        antigo = self._entradas.pop(chave, None)
+        if antigo is not None:
+            self.bytes -= antigo[1]
+        self._entradas[chave] = (resultado, tamanho)
+        self.bytes += tamanho
+        while len(self._entradas) > self.max_entradas or self.bytes > self.max_bytes:
+            _, (_, tamanho_descartado) = self._entradas.popitem(last=False)
+            self.bytes -= tamanho_descartado
+            self.descartes += 1
+
+    def memoizar(self, funcao, nome: str | None = None):
+        """
+        Envolve funcao(pontos, *args, **kwargs) com o cache. Os demais parâmetros entram na chave
+        e precisam ser hashable (seed, metodo, prefiltro, vetorizado...).
+
+        Exemplo: eficiente = cache.memoizar(calcular_circulo_eficiente)
+                 eficiente(pontos, seed=42)  # calcula
+                 eficiente(pontos, seed=42)  # devolve o mesmo Circulo do cache
+        """
+        nome = nome or f"{funcao.__module__}.{funcao.__qualname__}"
+
+        def funcao_memoizada(pontos, *args, **kwargs):
+            chave = self.chave(nome, pontos, *args, **kwargs)
+            resultado = self.obter(chave)
+            if resultado is None:
+                resultado = funcao(pontos, *args, **kwargs)
+                if resultado is not None:
+                    self.guardar(chave, resultado)
+            return resultado
+
+        funcao_memoizada.__name__ = getattr(funcao, "__name__", nome)
+        funcao_memoizada.__doc__ = funcao.__doc__
+        funcao_memoizada.cache = self
+        return funcao_memoizada
+
+    def estatisticas(self) -> dict:
+        """Contadores do cache."""
+        return {
+            "entradas": len(self._entradas),
+            "bytes": self.bytes,
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "descartes": self.descartes
+        }
+
+    def limpar(self):
+        """Esvazia o cache (os contadores são mantidos)."""
+        self._entradas.clear()
+        self.bytes = 0
@@ -0,0 +1,184 @@
+# Círculo mínimo exato de um conjunto que muda aos poucos (inserções e remoções).
+# Guarda o círculo atual, os pontos de suporte (os que estão na fronteira) e a envoltória
+# convexa dos pontos. Só recalcula quando é preciso:
+#   - inserir um ponto dentro do círculo: O(1), nada muda;
+#   - inserir um ponto fora: o novo círculo tem esse ponto na fronteira, então basta uma
+#     passada com ele fixo sobre os vértices da envoltória (atualizada com os pontos novos);
+#   - remover um ponto que não é de suporte: O(1), o círculo continua o mesmo;
+#   - remover um ponto de suporte: envoltória e círculo são recalculados do zero.
+
+import random
+import numpy as np
+from geometria import Ponto, Circulo, como_coordenadas
+from algoritmos.eficiente import _fora, _passada_um_ponto, _welzl_iterativo
+from algoritmos.envoltoria import filtrar_akl_toussaint, envoltoria_convexa
+
+# Círculo do conjunto vazio, como estado (ver eficiente._estado): faixa negativa, então o
+# primeiro ponto sempre fica de fora
+_ESTADO_VAZIO = (0.0, 0.0, 0.0, -1.0, -1.0, ())
+
+class CirculoDinamico:
+    """
+    Menor círculo envolvente exato de um conjunto com inserções e remoções.
+
+    Cada ponto inserido recebe um identificador inteiro, usado para removê-lo depois.
+    Identificadores de pontos removidos podem ser reaproveitados por inserções futuras.
+    O atributo recalculos conta os recálculos feitos ("fronteira": ponto novo fora do círculo;
+    "completo": remoção de um ponto de suporte).
+    """
+    def __init__(self, pontos=None, seed: int | None = None):
+        self._rng = random.Random(seed)
+        self._coordenadas = np.empty((16, 2), dtype=np.float64)
+        self._ativo = np.zeros(16, dtype=bool)
+        self._usados = 0  # posições já ocupadas alguma vez em _coordenadas
+        self._livres: list[int] = []
+        self._num_pontos = 0
+
+        # Círculo atual como estado de eficiente.py: (cx, cy, r, r2_lo, r2_hi, definidores)
+        self._estado = _ESTADO_VAZIO
+        self._suporte: set[int] = set()
+        # Vértices da envoltória (None = precisa recalcular) e pontos inseridos desde então
+        self._envoltoria: set[int] | None = set()
+        self._pendentes: set[int] = set()
+        self.recalculos = {"fronteira": 0, "completo": 0}
+
+        if pontos is not None and len(pontos):
+            coordenadas = como_coordenadas(pontos)
+            self._garantir_capacidade(len(coordenadas))
+            self._coordenadas[:len(coordenadas)] = coordenadas
+            self._ativo[:len(coordenadas)] = True
+            self._usados = self._num_pontos = len(coordenadas)
+            self._recalcular_completo()
+
+    def __len__(self):
+        return self._num_pontos
+
+    @property
+    def circulo(self) -> Circulo:
+        """Círculo mínimo atual (centro (0, 0) e raio 0 se o conjunto estiver vazio)."""
+        cx, cy, r = self._estado[:3]
+        return Circulo(Ponto(cx, cy), r)
+
+    @property
+    def suporte(self) -> list[int]:
+        """Identificadores dos pontos na fronteira do círculo atual."""
+        return sorted(self._suporte)
+
+    def ponto(self, identificador: int) -> Ponto:
+        """Ponto guardado com o identificador dado."""
+        self._verificar(identificador)
+        x, y = self._coordenadas[identificador]
+        return Ponto(float(x), float(y))
+
+    def inserir(self, ponto) -> int:
+        """Insere um ponto (Ponto ou par (x, y)) e retorna o seu identificador."""
+        x, y = (ponto.x, ponto.y) if isinstance(ponto, Ponto) else ponto
+        x, y = float(x), float(y)
+        if self._livres:
+            k = self._livres.pop()
+        else:
+            self._garantir_capacidade(self._usados + 1)
+            k = self._usados
+            self._usados += 1
+        self._coordenadas[k, 0] = x
+        self._coordenadas[k, 1] = y
+        self._ativo[k] = True
+        self._num_pontos += 1
+
+        cx, cy, _, r2_lo, r2_hi, definidores = self._estado
+        dx = x - cx
+        dy = y - cy
+        d2 = dx * dx + dy * dy
+        if d2 <= r2_lo or (d2 <= r2_hi and not _fora(x, y, definidores)):
+            # Dentro: o círculo não muda. Pontos que não estão garantidamente no interior (fora
+            # da faixa do teste rápido) entram no suporte, para que a remoção deles recalcule o círculo.
+            if d2 > r2_lo:
+                self._suporte.add(k)
+            if self._envoltoria is not None:
+                self._pendentes.add(k)
+        else:
+            self._recalcular_com_fronteira(k)
+        return k
+
+    def remover(self, identificador: int):
+        """Remove o ponto com o identificador dado."""
+        self._verificar(identificador)
+        self._ativo[identificador] = False
+        self._livres.append(identificador)
+        self._num_pontos -= 1
+
+        self._pendentes.discard(identificador)
+        if self._envoltoria is not None and identificador in self._envoltoria:
+            self._envoltoria = None
+        if identificador in self._suporte:
+            self._recalcular_completo()
+
+    def _verificar(self, identificador: int):
+        if not (0 <= identificador < self._usados and self._ativo[identificador]):
+            raise KeyError(f"Não há ponto com identificador {identificador}.")
+
+    def _garantir_capacidade(self, tamanho: int):
+        capacidade = len(self._ativo)
+        if tamanho <= capacidade:
+            return
+        while capacidade < tamanho:
+            capacidade *= 2
+        coordenadas = np.empty((capacidade, 2), dtype=np.float64)
+        coordenadas[:self._usados] = self._coordenadas[:self._usados]
+        ativo = np.zeros(capacidade, dtype=bool)
+        ativo[:self._usados] = self._ativo[:self._usados]
+        self._coordenadas, self._ativo = coordenadas, ativo
+
+    def _vertices_envoltoria(self) -> np.ndarray:
+        """Índices dos vértices da envoltória de todos os pontos ativos, atualizando o cache."""
+        if self._envoltoria is None:
+            candidatos = np.flatnonzero(self._ativo[:self._usados])
+            candidatos = candidatos[filtrar_akl_toussaint(self._coordenadas[candidatos])]
+        else:
+            # A envoltória nova é a envoltória da antiga junto com os pontos inseridos depois dela
+            candidatos = np.fromiter(self._envoltoria | self._pendentes, dtype=np.int64)
+        vertices = candidatos[envoltoria_convexa(self._coordenadas[candidatos])]
+        self._envoltoria = set(vertices.tolist())
+        self._pendentes = set()
+        return vertices
+
+    def _coordenadas_embaralhadas(self, vertices: np.ndarray) -> tuple[list[float], list[float]]:
+        ordem = vertices.tolist()
+        self._rng.shuffle(ordem)
+        coordenadas = self._coordenadas[ordem]
+        return coordenadas[:, 0].tolist(), coordenadas[:, 1].tolist()
+
+    def _atualizar_circulo(self, estado: tuple, vertices: np.ndarray):
+        self._estado = estado
+        # O suporte está entre os vértices da envoltória: os pontos da fronteira do círculo (e os
+        # poucos que a faixa do teste rápido não garante estarem no interior)
+        cx, cy, _, r2_lo, _, _ = estado
+        coordenadas = self._coordenadas[vertices]
+        dx = coordenadas[:, 0] - cx
+        dy = coordenadas[:, 1] - cy
+        with np.errstate(over='ignore'):  # d² = inf (coordenadas enormes) continua > r2_lo
+            self._suporte = set(vertices[dx * dx + dy * dy > r2_lo].tolist())
+
+    def _recalcular_com_fronteira(self, k: int):
+        """Ponto k caiu fora do círculo: ele fica na fronteira do novo círculo mínimo."""
+        self.recalculos["fronteira"] += 1
+        if self._envoltoria is not None:
+            self._pendentes.add(k)
+        vertices = self._vertices_envoltoria()
+        xs, ys = self._coordenadas_embaralhadas(vertices)
+        px, py = self._coordenadas[k].tolist()
+        self._atualizar_circulo(_passada_um_ponto(xs, ys, len(xs), px, py, False), vertices)
+
+    def _recalcular_completo(self):
+        """Recalcula envoltória e círculo a partir de todos os pontos ativos."""
+        self.recalculos["completo"] += 1
+        self._envoltoria = None
+        self._pendentes = set()
+        if self._num_pontos == 0:
+            self._envoltoria = set()
+            self._estado = _ESTADO_VAZIO
+            self._suporte = set()
+            return
+        vertices = self._vertices_envoltoria()
+        xs, ys = self._coordenadas_embaralhadas(vertices)
+        self._atualizar_circulo(_welzl_iterativo(xs, ys), vertices)
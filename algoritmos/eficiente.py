@@ -1,150 +1,593 @@
 # Implementação do algoritmo que fornce o raio mínimo
 # Vou chamá-lo de eficiente
+# Os laços internos trabalham direto com as coordenadas (floats), sem criar Ponto/Circulo
+# para cada círculo candidato. Só o resultado final vira um Circulo.
+#
+# Predicados robustos: cada círculo candidato guarda os pontos que o definem (1, 2 ou 3) e uma
+# faixa [r2_lo, r2_hi] em volta de r², calculada a partir de um limite do erro de arredondamento
+# do centro. O teste rápido (d² <= r2_lo: dentro) continua sendo uma única comparação; só os
+# pontos com d² dentro da faixa passam pelo teste exato (orientação / in-circle com filtro em
+# float e, se o filtro não decidir, aritmética exata com Fraction). Nada depende de uma
+# tolerância absoluta, então o resultado é o mesmo em qualquer escala das coordenadas.
 
 import random
 import math
-from geometria import Ponto, Circulo
+from fractions import Fraction
+from itertools import islice
+import numpy as np
+from geometria import Ponto, Circulo, PontoArray, como_coordenadas
+from algoritmos.envoltoria import (prefiltrar_envoltoria, _U, _ERRO_ORIENTACAO, _EXPOENTE_MAXIMO, _orientacao,
+                                   _orientacao_exata, _expoente_reescala)
 
-_EPS = 1e-12  # tolerância numérica para pertencimento ao círculo
 
-def _dist2(a: Ponto, b: Ponto) -> float:
-    """Calcula a distância quadrada entre dois pontos."""
-    dx, dy = a.x - b.x, a.y - b.y
-    return dx * dx + dy * dy
+# Limites de erro dos filtros em float (Shewchuk); _U e _ERRO_ORIENTACAO vêm de envoltoria.py
+_ERRO_INCIRCULO = (10.0 + 96.0 * _U) * _U
+_FOLGA = 16.0 * _U  # folga relativa do raio e de d² na faixa do teste rápido
+_MENOR_CONFIAVEL = 1e-280  # abaixo disso (subnormais) o erro relativo não vale: tudo vai ao teste exato
+_MENOR_DETERMINANTE = 1e-100  # circuncentros com |d| menor são calculados com Fraction (evita underflow)
+# Coordenadas com módulo máximo fora de [2^-100, 2^100] são reescaladas por uma potência de 2
+# (_expoente_reescala, em envoltoria.py) antes do algoritmo, para que os quadrados e produtos
+# não saiam do intervalo dos floats
 
-def _is_in_circle(p: Ponto, c: Circulo) -> bool:
-    """Verifica se um ponto está dentro de um círculo."""
-    return _dist2(p, c.centro) <= (c.raio * c.raio) + 1e-9
+def _no_circulo(ax: float, ay: float, bx: float, by: float, cx: float, cy: float,
+                dx: float, dy: float) -> int:
+    """
+    Sinal do determinante in-circle: com (a, b, c) anti-horário, 1 se d está dentro do círculo
+    por a, b e c, -1 se está fora e 0 se está em cima. Filtro em float, exato com Fraction.
+    """
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+    det = (alift * (bdx * cdy - cdx * bdy) + blift * (cdx * ady - adx * cdy)
+           + clift * (adx * bdy - bdx * ady))
+    permanente = ((abs(bdx * cdy) + abs(cdx * bdy)) * alift + (abs(cdx * ady) + abs(adx * cdy)) * blift
+                  + (abs(adx * bdy) + abs(bdx * ady)) * clift)
+    limite = _ERRO_INCIRCULO * permanente
+    if det > limite:
+        return 1
+    if -det > limite:
+        return -1
 
-def _circle_two_points(a: Ponto, b: Ponto) -> Circulo:
-    """Cria o círculo mínimo com dois pontos na borda."""
-    cx = (a.x + b.x) / 2.0
-    cy = (a.y + b.y) / 2.0
-    r = math.hypot(a.x - b.x, a.y - b.y) / 2.0
-    return Circulo(Ponto(cx, cy), r)
+    dx, dy = Fraction(dx), Fraction(dy)
+    adx, ady = Fraction(ax) - dx, Fraction(ay) - dy
+    bdx, bdy = Fraction(bx) - dx, Fraction(by) - dy
+    cdx, cdy = Fraction(cx) - dx, Fraction(cy) - dy
+    det = ((adx * adx + ady * ady) * (bdx * cdy - cdx * bdy) + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+           + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady))
+    return (det > 0) - (det < 0)
 
-def _circle_three_points(a: Ponto, b: Ponto, c: Ponto) -> Circulo:
+def _fora_do_diametro(px: float, py: float, qx: float, qy: float, x: float, y: float) -> bool:
+    """Diz se (x, y) está estritamente fora do círculo de diâmetro pq: (p - x)·(q - x) > 0."""
+    t1 = (px - x) * (qx - x)
+    t2 = (py - y) * (qy - y)
+    produto = t1 + t2
+    limite = _ERRO_ORIENTACAO * (abs(t1) + abs(t2))
+    if abs(produto) > limite:
+        return produto > 0
+    if (x == px and y == py) or (x == qx and y == qy):  # o próprio p ou q: está no círculo
+        return False
+    x, y = Fraction(x), Fraction(y)
+    return (Fraction(px) - x) * (Fraction(qx) - x) + (Fraction(py) - y) * (Fraction(qy) - y) > 0
+
+def _fora(x: float, y: float, definidores: tuple) -> bool:
+    """Teste exato: (x, y) está estritamente fora do círculo definido pelos 1, 2 ou 3 pontos dados?"""
+    if len(definidores) == 1:
+        (px, py), = definidores
+        return x != px or y != py
+    if len(definidores) == 2:
+        (px, py), (qx, qy) = definidores
+        return _fora_do_diametro(px, py, qx, qy, x, y)
+    if (x, y) in definidores:  # um dos pontos que definem o círculo
+        return False
+    (ax, ay), (bx, by), (cx, cy) = definidores
+    return _no_circulo(ax, ay, bx, by, cx, cy, x, y) * _orientacao(ax, ay, bx, by, cx, cy) < 0
+
+def _estado(cx: float, cy: float, r: float, erro: float, definidores: tuple) -> tuple:
     """
-    Circumcírculo de três pontos não colineares.
-    Retorna None se forem (quase) colineares.
+    Círculo candidato como (cx, cy, r, r2_lo, r2_hi, definidores).
+    erro limita a distância entre o centro em float e o centro exato. Com d² calculado em float:
+    d² <= r2_lo garante que o ponto está dentro do círculo exato e d² > r2_hi que está fora.
+    """
+    r_lo = r * (1.0 - _FOLGA) - 2.0 * erro
+    r_hi = r * (1.0 + _FOLGA) + 2.0 * erro
+    r2_lo = r_lo * r_lo * (1.0 - _FOLGA) if r_lo > 0.0 else -1.0
+    r2_hi = r_hi * r_hi * (1.0 + _FOLGA)
+    if r2_lo < _MENOR_CONFIAVEL or not r2_hi < math.inf:
+        r2_lo, r2_hi = -1.0, math.inf
+    return cx, cy, r, r2_lo, r2_hi, definidores
+
+def _estado_um(px: float, py: float) -> tuple:
+    """Círculo de raio 0 em p: só o próprio p (mesmas coordenadas) está dentro."""
+    return px, py, 0.0, -1.0, 0.0, ((px, py),)
+
+def _estado_dois(ax: float, ay: float, bx: float, by: float) -> tuple:
+    """Círculo de diâmetro ab; o ponto médio em float erra no máximo meio ulp em cada coordenada."""
+    cx, cy, r = _circle_two_points_xy(ax, ay, bx, by)
+    return _estado(cx, cy, r, 2.0 * _U * (abs(cx) + abs(cy)), ((ax, ay), (bx, by)))
+
+def _circumcentro_exato(ax: float, ay: float, bx: float, by: float,
+                        cx: float, cy: float) -> tuple[float, float, float]:
+    """Circuncentro de três pontos não colineares, calculado com Fraction e arredondado: (ux, uy, erro)."""
+    ax, ay = Fraction(ax), Fraction(ay)
+    vx, vy = Fraction(bx) - ax, Fraction(by) - ay
+    ox, oy = Fraction(cx) - ax, Fraction(cy) - ay
+    b2 = vx * vx + vy * vy
+    c2 = ox * ox + oy * oy
+    d = 2 * (vx * oy - vy * ox)
+    ux = float(ax + (oy * b2 - vy * c2) / d)
+    uy = float(ay + (vx * c2 - ox * b2) / d)
+    return ux, uy, 2.0 * _U * (abs(ux) + abs(uy))
+
+def _circumcentro(ax: float, ay: float, bx: float, by: float,
+                  cx: float, cy: float) -> tuple[float, float, float]:
+    """
+    Circuncentro de três pontos não colineares, como (ux, uy, erro), com erro limitando a
+    distância até o circuncentro exato. As contas são feitas relativas a a, então o erro
+    depende só do tamanho do triângulo e não da distância dele até a origem. Quando o
+    triângulo é tão achatado que o limite de erro não vale, recalcula com Fraction.
     """
-    # Transformação para variáveis auxiliares
-    ax, ay = a.x, a.y
-    bx, by = b.x, b.y
-    cx, cy = c.x, c.y
+    vx, vy = bx - ax, by - ay
+    ox, oy = cx - ax, cy - ay
+    t1 = vx * oy
+    t2 = vy * ox
+    d = 2.0 * (t1 - t2)
+    erro_d = 16.0 * _U * (abs(t1) + abs(t2))
+    if not (2.0 * erro_d < abs(d) and _MENOR_DETERMINANTE < abs(d)):
+        return _circumcentro_exato(ax, ay, bx, by, cx, cy)
+    b2 = vx * vx + vy * vy
+    c2 = ox * ox + oy * oy
+    ux = (oy * b2 - vy * c2) / d
+    uy = (vx * c2 - ox * b2) / d
+    erro_x = (16.0 * _U * (abs(oy) * b2 + abs(vy) * c2) + abs(ux) * erro_d) / (abs(d) - erro_d)
+    erro_y = (16.0 * _U * (abs(vx) * c2 + abs(ox) * b2) + abs(uy) * erro_d) / (abs(d) - erro_d)
+    ux += ax
+    uy += ay
+    erro = 2.0 * (erro_x + erro_y) + 4.0 * _U * (abs(ux) + abs(uy))
+    if not erro < math.inf:
+        return _circumcentro_exato(ax, ay, bx, by, cx, cy)
+    return ux, uy, erro
 
-    d = 2.0 * ((ax - cx) * (by - cy) - (ay - cy) * (bx - cx))
-    if abs(d) < _EPS:
-        # Pontos colineares - retorna círculo com diâmetro máximo
+def _estado_tres(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> tuple:
+    """
+    Circumcírculo de a, b e c. Se forem colineares (teste exato), é o círculo com diâmetro máximo.
+    """
+    if _orientacao(ax, ay, bx, by, cx, cy) == 0:
         dist_ab = math.hypot(ax - bx, ay - by)
         dist_ac = math.hypot(ax - cx, ay - cy)
         dist_bc = math.hypot(bx - cx, by - cy)
-        
+
         if dist_ab >= dist_ac and dist_ab >= dist_bc:
-            return _circle_two_points(a, b)
+            return _estado_dois(ax, ay, bx, by)
         elif dist_ac >= dist_ab and dist_ac >= dist_bc:
-            return _circle_two_points(a, c)
+            return _estado_dois(ax, ay, cx, cy)
         else:
-            return _circle_two_points(b, c)
+            return _estado_dois(bx, by, cx, cy)
 
-    ax2ay2 = ax * ax + ay * ay
-    bx2by2 = bx * bx + by * by
-    cx2cy2 = cx * cx + cy * cy
+    ux, uy, erro = _circumcentro(ax, ay, bx, by, cx, cy)
+    r = math.hypot(ux - ax, uy - ay)
+    return _estado(ux, uy, r, erro, ((ax, ay), (bx, by), (cx, cy)))
 
-    ux = ((ax2ay2 - cx2cy2) * (by - cy) - (ay - cy) * (bx2by2 - cx2cy2)) / d
-    uy = ((ax - cx) * (bx2by2 - cx2cy2) - (ax2ay2 - cx2cy2) * (bx - cx)) / d
+def _circle_two_points_xy(ax: float, ay: float, bx: float, by: float) -> tuple[float, float, float]:
+    """Círculo mínimo com dois pontos na borda, como (cx, cy, r)."""
+    cx = (ax + bx) / 2.0
+    cy = (ay + by) / 2.0
+    r = math.hypot(ax - bx, ay - by) / 2.0
+    return cx, cy, r
 
-    r = math.hypot(ux - ax, uy - ay)
-    return Circulo(Ponto(ux, uy), r)
+def _circle_three_points_xy(ax: float, ay: float, bx: float, by: float,
+                            cx: float, cy: float) -> tuple[float, float, float]:
+    """
+    Circumcírculo de três pontos, como (cx, cy, r).
+    Se forem colineares, retorna o círculo com diâmetro máximo.
+    """
+    return _estado_tres(ax, ay, bx, by, cx, cy)[:3]
+
+def _circle_two_points(a: Ponto, b: Ponto) -> Circulo:
+    """Cria o círculo mínimo com dois pontos na borda."""
+    cx, cy, r = _circle_two_points_xy(a.x, a.y, b.x, b.y)
+    return Circulo(Ponto(cx, cy), r)
+
+def _circle_three_points(a: Ponto, b: Ponto, c: Ponto) -> Circulo:
+    """
+    Circumcírculo de três pontos não colineares.
+    Se forem colineares, retorna o círculo com diâmetro máximo.
+    """
+    cx, cy, r = _circle_three_points_xy(a.x, a.y, b.x, b.y, c.x, c.y)
+    return Circulo(Ponto(cx, cy), r)
+
+def _make_circle_one_point(xs: list[float], ys: list[float], px: float, py: float) -> tuple[float, float, float]:
+    """
+    Menor círculo contendo os pontos (xs, ys) com p na fronteira (suporte).
+    """
+    return _passada_um_ponto(xs, ys, len(xs), px, py, True)[:3]
 
-def _make_circle_one_point(points: list[Ponto], p: Ponto) -> Circulo:
+def _passada_um_ponto(xs: list[float], ys: list[float], fim: int, px: float, py: float,
+                      fatias: bool) -> tuple:
     """
-    Menor círculo contendo "points" com p na fronteira (suporte).
+    Menor círculo contendo os pontos [0, fim) de (xs, ys) com p na fronteira, como estado
+    (ver _estado). Com fatias, cada recomeço recebe uma cópia do prefixo (versão original);
+    sem, percorre o prefixo do buffer sem copiá-lo.
     """
-    c = Circulo(p, 0.0)
-    for i, q in enumerate(points):
-        if not _is_in_circle(q, c):
-            if c.raio == 0.0:
-                c = _circle_two_points(p, q)
+    cx, cy, r, r2_lo, r2_hi, definidores = _estado_um(px, py)
+    for i, (qx, qy) in enumerate(islice(zip(xs, ys), fim)):
+        dx = qx - cx
+        dy = qy - cy
+        if dx * dx + dy * dy > r2_lo and (dx * dx + dy * dy > r2_hi or _fora(qx, qy, definidores)):
+            if len(definidores) == 1:
+                cx, cy, r, r2_lo, r2_hi, definidores = _estado_dois(px, py, qx, qy)
+            elif fatias:
+                cx, cy, r, r2_lo, r2_hi, definidores = _passada_dois_pontos(
+                    zip(xs[: i + 1], ys[: i + 1]), px, py, qx, qy)
             else:
-                c = _make_circle_two_points(points[: i + 1], p, q)
-    return c
+                cx, cy, r, r2_lo, r2_hi, definidores = _passada_dois_pontos(
+                    islice(zip(xs, ys), i + 1), px, py, qx, qy)
+    return cx, cy, r, r2_lo, r2_hi, definidores
 
-def _make_circle_two_points(points: list[Ponto], p: Ponto, q: Ponto) -> Circulo:
+def _make_circle_two_points(pontos_xy, px: float, py: float,
+                            qx: float, qy: float) -> tuple[float, float, float]:
     """
-    Menor círculo contendo "points" com p e q na fronteira.
+    Menor círculo contendo os pontos (iterável de pares (x, y)) com p e q na fronteira.
     Trata os dois semiciclos (esq/dir) e escolhe o mínimo válido.
     """
+    return _passada_dois_pontos(pontos_xy, px, py, qx, qy)[:3]
+
+def _passada_dois_pontos(pontos_xy, px: float, py: float, qx: float, qy: float) -> tuple:
+    """
+    Igual a _make_circle_two_points, mas devolve o estado do círculo (ver _estado).
+    O lado de cada ponto (esquerda/direita de pq) vem do predicado de orientação robusto, e o
+    circumcírculo de cada candidato é calculado relativo a p, com a mesma conta de _circumcentro.
+    """
     # círculo base: diâmetro pq
-    circ = _circle_two_points(p, q)
+    base = _estado_dois(px, py, qx, qy)
+    bx, by, _, br2_lo, br2_hi, _ = base
 
-    # Candidatos do lado esquerdo e direito (do vetor pq)
-    left: Circulo | None = None
-    right: Circulo | None = None
+    # Candidatos do lado esquerdo e direito (do vetor pq), como (raio, x, y)
+    left: tuple[float, float, float] | None = None
+    right: tuple[float, float, float] | None = None
 
     # Vetor pq
-    px, py = p.x, p.y
-    qx, qy = q.x, q.y
     vx, vy = qx - px, qy - py
+    b2 = vx * vx + vy * vy
 
-    for r in points:
-        if _is_in_circle(r, circ):
+    for rx, ry in pontos_xy:
+        dx = rx - bx
+        dy = ry - by
+        if dx * dx + dy * dy <= br2_lo:
+            continue
+        if dx * dx + dy * dy <= br2_hi and not _fora_do_diametro(px, py, qx, qy, rx, ry):
             continue
 
-        # Construir círculo passando por p, q e r
-        c = _circle_three_points(p, q, r)
+        # Orientação de (p, q, r) para classificar como "esquerda" ou "direita"
+        ox, oy = rx - px, ry - py
+        t1 = vx * oy
+        t2 = vy * ox
+        cross = t1 - t2
+        if not abs(cross) > _ERRO_ORIENTACAO * (abs(t1) + abs(t2)):  # indeciso ou NaN (overflow)
+            lado = _orientacao_exata(px, py, qx, qy, rx, ry)
+        else:
+            lado = 1 if cross > 0 else -1
+
+        # Raio do círculo passando por p, q e r
+        d = 2.0 * cross
+        if lado == 0 or not (32.0 * _U * (abs(t1) + abs(t2)) < abs(d) and _MENOR_DETERMINANTE < abs(d)):
+            raio = _estado_tres(px, py, qx, qy, rx, ry)[2]
+        else:
+            c2 = ox * ox + oy * oy
+            raio = math.hypot((oy * b2 - vy * c2) / d, (vx * c2 - ox * b2) / d)
+            if not raio < math.inf:  # overflow (coordenadas enormes): refaz pelo caminho seguro
+                raio = _estado_tres(px, py, qx, qy, rx, ry)[2]
 
-        # Testar orientação para classificar como "esquerda" ou "direita"
-        rx, ry = r.x, r.y
-        cross = (vx * (ry - py)) - (vy * (rx - px))
-        if cross > 0:
-            # lado esquerdo: mantenha o menor raio válido (ou substitua se ainda não houver)
-            if (left is None) or (c.raio > left.raio):
-                left = c
+        if lado > 0:
+            # lado esquerdo: mantenha o maior raio
+            if (left is None) or (raio > left[0]):
+                left = (raio, rx, ry)
         else:
             # lado direito
-            if (right is None) or (c.raio > right.raio):
-                right = c
+            if (right is None) or (raio > right[0]):
+                right = (raio, rx, ry)
 
     # Escolher o círculo mínimo válido que cobre todos os pontos.
     if left is None and right is None:
-        return circ
+        return base
     elif left is None:
-        return right  
+        escolhido = right
     elif right is None:
-        return left   
+        escolhido = left
     else:
         # Ambos existem; qualquer um que cubra todos os points serve — ambos devem cobrir.
         # Preferi o de menor raio.
-        return left if left.raio <= right.raio else right
+        escolhido = left if left[0] <= right[0] else right
+    return _estado_tres(px, py, qx, qy, escolhido[1], escolhido[2])
+
+def _coordenadas_embaralhadas(pontos, seed: int | None) -> tuple[list[float], list[float]]:
+    """
+    Extrai as coordenadas (xs, ys) dos pontos na ordem embaralhada.
+    A permutação depende só de len(pontos) e da seed, igual a embaralhar a lista de Ponto.
+    """
+    ordem = list(range(len(pontos)))
+    if seed is not None:
+        random.Random(seed).shuffle(ordem)
+    else:
+        random.shuffle(ordem)
+
+    if isinstance(pontos, (np.ndarray, PontoArray)):
+        coordenadas = como_coordenadas(pontos)[ordem]
+        return coordenadas[:, 0].tolist(), coordenadas[:, 1].tolist()
+    return [pontos[k].x for k in ordem], [pontos[k].y for k in ordem]
 
-def calcular_circulo_eficiente(pontos: list[Ponto], seed: int | None = None) -> Circulo:
+def _welzl_fatias(xs: list[float], ys: list[float]) -> tuple:
+    """
+    Versão original: cada recomeço recebe uma cópia do prefixo já visto.
+    Como as outras versões, devolve o estado do círculo final (ver _estado).
+    """
+    # Inicialmente, nenhum círculo (faixa negativa: o primeiro ponto sempre fica de fora)
+    cx, cy, r = 0.0, 0.0, 0.0
+    r2_lo, r2_hi, definidores = -1.0, -1.0, ()
+
+    for i, (px, py) in enumerate(zip(xs, ys)):
+        dx = px - cx
+        dy = py - cy
+        if dx * dx + dy * dy > r2_lo and (dx * dx + dy * dy > r2_hi or _fora(px, py, definidores)):
+            # Recalcular com p na fronteira usando apenas os pontos já vistos
+            cx, cy, r, r2_lo, r2_hi, definidores = _passada_um_ponto(
+                xs[: i + 1], ys[: i + 1], i + 1, px, py, True)
+
+    return cx, cy, r, r2_lo, r2_hi, definidores
+
+def _welzl_indices(xs: list[float], ys: list[float]) -> tuple:
+    """Mesma recorrência, mas os recomeços percorrem o prefixo [0, i] do buffer embaralhado sem copiá-lo."""
+    cx, cy, r = 0.0, 0.0, 0.0
+    r2_lo, r2_hi, definidores = -1.0, -1.0, ()
+
+    for i, (px, py) in enumerate(zip(xs, ys)):
+        dx = px - cx
+        dy = py - cy
+        if dx * dx + dy * dy > r2_lo and (dx * dx + dy * dy > r2_hi or _fora(px, py, definidores)):
+            cx, cy, r, r2_lo, r2_hi, definidores = _passada_um_ponto(xs, ys, i + 1, px, py, False)
+
+    return cx, cy, r, r2_lo, r2_hi, definidores
+
+# Contadores de _welzl_iterativo (ver calcular_circulo_eficiente(..., contadores=...))
+CONTADORES = ("pontos", "testes_pertencimento", "recomecos_um_ponto", "recomecos_dois_pontos",
+              "circulos_tres_pontos", "colineares")
+
+def _contar_passada_dois_pontos(xs: list[float], ys: list[float], fim: int, px: float, py: float,
+                                qx: float, qy: float, contadores: dict):
+    """
+    Conta, para uma passada do nível 2 sobre [0, fim), os circumcírculos de três pontos
+    construídos (pontos fora do círculo de diâmetro pq) e quantos caíram no caso colinear.
+    Refaz só os testes da passada, e só quando os contadores estão ligados.
+    """
+    bx, by, _, br2_lo, br2_hi, _ = _estado_dois(px, py, qx, qy)
+    tres = colineares = 0
+    for sx, sy in islice(zip(xs, ys), fim):
+        dx = sx - bx
+        dy = sy - by
+        if dx * dx + dy * dy <= br2_lo:
+            continue
+        if dx * dx + dy * dy <= br2_hi and not _fora_do_diametro(px, py, qx, qy, sx, sy):
+            continue
+        tres += 1
+        if _orientacao(px, py, qx, qy, sx, sy) == 0:
+            colineares += 1
+    contadores["circulos_tres_pontos"] += tres
+    contadores["colineares"] += colineares
+
+def _welzl_iterativo(xs: list[float], ys: list[float], contadores: dict | None = None) -> tuple:
+    """
+    Mesma recorrência em um único laço, sem chamadas recursivas.
+
+    - suporte: pilha dos pontos fixados na fronteira (0 ou 1 ponto; o segundo é tratado na hora).
+    - pilha: varreduras em andamento, uma por nível. Cada varredura é um iterador que para no
+      primeiro ponto externo e é retomada depois, do mesmo lugar.
+    O círculo candidato fica só em floats (cx, cy, r e a faixa [r2_lo, r2_hi] do teste rápido),
+    junto com os pontos que o definem, usados no teste exato. Devolve o estado do círculo
+    final (ver _estado).
+
+    Com contadores (dict com as chaves de CONTADORES), soma neles os eventos da execução.
+    Os contadores só são atualizados nos recomeços, nunca dentro das varreduras: o número de
+    testes de pertencimento sai dos índices em que cada varredura parou.
+    """
+    cx, cy, r = 0.0, 0.0, 0.0
+    r2_lo, r2_hi, definidores = -1.0, -1.0, ()
+    suporte: list[tuple[float, float]] = []
+    pilha = [enumerate(zip(xs, ys))]
+    if contadores is not None:
+        contadores["pontos"] += len(xs)
+        # Por nível: tamanho da varredura e próximo índice ainda não testado
+        tamanhos = [len(xs)]
+        proximos = [0]
+
+    while pilha:
+        for k, (x, y) in pilha[-1]:
+            dx = x - cx
+            dy = y - cy
+            if dx * dx + dy * dy > r2_lo and (dx * dx + dy * dy > r2_hi or _fora(x, y, definidores)):
+                break
+        else:
+            # Varredura do nível terminou: o ponto fixado deixa de ser suporte obrigatório
+            pilha.pop()
+            if suporte:
+                suporte.pop()
+            if contadores is not None:
+                contadores["testes_pertencimento"] += tamanhos.pop() - proximos.pop()
+            continue
+
+        if contadores is not None:
+            contadores["testes_pertencimento"] += k + 1 - proximos[-1]
+            proximos[-1] = k + 1
+
+        if not suporte:
+            # Nível 0 -> 1: fixa (x, y) na fronteira e revisita os pontos [0, k]
+            suporte.append((x, y))
+            cx, cy, r, r2_lo, r2_hi, definidores = _estado_um(x, y)
+            pilha.append(enumerate(islice(zip(xs, ys), k + 1)))
+            if contadores is not None:
+                contadores["recomecos_um_ponto"] += 1
+                tamanhos.append(k + 1)
+                proximos.append(0)
+        else:
+            px, py = suporte[-1]
+            if len(definidores) == 1:
+                cx, cy, r, r2_lo, r2_hi, definidores = _estado_dois(px, py, x, y)
+            else:
+                # Nível 2: p e q = (x, y) fixos, uma única passada sobre [0, k]
+                cx, cy, r, r2_lo, r2_hi, definidores = _passada_dois_pontos(
+                    islice(zip(xs, ys), k + 1), px, py, x, y)
+                if contadores is not None:
+                    contadores["recomecos_dois_pontos"] += 1
+                    contadores["testes_pertencimento"] += k + 1
+                    _contar_passada_dois_pontos(xs, ys, k + 1, px, py, x, y, contadores)
+
+    return cx, cy, r, r2_lo, r2_hi, definidores
+
+def _circulo_final(estado: tuple) -> tuple[float, float, float]:
+    """
+    (cx, cy, r) do estado final. Um circumcírculo é recalculado com os três pontos em ordem
+    crescente: o circuncentro é calculado relativo ao primeiro ponto, e sem isso o último bit
+    do resultado dependeria da ordem em que o suporte foi encontrado (que muda com o
+    pré-filtro e com a divisão em blocos do paralelo). O círculo de diâmetro já é simétrico.
+    Com quatro ou mais pontos sobre a circunferência, o suporte encontrado pode variar.
+    """
+    if len(estado[5]) == 3:
+        (ax, ay), (bx, by), (cx, cy) = sorted(estado[5])
+        return _estado_tres(ax, ay, bx, by, cx, cy)[:3]
+    return estado[:3]
+
+_METODOS = {
+    "fatias": _welzl_fatias,
+    "indices": _welzl_indices,
+    "iterativo": _welzl_iterativo,
+}
+
+def calcular_circulo_eficiente(pontos, seed: int | None = None, metodo: str = "iterativo",
+                               prefiltro: bool = False, contadores: dict | None = None) -> Circulo:
     """
     Calcula o menor círculo envolvente de um conjunto de pontos 2D.
 
     Parâmetros
     ----------
-    pontos : lista de Ponto
+    pontos : lista de Ponto, PontoArray ou array (n, 2) de float64
     seed : int opcional - para reprodutibilidade
+    metodo : "iterativo" (padrão, mesma recorrência em um único laço com pilha explícita),
+             "indices" (percorre o buffer embaralhado sem copiar prefixos)
+             ou "fatias" (versão original, com cópia do prefixo a cada recomeço).
+             Todos dão o mesmo círculo para a mesma seed.
+    prefiltro : se True, passa ao algoritmo só os vértices da envoltória convexa
+                (ver algoritmos.envoltoria.prefiltrar_envoltoria). O círculo é o mesmo, bit a bit
+                (salvo com quatro ou mais pontos sobre a circunferência).
+    contadores : dict opcional (só com metodo="iterativo"). Se dado, é zerado e preenchido com
+                 os eventos desta chamada (chaves de CONTADORES): pontos processados (depois do
+                 pré-filtro), testes de pertencimento, recomeços com um e com dois pontos na
+                 fronteira, circumcírculos de três pontos e casos colineares.
+                 Sem contadores o laço principal não tem custo extra.
 
     Retorna
     -------
     Circulo : centro e raio do círculo mínimo.
     """
-    P = list(pontos)
-    if not P:
+    if metodo not in _METODOS:
+        raise ValueError(f"Método desconhecido: {metodo!r}. Use um de {sorted(_METODOS)}.")
+    if contadores is not None:
+        if metodo != "iterativo":
+            raise ValueError("Os contadores só existem no método \"iterativo\".")
+        contadores.clear()
+        contadores.update(dict.fromkeys(CONTADORES, 0))
+    if len(pontos) == 0:
         return Circulo(Ponto(0.0, 0.0), 0.0)
-    if seed is not None:
-        random.Random(seed).shuffle(P)
+    if prefiltro:
+        pontos, _ = prefiltrar_envoltoria(pontos)
+    xs, ys = _coordenadas_embaralhadas(pontos, seed)
+    # Escalas extremas: trabalha com as coordenadas multiplicadas por 2^-expoente (o pré-filtro
+    # acima faz o mesmo internamente)
+    expoente = _expoente_reescala(max(max(map(abs, xs)), max(map(abs, ys))))
+    if expoente:
+        xs = [math.ldexp(x, -expoente) for x in xs]
+        ys = [math.ldexp(y, -expoente) for y in ys]
+    if contadores is not None:
+        cx, cy, r = _circulo_final(_welzl_iterativo(xs, ys, contadores))
     else:
-        random.shuffle(P)
+        cx, cy, r = _circulo_final(_METODOS[metodo](xs, ys))
+    return Circulo(Ponto(math.ldexp(cx, expoente), math.ldexp(cy, expoente)), math.ldexp(r, expoente))
 
-    # Inicialmente, nenhum círculo
-    c: Circulo | None = None
+def calcular_circulos_lote(coordenadas, offsets, seed: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula o menor círculo envolvente de muitos conjuntos pequenos de uma vez.
 
-    for i, p in enumerate(P):
-        if c is None or not _is_in_circle(p, c):
-            # Recalcular com p na fronteira usando apenas os pontos já vistos
-            c = _make_circle_one_point(P[: i + 1], p)
+    Parâmetros
+    ----------
+    coordenadas : array (N, 2) com os pontos de todos os grupos, um grupo após o outro
+    offsets : array (m + 1,) de inteiros; o grupo g ocupa as linhas [offsets[g], offsets[g + 1])
+    seed : int opcional - para reprodutibilidade
+
+    Retorna
+    -------
+    (centros, raios) : arrays (m, 2) e (m,). Grupos vazios recebem centro (0, 0) e raio 0.
+
+    Os grupos são embaralhados todos juntos (um único sorteio e uma ordenação por grupo) e as
+    coordenadas são convertidas uma única vez, para evitar o custo fixo de cada chamada
+    a calcular_circulo_eficiente.
+    """
+    coordenadas = como_coordenadas(coordenadas)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if offsets.ndim != 1 or len(offsets) == 0:
+        raise ValueError("offsets deve ser um array 1D com m + 1 posições.")
+    if offsets[0] != 0 or offsets[-1] != len(coordenadas) or np.any(np.diff(offsets) < 0):
+        raise ValueError("offsets deve começar em 0, ser não decrescente e terminar em len(coordenadas).")
+
+    num_grupos = len(offsets) - 1
+    centros = np.zeros((num_grupos, 2), dtype=np.float64)
+    raios = np.zeros(num_grupos, dtype=np.float64)
+
+    # Embaralha dentro de cada grupo: ordena por (grupo, chave aleatória).
+    # Os pontos extremos de cada grupo (mín/máx de x, y, x+y e x-y) recebem chave -1 e vão para
+    # o começo do grupo: o primeiro círculo já fica perto do mínimo e quase não há recomeços.
+    tamanhos = np.diff(offsets)
+    grupos = np.repeat(np.arange(num_grupos), tamanhos)
+    chaves = np.random.default_rng(seed).random(len(coordenadas))
+    nao_vazios = offsets[:-1][tamanhos > 0]
+    if len(nao_vazios):
+        x = coordenadas[:, 0]
+        y = coordenadas[:, 1]
+        grupos_nao_vazios = np.cumsum(tamanhos > 0)[grupos] - 1
+        for valores in (x, y, x + y, x - y):
+            for reduz in (np.minimum, np.maximum):
+                extremo = reduz.reduceat(valores, nao_vazios)
+                chaves[valores == extremo[grupos_nao_vazios]] = -1.0
+    embaralhadas = coordenadas[np.lexsort((chaves, grupos))]
+
+    # Escalas extremas: cada grupo é reescalado pelo seu próprio expoente, com a mesma regra de
+    # _expoente_reescala (módulo máximo fora de [2^-100, 2^100]), aqui vetorizada
+    expoentes = np.zeros(num_grupos, dtype=np.int64)
+    if len(nao_vazios):
+        maximos = np.maximum.reduceat(np.abs(embaralhadas).max(axis=1), nao_vazios)
+        _, expoentes_maximos = np.frexp(maximos)
+        reescalar = (np.abs(expoentes_maximos) > _EXPOENTE_MAXIMO) & (maximos > 0.0) & np.isfinite(maximos)
+        expoentes[tamanhos > 0] = np.where(reescalar, expoentes_maximos, 0)
+        if np.any(expoentes):
+            embaralhadas = np.ldexp(embaralhadas, -expoentes[grupos][:, None])
+    xs = embaralhadas[:, 0].tolist()
+    ys = embaralhadas[:, 1].tolist()
+
+    inicios = offsets[:-1].tolist()
+    fins = offsets[1:].tolist()
+    expoentes = expoentes.tolist()
+    for g in range(num_grupos):
+        ini, fim = inicios[g], fins[g]
+        if ini == fim:
+            continue
+        # Cada grupo recebe fatias das listas convertidas uma vez. Percorrer o trecho sem copiar
+        # exigiria indexar ponto a ponto (map(xs.__getitem__, range(ini, fim))), o que deixa cada
+        # varredura ~2x mais lenta que copiar a fatia, e as varreduras se repetem nos recomeços
+        cx, cy, r = _circulo_final(_welzl_iterativo(xs[ini:fim], ys[ini:fim]))
+        expoente = expoentes[g]
+        if expoente:
+            cx, cy, r = math.ldexp(cx, expoente), math.ldexp(cy, expoente), math.ldexp(r, expoente)
+        centros[g, 0] = cx
+        centros[g, 1] = cy
+        raios[g] = r
 
-    return c  
+    return centros, raios
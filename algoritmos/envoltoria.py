@@ -0,0 +1,187 @@
+# Pré-filtro pela envoltória convexa.
+# O círculo mínimo só depende dos vértices da envoltória convexa, então os pontos internos
+# podem ser descartados antes de chamar os algoritmos.
+# Etapa 1 (Akl–Toussaint): descarta, de forma vetorizada, os pontos estritamente dentro do
+# octógono formado pelos pontos extremos em x, y, x+y e x-y.
+# Etapa 2 (cadeia monótona de Andrew): calcula a envoltória convexa dos pontos que sobraram.
+# A orientação na cadeia é decidida em float com limite de erro e, perto de zero, com Fraction,
+# então os vértices não dependem de quais pontos internos também foram passados.
+# Coordenadas com módulo máximo fora de [2^-100, 2^100] são reescaladas por uma potência de 2
+# antes das contas (os produtos não saem da faixa dos floats); os índices devolvidos não mudam.
+
+import math
+from fractions import Fraction
+import numpy as np
+from geometria import como_coordenadas
+
+_TOL_RELATIVA = 1e-12  # margem relativa para só descartar pontos claramente internos
+
+# Limite de erro do filtro de orientação em float (Shewchuk); _U é metade do epsilon da máquina
+_U = 2.0 ** -53
+_ERRO_ORIENTACAO = (3.0 + 16.0 * _U) * _U
+_EXPOENTE_MAXIMO = 100
+
+def _expoente_reescala(maximo: float) -> int:
+    """
+    Expoente e para trabalhar com as coordenadas multiplicadas por 2^-e (mudança exata, salvo
+    coordenadas desprezíveis perto do máximo que virem subnormais), quando o módulo máximo está
+    fora de [2^-100, 2^100]; 0 quando quadrados e produtos já cabem nos floats.
+    """
+    if not 0.0 < maximo < math.inf:
+        return 0
+    expoente = math.frexp(maximo)[1]
+    return expoente if abs(expoente) > _EXPOENTE_MAXIMO else 0
+
+def _orientacao_exata(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> int:
+    """Sinal exato de (b - a) x (c - a), com Fraction."""
+    ax, ay = Fraction(ax), Fraction(ay)
+    det = (Fraction(bx) - ax) * (Fraction(cy) - ay) - (Fraction(by) - ay) * (Fraction(cx) - ax)
+    return (det > 0) - (det < 0)
+
+def _orientacao(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> int:
+    """
+    Orientação de (a, b, c): 1 anti-horário, -1 horário, 0 colineares.
+    Decide em float quando o determinante passa do limite de erro; senão, usa o cálculo exato.
+    """
+    detl = (bx - ax) * (cy - ay)
+    detr = (by - ay) * (cx - ax)
+    det = detl - detr
+    limite = _ERRO_ORIENTACAO * (abs(detl) + abs(detr))
+    if det > limite:
+        return 1
+    if -det > limite:
+        return -1
+    return _orientacao_exata(ax, ay, bx, by, cx, cy)
+
+def _octogono_akl_toussaint(coordenadas: np.ndarray) -> np.ndarray:
+    """
+    Vértices (sentido anti-horário, sem repetições) do polígono formado pelos pontos extremos
+    nas direções x, y, x+y e x-y.
+    """
+    x = coordenadas[:, 0]
+    y = coordenadas[:, 1]
+    soma = x + y
+    diferenca = x - y
+    indices = [
+        int(np.argmin(x)), int(np.argmin(soma)), int(np.argmin(y)), int(np.argmax(diferenca)),
+        int(np.argmax(x)), int(np.argmax(soma)), int(np.argmax(y)), int(np.argmin(diferenca)),
+    ]
+    vertices = []
+    for k in indices:
+        v = (coordenadas[k, 0], coordenadas[k, 1])
+        if not vertices or vertices[-1] != v:
+            vertices.append(v)
+    while len(vertices) > 1 and vertices[0] == vertices[-1]:
+        vertices.pop()
+    return np.array(vertices, dtype=np.float64).reshape(-1, 2)
+
+def filtrar_akl_toussaint(coordenadas: np.ndarray) -> np.ndarray:
+    """
+    Máscara booleana dos pontos que sobrevivem ao filtro de Akl–Toussaint
+    (False = estritamente dentro do octógono, não pode ser vértice da envoltória).
+    """
+    mantidos = np.ones(len(coordenadas), dtype=bool)
+    vertices = _octogono_akl_toussaint(coordenadas)
+    if len(vertices) < 3:
+        return mantidos
+
+    x = coordenadas[:, 0]
+    y = coordenadas[:, 1]
+    # O octógono contém os extremos em x e em y, então extensao é o maior módulo de todos os pontos
+    extensao = float(np.max(np.abs(vertices)))
+    expoente = _expoente_reescala(extensao)
+    if expoente:
+        x, y, vertices = np.ldexp(x, -expoente), np.ldexp(y, -expoente), np.ldexp(vertices, -expoente)
+        extensao = math.ldexp(extensao, -expoente)
+    dentro = np.ones(len(coordenadas), dtype=bool)
+    for a, b in zip(vertices, np.roll(vertices, -1, axis=0)):
+        ex, ey = b[0] - a[0], b[1] - a[1]
+        margem = _TOL_RELATIVA * np.hypot(ex, ey) * extensao
+        dentro &= (ex * (y - a[1]) - ey * (x - a[0])) > margem
+    mantidos[dentro] = False
+    return mantidos
+
+def envoltoria_convexa(coordenadas: np.ndarray) -> np.ndarray:
+    """
+    Índices (em coordenadas) dos vértices da envoltória convexa, em sentido anti-horário,
+    pela cadeia monótona de Andrew. Pontos colineares nas arestas e repetidos são descartados.
+    """
+    ordem = np.lexsort((coordenadas[:, 1], coordenadas[:, 0]))
+    ordenadas = coordenadas[ordem]
+    expoente = _expoente_reescala(float(np.max(np.abs(ordenadas)))) if len(ordenadas) else 0
+    if expoente:
+        ordenadas = np.ldexp(ordenadas, -expoente)
+    xs = ordenadas[:, 0].tolist()
+    ys = ordenadas[:, 1].tolist()
+    n = len(xs)
+    if n <= 2:
+        if n == 2 and xs[0] == xs[1] and ys[0] == ys[1]:
+            return ordem[:1]
+        return ordem
+
+    def _cadeia(posicoes):
+        cadeia = []
+        for k in posicoes:
+            x, y = xs[k], ys[k]
+            while len(cadeia) >= 2:
+                o, a = cadeia[-2], cadeia[-1]
+                t1 = (xs[a] - xs[o]) * (y - ys[o])
+                t2 = (ys[a] - ys[o]) * (x - xs[o])
+                cruz = t1 - t2
+                # Indeciso ou não finito (produtos com overflow dão inf - inf = NaN): teste exato
+                if abs(cruz) > _ERRO_ORIENTACAO * (abs(t1) + abs(t2)):
+                    esquerda = cruz > 0
+                else:
+                    esquerda = _orientacao_exata(xs[o], ys[o], xs[a], ys[a], x, y) > 0
+                if esquerda:
+                    break
+                cadeia.pop()
+            cadeia.append(k)
+        return cadeia
+
+    inferior = _cadeia(range(n))
+    superior = _cadeia(range(n - 1, -1, -1))
+    vertices = inferior[:-1] + superior[:-1]
+    if len(vertices) == 2 and xs[vertices[0]] == xs[vertices[1]] and ys[vertices[0]] == ys[vertices[1]]:
+        vertices = vertices[:1]
+    return ordem[vertices]
+
+def prefiltrar_envoltoria(pontos) -> tuple[np.ndarray, int]:
+    """
+    Reduz um conjunto de pontos aos vértices da sua envoltória convexa.
+
+    Parâmetros
+    ----------
+    pontos : lista de Ponto, PontoArray ou array (n, 2) de float64
+
+    Retorna
+    -------
+    (vertices, removidos) : array (h, 2) com os vértices da envoltória (sentido anti-horário)
+    e quantos pontos foram descartados.
+    """
+    coordenadas = como_coordenadas(pontos)
+    if len(coordenadas) == 0:
+        return coordenadas, 0
+    candidatos = coordenadas[filtrar_akl_toussaint(coordenadas)]
+    vertices = candidatos[envoltoria_convexa(candidatos)]
+    return vertices, len(coordenadas) - len(vertices)
+
+def camadas_convexas(pontos, num_camadas: int) -> list[np.ndarray]:
+    """
+    Primeiras camadas convexas ("casca de cebola"): a camada 1 são os vértices da envoltória,
+    a camada 2 os vértices da envoltória do que sobra sem a camada 1, e assim por diante.
+
+    Retorna uma lista com os índices (em pontos) dos vértices de cada camada, em sentido
+    anti-horário; pode ter menos de num_camadas camadas se os pontos acabarem antes.
+    """
+    coordenadas = como_coordenadas(pontos)
+    restantes = np.arange(len(coordenadas))
+    camadas = []
+    while len(camadas) < num_camadas and len(restantes):
+        candidatos = restantes[filtrar_akl_toussaint(coordenadas[restantes])]
+        vertices = candidatos[envoltoria_convexa(coordenadas[candidatos])]
+        camadas.append(vertices)
+        manter = np.ones(len(coordenadas), dtype=bool)
+        manter[vertices] = False
+        restantes = restantes[manter[restantes]]
+    return camadas
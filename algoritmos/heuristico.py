@@ -1,63 +1,233 @@
-
 # Algoritmo heurístico para encontrar um círculo que engloba todos os pontos de um conjunto.
 # Não garante o círculo mínimo, mas tem complexidade O(n).
 # Começa pegando os pontos mais extremos e monta um círculo usando o par mais distante como diâmetro.
 # Vai ajustando o centro e o raio de um novo círculo se algum ponto ficar de fora.
+# O laço principal trabalha direto com as coordenadas (floats), sem criar um Ponto a cada expansão.
 
-from geometria import Ponto, Circulo
+import math
+import numpy as np
+from geometria import Ponto, Circulo, PontoArray, como_coordenadas
+from algoritmos.envoltoria import prefiltrar_envoltoria
+from algoritmos.eficiente import calcular_circulo_eficiente
 from itertools import combinations
 
-def calcular_circulo_heuristico(pontos: list[Ponto]) -> Circulo:
+_TOLERANCIA = 1e-6  # mesma tolerância padrão de Circulo.contem
+
+def _coordenadas_xy(pontos) -> tuple[list[float], list[float]]:
+    """Extrai as listas de coordenadas (xs, ys) de uma lista de Ponto, PontoArray ou array (n, 2)."""
+    if isinstance(pontos, (np.ndarray, PontoArray)):
+        coordenadas = como_coordenadas(pontos)
+        return coordenadas[:, 0].tolist(), coordenadas[:, 1].tolist()
+    return [p.x for p in pontos], [p.y for p in pontos]
+
+def _circulo_inicial(x_ext: list[float], y_ext: list[float]) -> tuple[float, float, float]:
     """
-    Calcula um círculo envolvente para um conjunto de pontos.
+    Círculo inicial (cx, cy, r) usando como diâmetro o par mais distante entre os pontos extremos.
     """
-    if not pontos:
-        return None
-    if len(pontos) == 1:
-        return Circulo(pontos[0], 0)
+    i, j = None, None
+    max_dist_quadrada = -1
+    for k1, k2 in combinations(range(len(x_ext)), 2):
+        dist_sq = (x_ext[k1] - x_ext[k2])**2 + (y_ext[k1] - y_ext[k2])**2
+        if dist_sq > max_dist_quadrada:
+            max_dist_quadrada = dist_sq
+            i, j = k1, k2
+
+    centro_x = (x_ext[i] + x_ext[j]) / 2
+    centro_y = (y_ext[i] + y_ext[j]) / 2
+    dx = x_ext[i] - x_ext[j]
+    dy = y_ext[i] - y_ext[j]
+    raio = math.sqrt(dx * dx + dy * dy) / 2
+    return centro_x, centro_y, raio
 
-    # Acha os pontos extremos
+def _expandir(centro_x: float, centro_y: float, raio: float,
+              x_k: float, y_k: float, dist_pk_centro: float) -> tuple[float, float, float]:
+    """Expande o círculo (cx, cy, r) para incluir o ponto externo pk, que está a dist_pk_centro do centro."""
+    # "move" o centro na direção do ponto externo
+    fator_deslocamento = (dist_pk_centro - raio) / (2 * dist_pk_centro)
+    novo_centro_x = centro_x + (x_k - centro_x) * fator_deslocamento
+    novo_centro_y = centro_y + (y_k - centro_y) * fator_deslocamento
+
+    # expande o novo raio
+    novo_raio = (raio + dist_pk_centro) / 2
+    return novo_centro_x, novo_centro_y, novo_raio
+
+def _circulo_heuristico_sequencial(xs: list[float], ys: list[float]) -> tuple[float, float, float]:
+    """Versão ponto a ponto da heurística, em Python puro."""
+    # Acha os pontos extremos (primeira ocorrência, como min/max com key)
     # extremos = [x_min, x_max, y_min, y_max]
     extremos = [
-        min(pontos, key=lambda p: p.x),
-        max(pontos, key=lambda p: p.x),
-        min(pontos, key=lambda p: p.y),
-        max(pontos, key=lambda p: p.y)
+        xs.index(min(xs)),
+        xs.index(max(xs)),
+        ys.index(min(ys)),
+        ys.index(max(ys))
     ]
+    centro_x, centro_y, raio = _circulo_inicial([xs[k] for k in extremos], [ys[k] for k in extremos])
 
-    # Escolhe o par mais distante entre os pontos extremos
-    p_i, p_j = None, None
-    max_dist_quadrada = -1
-    for p1, p2 in combinations(extremos, 2):
-        dist_sq = (p1.x - p2.x)**2 + (p1.y - p2.y)**2
-        if dist_sq > max_dist_quadrada:
-            max_dist_quadrada = dist_sq
-            p_i, p_j = p1, p2
+    # Para cada ponto pk da lista, se pk estiver fora do círculo, expande o círculo para incluí-lo
+    for x_k, y_k in zip(xs, ys):
+        # calcula a distância do centro do atual círculo ao ponto pk
+        dx = centro_x - x_k
+        dy = centro_y - y_k
+        dist_pk_centro = math.sqrt(dx * dx + dy * dy)
 
-    # Calcula o círculo inicial com os pontos mais distantes definindo o diâmetro do círculo
-    centro_x = (p_i.x + p_j.x) / 2
-    centro_y = (p_i.y + p_j.y) / 2
-    centro = Ponto(centro_x, centro_y)
-    raio = p_i.distancia(p_j) / 2
-    circulo = Circulo(centro, raio)
+        if dist_pk_centro > raio + _TOLERANCIA: # Se o ponto pk está fora do círculo
+            centro_x, centro_y, raio = _expandir(centro_x, centro_y, raio, x_k, y_k, dist_pk_centro)
 
-    # Para cada ponto pk da lista, se pk estiver fora do círculo, expande o círculo para incluí-lo
-    for p_k in pontos:
-        if not circulo.contem(p_k): # Se o ponto pk está fora do círculo
-            
-            # calcula a distância do centro do atual círculo ao ponto pk
-            dist_pk_centro = circulo.centro.distancia(p_k)
-
-            # expande o novo raio
-            novo_raio = (circulo.raio + dist_pk_centro) / 2 
-
-            # "move" o centro na direção do ponto externo
-            fator_deslocamento = (dist_pk_centro - circulo.raio) / (2 * dist_pk_centro)
-            novo_centro_x = circulo.centro.x + (p_k.x - circulo.centro.x) * fator_deslocamento
-            novo_centro_y = circulo.centro.y + (p_k.y - circulo.centro.y) * fator_deslocamento
-
-            # calcula o novo círculo que engloba todos os pontos já vistos
-            circulo.centro = Ponto(novo_centro_x, novo_centro_y)
-            circulo.raio = novo_raio
-            
-    return circulo
\ No newline at end of file
+    return centro_x, centro_y, raio
+
+def _varrer_vetorizado(x: np.ndarray, y: np.ndarray, centro_x: float, centro_y: float, raio: float,
+                       tamanho_bloco: int) -> tuple[float, float, float]:
+    """
+    Passa os pontos (x, y) pelo círculo (cx, cy, r) testando um bloco inteiro de uma vez
+    e trata um a um só os pontos que ficam de fora. Como o bloco é retomado logo depois de cada
+    ponto externo, a sequência de expansões é a mesma da versão sequencial.
+    """
+    n = len(x)
+    inicio = 0
+    while inicio < n:
+        fim = min(inicio + tamanho_bloco, n)
+        dx = centro_x - x[inicio:fim]
+        dy = centro_y - y[inicio:fim]
+        dist = np.sqrt(dx * dx + dy * dy)
+        fora = np.flatnonzero(dist > raio + _TOLERANCIA)
+        if fora.size == 0:
+            inicio = fim
+            continue
+
+        # Só o primeiro ponto externo do bloco é tratado; o resto do bloco é testado de novo
+        # contra o círculo expandido.
+        k = int(fora[0])
+        centro_x, centro_y, raio = _expandir(centro_x, centro_y, raio,
+                                             float(x[inicio + k]), float(y[inicio + k]), float(dist[k]))
+        inicio += k + 1
+
+    return centro_x, centro_y, raio
+
+def _circulo_inicial_vetorizado(x: np.ndarray, y: np.ndarray) -> tuple[float, float, float]:
+    """Círculo inicial a partir dos extremos de um array de coordenadas."""
+    extremos = [int(np.argmin(x)), int(np.argmax(x)), int(np.argmin(y)), int(np.argmax(y))]
+    return _circulo_inicial(x[extremos].tolist(), y[extremos].tolist())
+
+def _circulo_heuristico_vetorizado(coordenadas: np.ndarray, tamanho_bloco: int) -> tuple[float, float, float]:
+    """Versão vetorizada da heurística (mesmo resultado da sequencial)."""
+    x = coordenadas[:, 0]
+    y = coordenadas[:, 1]
+    centro_x, centro_y, raio = _circulo_inicial_vetorizado(x, y)
+    return _varrer_vetorizado(x, y, centro_x, centro_y, raio, tamanho_bloco)
+
+def calcular_circulo_heuristico(pontos, vetorizado: bool = False, tamanho_bloco: int = 8192,
+                                prefiltro: bool = False) -> Circulo:
+    """
+    Calcula um círculo envolvente para um conjunto de pontos.
+    Aceita lista de Ponto, PontoArray ou array (n, 2) de float64.
+
+    Com vetorizado=True, a varredura é feita em blocos de tamanho_bloco pontos com NumPy.
+    O resultado é o mesmo da versão sequencial para a mesma ordem dos pontos.
+
+    Com prefiltro=True, a heurística roda só sobre os vértices da envoltória convexa
+    (em sentido anti-horário). O círculo continua envolvendo todos os pontos, mas o raio
+    pode ser diferente do obtido com a ordem original.
+    """
+    if tamanho_bloco < 1:
+        raise ValueError("tamanho_bloco deve ser pelo menos 1.")
+    if len(pontos) == 0:
+        return None
+    if prefiltro:
+        pontos, _ = prefiltrar_envoltoria(pontos)
+
+    if vetorizado:
+        coordenadas = como_coordenadas(pontos)
+        if len(coordenadas) == 1:
+            return Circulo(Ponto(float(coordenadas[0, 0]), float(coordenadas[0, 1])), 0)
+        centro_x, centro_y, raio = _circulo_heuristico_vetorizado(coordenadas, tamanho_bloco)
+    else:
+        xs, ys = _coordenadas_xy(pontos)
+        if len(xs) == 1:
+            return Circulo(Ponto(xs[0], ys[0]), 0)
+        centro_x, centro_y, raio = _circulo_heuristico_sequencial(xs, ys)
+
+    return Circulo(Ponto(centro_x, centro_y), raio)
+
+
+class CirculoStream:
+    """
+    Círculo envolvente de um fluxo de pontos que chega em pedaços.
+
+    Usa a mesma regra de expansão da heurística: o primeiro pedaço define o círculo inicial
+    (par mais distante entre os extremos) e cada ponto externo expande o círculo. O estado é
+    O(1): só o círculo atual e, opcionalmente, os pontos extremos em num_direcoes direções.
+
+    Com num_direcoes >= 3, refinar() calcula o círculo mínimo exato desses pontos extremos e o
+    aumenta pelo fator 1/cos(pi/num_direcoes). Todo ponto já visto está dentro desse círculo
+    (está dentro do polígono circunscrito definido pelos extremos), então ele substitui o atual
+    quando é menor. Com refinar_a_cada, o refinamento é feito automaticamente a cada tantos pontos.
+    """
+    def __init__(self, num_direcoes: int = 0, refinar_a_cada: int | None = None, tamanho_bloco: int = 8192):
+        if num_direcoes and num_direcoes < 3:
+            raise ValueError("num_direcoes deve ser 0 (sem refinamento) ou pelo menos 3.")
+        if tamanho_bloco < 1:
+            raise ValueError("tamanho_bloco deve ser pelo menos 1.")
+        self.tamanho_bloco = tamanho_bloco
+        self.refinar_a_cada = refinar_a_cada
+        self.num_pontos = 0
+        self._centro_x = self._centro_y = self._raio = None
+        self._desde_refino = 0
+
+        self._direcoes = None
+        if num_direcoes:
+            angulos = 2 * math.pi * np.arange(num_direcoes) / num_direcoes
+            self._direcoes = np.column_stack((np.cos(angulos), np.sin(angulos)))
+            self._extremos = np.zeros((num_direcoes, 2))
+            self._alcances = np.full(num_direcoes, -np.inf)
+
+    def update(self, pontos) -> Circulo:
+        """Processa um pedaço de pontos (lista de Ponto, PontoArray ou array (n, 2)) e retorna o círculo atual."""
+        coordenadas = como_coordenadas(pontos)
+        if len(coordenadas) == 0:
+            return self.circulo
+        x = coordenadas[:, 0]
+        y = coordenadas[:, 1]
+
+        if self._raio is None:
+            self._centro_x, self._centro_y, self._raio = _circulo_inicial_vetorizado(x, y)
+        self._centro_x, self._centro_y, self._raio = _varrer_vetorizado(
+            x, y, self._centro_x, self._centro_y, self._raio, self.tamanho_bloco)
+        self.num_pontos += len(coordenadas)
+
+        if self._direcoes is not None:
+            # Guarda, para cada direção, o ponto mais distante já visto naquela direção.
+            # As projeções são feitas por blocos, como matriz (direções x bloco): a memória não
+            # cresce com o pedaço e o argmax percorre linhas contíguas.
+            direcoes = np.arange(len(self._direcoes))
+            for inicio in range(0, len(coordenadas), self.tamanho_bloco):
+                parte = coordenadas[inicio:inicio + self.tamanho_bloco]
+                projecoes = self._direcoes @ parte.T
+                melhores = np.argmax(projecoes, axis=1)
+                alcances = projecoes[direcoes, melhores]
+                maiores = alcances > self._alcances
+                self._alcances[maiores] = alcances[maiores]
+                self._extremos[maiores] = parte[melhores[maiores]]
+
+            self._desde_refino += len(coordenadas)
+            if self.refinar_a_cada is not None and self._desde_refino >= self.refinar_a_cada:
+                self.refinar()
+
+        return self.circulo
+
+    def refinar(self) -> Circulo:
+        """Aproxima o círculo atual do mínimo usando os pontos extremos guardados (ver docstring da classe)."""
+        if self._direcoes is None or self._raio is None:
+            return self.circulo
+        self._desde_refino = 0
+        exato = calcular_circulo_eficiente(np.unique(self._extremos, axis=0), seed=0)
+        raio = exato.raio / math.cos(math.pi / len(self._direcoes))
+        if raio < self._raio:
+            self._centro_x, self._centro_y, self._raio = exato.centro.x, exato.centro.y, raio
+        return self.circulo
+
+    @property
+    def circulo(self) -> Circulo:
+        """Círculo atual (None antes do primeiro ponto)."""
+        if self._raio is None:
+            return None
+        return Circulo(Ponto(self._centro_x, self._centro_y), self._raio)
@@ -0,0 +1,116 @@
+# Círculo mínimo exato em vários processos (partição e junção).
+# O array de pontos é copiado uma vez para memória compartilhada (multiprocessing.shared_memory)
+# e dividido em blocos contíguos; cada processo lê o seu bloco direto da memória compartilhada
+# e devolve só os vértices da envoltória convexa do bloco (Akl–Toussaint + cadeia monótona).
+# Todo vértice da envoltória global é vértice da envoltória do seu bloco, então a união dos
+# vértices dos blocos tem a mesma envoltória que o conjunto inteiro. Essa união (pequena) vai
+# para calcular_circulo_eficiente(prefiltro=True): a envoltória final é a mesma, na mesma ordem,
+# e o resultado é idêntico ao do algoritmo serial com a mesma seed (com ou sem pré-filtro: o
+# círculo final é recalculado a partir do seu suporte, ver eficiente._circulo_final).
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from geometria import Circulo, como_coordenadas
+from algoritmos.eficiente import calcular_circulo_eficiente
+from algoritmos.envoltoria import filtrar_akl_toussaint, envoltoria_convexa
+
+# Abaixo disso por processo, criar os processos custa mais que filtrar no processo atual
+_MINIMO_POR_PROCESSO = 200_000
+
+_executor = None  # pool do módulo (executor_compartilhado), criado na primeira vez que é pedido
+
+def executor_compartilhado() -> ProcessPoolExecutor:
+    """
+    Pool de processos (um por CPU) criado uma vez e reaproveitado pelas chamadas seguintes.
+    Os processos só são criados quando o primeiro bloco é enviado, e o pool é fechado na
+    saída do programa. É o pool usado pelo registro, para que medições repetidas não paguem
+    a criação dos processos a cada chamada.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _executor
+
+def _vertices_bloco(coordenadas: np.ndarray) -> np.ndarray:
+    """Vértices da envoltória convexa de um bloco de pontos (cópia, não uma view)."""
+    if len(coordenadas) == 0:
+        return np.array(coordenadas)
+    candidatos = coordenadas[filtrar_akl_toussaint(coordenadas)]
+    return np.array(candidatos[envoltoria_convexa(candidatos)])
+
+def _job_bloco(nome_memoria: str, num_pontos: int, inicio: int, fim: int) -> np.ndarray:
+    """Executado em um processo do pool: envoltória do bloco [inicio, fim) da memória compartilhada."""
+    memoria = shared_memory.SharedMemory(name=nome_memoria)
+    try:
+        coordenadas = np.ndarray((num_pontos, 2), dtype=np.float64, buffer=memoria.buf)
+        vertices = _vertices_bloco(coordenadas[inicio:fim])
+        del coordenadas  # a view precisa sumir antes de fechar a memória
+    finally:
+        memoria.close()
+    return vertices
+
+def candidatos_paralelos(pontos, processos: int | None = None, executor=None) -> np.ndarray:
+    """
+    União dos vértices das envoltórias de cada bloco, calculadas em paralelo.
+
+    Parâmetros
+    ----------
+    pontos : lista de Ponto, PontoArray ou array (n, 2) de float64
+    processos : número de blocos/processos (padrão: os.cpu_count())
+    executor : ProcessPoolExecutor já criado, para reaproveitar entre chamadas (opcional);
+               sem ele, um pool é criado e fechado nesta chamada
+
+    Retorna
+    -------
+    array (m, 2) com os candidatos, na ordem dos blocos. Contém todos os vértices da
+    envoltória convexa dos pontos.
+    """
+    coordenadas = como_coordenadas(pontos)
+    n = len(coordenadas)
+    processos = processos or os.cpu_count() or 1
+    blocos = max(min(processos, n // _MINIMO_POR_PROCESSO), 1)
+    if blocos == 1:
+        return _vertices_bloco(coordenadas)
+
+    memoria = shared_memory.SharedMemory(create=True, size=coordenadas.nbytes)
+    try:
+        compartilhado = np.ndarray(coordenadas.shape, dtype=np.float64, buffer=memoria.buf)
+        compartilhado[:] = coordenadas
+        del compartilhado
+        limites = np.linspace(0, n, blocos + 1).astype(int).tolist()
+        pool = executor or ProcessPoolExecutor(max_workers=blocos)
+        try:
+            futuros = [pool.submit(_job_bloco, memoria.name, n, inicio, fim)
+                       for inicio, fim in zip(limites[:-1], limites[1:])]
+            partes = [futuro.result() for futuro in futuros]
+        finally:
+            if executor is None:
+                pool.shutdown()
+    finally:
+        memoria.close()
+        memoria.unlink()
+    return np.concatenate(partes)
+
+def calcular_circulo_paralelo(pontos, seed: int | None = None, processos: int | None = None,
+                              executor=None, contadores: dict | None = None) -> Circulo:
+    """
+    Calcula o menor círculo envolvente usando vários processos.
+
+    Parâmetros
+    ----------
+    pontos : lista de Ponto, PontoArray ou array (n, 2) de float64
+    seed : seed do embaralhamento (mesmo significado que em calcular_circulo_eficiente)
+    processos : número de processos (padrão: os.cpu_count()). Com menos de 200 mil pontos por
+                processo, usa menos processos (ou nenhum, abaixo de 400 mil pontos)
+    executor : ProcessPoolExecutor para reaproveitar entre chamadas (opcional)
+    contadores : dict opcional, como em calcular_circulo_eficiente (eventos da etapa final)
+
+    Retorna
+    -------
+    Circulo idêntico ao de calcular_circulo_eficiente(pontos, seed, prefiltro=True) e, salvo
+    com quatro ou mais pontos sobre a circunferência, ao do mesmo cálculo sem pré-filtro.
+    """
+    candidatos = candidatos_paralelos(pontos, processos, executor)
+    return calcular_circulo_eficiente(candidatos, seed=seed, prefiltro=True, contadores=contadores)
@@ -0,0 +1,111 @@
+# Registro dos algoritmos que a coleta de dados sabe medir.
+# Cada algoritmo tem um nome (usado nas chaves "tempos_<nome>" e "raio_<nome>" dos dados) e uma
+# função funcao(pontos, seed) -> Circulo. O registro também guarda o que a análise precisa:
+# rótulo e cor dos gráficos, se o raio é o mínimo exato (referência para comparar os raios)
+# e se o círculo envolve todos os pontos (os robustos deixam pontos de fora).
+# Algoritmos com contadores internos (contadores=True) aceitam também funcao(pontos, seed,
+# contadores=dict), que preenche o dict com os eventos da chamada.
+# Algoritmos que criam os próprios processos (usa_processos=True) não podem ser medidos pela
+# coleta com vários workers: cada worker fica preso a uma CPU e os processos dele herdariam essa CPU.
+# Os jobs enviados aos processos da coleta levam só o nome; cada processo acha a função aqui.
+
+from algoritmos.heuristico import calcular_circulo_heuristico
+from algoritmos.eficiente import calcular_circulo_eficiente
+from algoritmos.paralelo import calcular_circulo_paralelo, executor_compartilhado
+from algoritmos.robusto import calcular_circulo_k_excecoes, calcular_circulo_ponderado
+
+_REGISTRO = {}
+
+# Cores usadas para algoritmos registrados sem cor
+_CORES = ['green', 'purple', 'brown', 'pink', 'gray', 'olive', 'cyan']
+
+def registrar(nome: str, funcao=None, *, rotulo: str | None = None, cor: str | None = None,
+              exato: bool = False, envolve_todos: bool = True, contadores: bool = False,
+              usa_processos: bool = False):
+    """
+    Registra um algoritmo. Pode ser usado direto (registrar("nome", funcao)) ou como decorador
+    (@registrar("nome")). A função recebe (pontos, seed) e retorna um Circulo; com
+    contadores=True, aceita também o argumento nomeado contadores (dict a preencher).
+    """
+    def _registrar(f):
+        if nome in _REGISTRO:
+            raise ValueError(f"Já existe um algoritmo registrado com o nome {nome!r}.")
+        _REGISTRO[nome] = {
+            "nome": nome,
+            "funcao": f,
+            "rotulo": rotulo or nome,
+            "cor": cor or _CORES[len(_REGISTRO) % len(_CORES)],
+            "exato": exato,
+            "envolve_todos": envolve_todos,
+            "contadores": contadores,
+            "usa_processos": usa_processos
+        }
+        return f
+    return _registrar if funcao is None else _registrar(funcao)
+
+def nomes_algoritmos() -> list[str]:
+    """Nomes dos algoritmos registrados, na ordem de registro."""
+    return list(_REGISTRO)
+
+def obter_algoritmo(nome: str) -> dict:
+    """Dados de um algoritmo registrado (funcao, rotulo, cor, exato, envolve_todos, contadores, usa_processos)."""
+    if nome not in _REGISTRO:
+        raise ValueError(f"Algoritmo desconhecido: {nome!r}. Use um de {nomes_algoritmos()}.")
+    return _REGISTRO[nome]
+
+def descrever_algoritmo(nome: str) -> dict:
+    """
+    Como obter_algoritmo, mas aceita nomes que não estão registrados (dados coletados com
+    algoritmos de outra versão): nesse caso devolve valores padrão para a análise.
+    """
+    if nome in _REGISTRO:
+        return _REGISTRO[nome]
+    return {"nome": nome, "funcao": None, "rotulo": nome, "cor": None, "exato": False, "envolve_todos": True,
+            "contadores": False, "usa_processos": False}
+
+def executar_algoritmo(nome: str, pontos, seed: int | None = None, contadores: dict | None = None):
+    """
+    Executa um algoritmo registrado pelo nome.
+    Com contadores (só para algoritmos registrados com contadores=True), preenche o dict com
+    os eventos da chamada.
+    """
+    algoritmo = obter_algoritmo(nome)
+    if contadores is None:
+        return algoritmo["funcao"](pontos, seed)
+    if not algoritmo["contadores"]:
+        raise ValueError(f"O algoritmo {nome!r} não tem contadores.")
+    return algoritmo["funcao"](pontos, seed, contadores=contadores)
+
+# Algoritmos do projeto
+
+@registrar("heuristico", rotulo="Heurístico", cor='blue')
+def _heuristico(pontos, seed=None):
+    return calcular_circulo_heuristico(pontos)
+
+@registrar("eficiente", rotulo="Eficiente", cor='orange', exato=True, contadores=True)
+def _eficiente(pontos, seed=None, contadores=None):
+    return calcular_circulo_eficiente(pontos, seed=seed, contadores=contadores)
+
+@registrar("heuristico_vetorizado", rotulo="Heurístico vetorizado")
+def _heuristico_vetorizado(pontos, seed=None):
+    return calcular_circulo_heuristico(pontos, vetorizado=True)
+
+@registrar("heuristico_prefiltro", rotulo="Heurístico com pré-filtro")
+def _heuristico_prefiltro(pontos, seed=None):
+    return calcular_circulo_heuristico(pontos, prefiltro=True)
+
+@registrar("eficiente_prefiltro", rotulo="Eficiente com pré-filtro", exato=True, contadores=True)
+def _eficiente_prefiltro(pontos, seed=None, contadores=None):
+    return calcular_circulo_eficiente(pontos, seed=seed, prefiltro=True, contadores=contadores)
+
+@registrar("paralelo", rotulo="Eficiente paralelo", exato=True, contadores=True, usa_processos=True)
+def _paralelo(pontos, seed=None, contadores=None):
+    return calcular_circulo_paralelo(pontos, seed=seed, executor=executor_compartilhado(), contadores=contadores)
+
+@registrar("k_excecoes", rotulo="1 exceção", envolve_todos=False)
+def _k_excecoes(pontos, seed=None):
+    return calcular_circulo_k_excecoes(pontos, k=1, seed=seed)
+
+@registrar("ponderado", rotulo="Ponderado (orçamento 1)", envolve_todos=False)
+def _ponderado(pontos, seed=None):
+    return calcular_circulo_ponderado(pontos, orcamento=1.0, seed=seed)
@@ -0,0 +1,143 @@
+# Círculos envolventes tolerantes a pontos espúrios (outliers).
+# - calcular_circulo_k_excecoes: menor círculo que contém todos os pontos menos k.
+# - calcular_circulo_ponderado: menor círculo cujos pontos de fora somam peso <= orcamento.
+#
+# Se um círculo ótimo deixa pontos de fora e é menor que o círculo mínimo do conjunto, ele
+# deixa de fora pelo menos um dos 2 ou 3 pontos de suporte desse círculo mínimo. Então basta
+# ramificar: remove um ponto de suporte, recalcula o círculo mínimo do que sobrou e repete,
+# até esgotar as remoções permitidas (no máximo 3^k círculos).
+# Depois de remover j pontos, a envoltória do que sobra só tem vértices nas j + 1 primeiras
+# camadas convexas; por isso a busca inteira roda só sobre essas camadas, e não sobre os n pontos.
+
+import math
+import random
+import numpy as np
+from geometria import Ponto, Circulo, como_coordenadas
+from algoritmos.eficiente import _estado_um, _estado_dois, _estado_tres, _fora
+from algoritmos.envoltoria import camadas_convexas, _expoente_reescala
+
+def _fora_do_estado(x: float, y: float, estado: tuple) -> bool:
+    """(x, y) está estritamente fora do círculo candidato (estado de eficiente._estado)?"""
+    cx, cy, _, r2_lo, r2_hi, definidores = estado
+    dx, dy = x - cx, y - cy
+    return dx * dx + dy * dy > r2_lo and (dx * dx + dy * dy > r2_hi or _fora(x, y, definidores))
+
+def _circulo_com_suporte(xs: list[float], ys: list[float], ativos: list[int],
+                         rng: random.Random) -> tuple[float, float, float, list[int]]:
+    """
+    Círculo mínimo dos pontos ativos (Welzl iterativo em três laços) e os índices dos
+    2 ou 3 pontos que o definem (suporte mínimo). Os testes de pertencimento são os
+    predicados robustos de eficiente.py (faixa do teste rápido e teste exato com _fora).
+    """
+    ordem = ativos[:]
+    rng.shuffle(ordem)
+    p0 = ordem[0]
+    estado = _estado_um(xs[p0], ys[p0])
+    suporte = [p0]
+    for i, p in enumerate(ordem):
+        if not _fora_do_estado(xs[p], ys[p], estado):
+            continue
+        estado = _estado_um(xs[p], ys[p])
+        suporte = [p]
+        for j in range(i):
+            q = ordem[j]
+            if not _fora_do_estado(xs[q], ys[q], estado):
+                continue
+            estado = _estado_dois(xs[p], ys[p], xs[q], ys[q])
+            suporte = [p, q]
+            for l in range(j):
+                s = ordem[l]
+                if not _fora_do_estado(xs[s], ys[s], estado):
+                    continue
+                estado = _estado_tres(xs[p], ys[p], xs[q], ys[q], xs[s], ys[s])
+                # Em trios colineares o círculo é o diâmetro do par mais distante
+                suporte = [t for t in (p, q, s) if (xs[t], ys[t]) in estado[5]]
+    cx, cy, r = estado[:3]
+    return cx, cy, r, suporte
+
+def _max_remocoes(pesos: np.ndarray, orcamento: float) -> int:
+    """Quantos pontos, no máximo, cabem no orçamento (somando os de menor peso)."""
+    return int(np.searchsorted(np.cumsum(np.sort(pesos)), orcamento, side='right'))
+
+def _excecoes(coordenadas: np.ndarray, pesos: np.ndarray, orcamento: float,
+              seed: int | None) -> tuple[Circulo, np.ndarray]:
+    """Busca comum aos dois resolvedores: círculo ótimo e índices dos pontos deixados de fora."""
+    n = len(coordenadas)
+    if n == 0 or _max_remocoes(pesos, orcamento) >= n:
+        return Circulo(Ponto(0.0, 0.0), 0.0), np.arange(n)
+
+    candidatos = np.concatenate(camadas_convexas(coordenadas, _max_remocoes(pesos, orcamento) + 1))
+    # Escalas extremas: as contas são feitas com as coordenadas multiplicadas por 2^-expoente,
+    # como em calcular_circulo_eficiente
+    expoente = _expoente_reescala(float(np.max(np.abs(coordenadas[candidatos]))))
+    xs = np.ldexp(coordenadas[candidatos, 0], -expoente).tolist()
+    ys = np.ldexp(coordenadas[candidatos, 1], -expoente).tolist()
+    pesos_candidatos = pesos[candidatos].tolist()
+    rng = random.Random(seed)
+
+    melhor = [math.inf, None, frozenset()]  # raio, (cx, cy), removidos
+    visitados = set()
+    pendentes = [(frozenset(), orcamento)]
+    while pendentes:
+        removidos, restante = pendentes.pop()
+        if removidos in visitados:
+            continue
+        visitados.add(removidos)
+        ativos = [i for i in range(len(candidatos)) if i not in removidos]
+        cx, cy, r, suporte = _circulo_com_suporte(xs, ys, ativos, rng)
+        if r < melhor[0]:
+            melhor = [r, (cx, cy), removidos]
+        if r == 0.0:
+            continue
+        for s in suporte:
+            if pesos_candidatos[s] <= restante:
+                pendentes.append((removidos | {s}, restante - pesos_candidatos[s]))
+
+    r, (cx, cy), removidos = melhor
+    excluidos = np.sort(candidatos[sorted(removidos)]) if removidos else np.empty(0, dtype=np.int64)
+    return Circulo(Ponto(math.ldexp(cx, expoente), math.ldexp(cy, expoente)), math.ldexp(r, expoente)), excluidos
+
+def circulo_k_excecoes(pontos, k: int = 1, seed: int | None = None) -> tuple[Circulo, np.ndarray]:
+    """
+    Menor círculo que contém todos os pontos exceto no máximo k, e os índices dos pontos excluídos.
+
+    Parâmetros
+    ----------
+    pontos : lista de Ponto, PontoArray ou array (n, 2) de float64
+    k : número máximo de pontos deixados de fora (pequeno: a busca faz até 3^k círculos)
+    seed : int opcional - para reprodutibilidade
+    """
+    if k < 0:
+        raise ValueError("k deve ser >= 0.")
+    coordenadas = como_coordenadas(pontos)
+    return _excecoes(coordenadas, np.ones(len(coordenadas)), float(k), seed)
+
+def calcular_circulo_k_excecoes(pontos, k: int = 1, seed: int | None = None) -> Circulo:
+    """Menor círculo que contém todos os pontos exceto no máximo k (ver circulo_k_excecoes)."""
+    return circulo_k_excecoes(pontos, k, seed)[0]
+
+def circulo_ponderado(pontos, pesos=None, orcamento: float = 1.0,
+                      seed: int | None = None) -> tuple[Circulo, np.ndarray]:
+    """
+    Menor círculo cujos pontos de fora somam peso no máximo orcamento, e os índices desses pontos.
+
+    Parâmetros
+    ----------
+    pontos : lista de Ponto, PontoArray ou array (n, 2) de float64
+    pesos : array (n,) de pesos positivos (confiança de cada ponto); None = todos com peso 1
+    orcamento : peso total que pode ficar de fora (com pesos 1, é o k de circulo_k_excecoes)
+    seed : int opcional - para reprodutibilidade
+    """
+    coordenadas = como_coordenadas(pontos)
+    pesos = np.ones(len(coordenadas)) if pesos is None else np.asarray(pesos, dtype=np.float64)
+    if pesos.shape != (len(coordenadas),):
+        raise ValueError("pesos deve ter um valor por ponto.")
+    if np.any(pesos <= 0):
+        raise ValueError("Os pesos devem ser positivos.")
+    if orcamento < 0:
+        raise ValueError("orcamento deve ser >= 0.")
+    return _excecoes(coordenadas, pesos, float(orcamento), seed)
+
+def calcular_circulo_ponderado(pontos, pesos=None, orcamento: float = 1.0, seed: int | None = None) -> Circulo:
+    """Menor círculo cujos pontos de fora somam peso no máximo orcamento (ver circulo_ponderado)."""
+    return circulo_ponderado(pontos, pesos, orcamento, seed)[0]
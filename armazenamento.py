@@ -0,0 +1,117 @@
+# Formato binário para os dados coletados.
+# O arquivo tem um cabeçalho JSON pequeno (configuração, tamanhos, raios) seguido das séries
+# de tempos em float64, uma matriz (tamanhos x medições) por série. A leitura usa np.memmap,
+# então os tempos não são copiados nem convertidos para listas Python.
+#
+# Layout:
+#   8 bytes  : assinatura b"CMINBIN1"
+#   8 bytes  : tamanho do cabeçalho (uint64 little-endian), múltiplo de 8
+#   cabeçalho: JSON UTF-8 completado com espaços
+#   dados    : float64 little-endian; linhas com menos medições são completadas com NaN
+
+import json
+import struct
+import sys
+import numpy as np
+
+_ASSINATURA = b"CMINBIN1"
+
+def eh_arquivo_binario(arquivo):
+    """Diz se o arquivo começa com a assinatura do formato binário."""
+    try:
+        with open(arquivo, 'rb') as f:
+            return f.read(len(_ASSINATURA)) == _ASSINATURA
+    except OSError:
+        return False
+
+def salvar_dados_binario(dados, arquivo):
+    """
+    Salva os dados (mesma estrutura do dados.json) no formato binário.
+    Campos de cada resultado que são listas viram séries float64; os demais vão no cabeçalho.
+    """
+    resultados = dados["resultados"]
+    nomes_series = []
+    nomes_escalares = []
+    for resultado in resultados:
+        for chave, valor in resultado.items():
+            if chave == "num_pontos":
+                continue
+            destino = nomes_series if isinstance(valor, (list, np.ndarray)) else nomes_escalares
+            if chave not in destino:
+                destino.append(chave)
+
+    series = {}
+    posicao = 0
+    for nome in nomes_series:
+        contagens = [len(r.get(nome, ())) for r in resultados]
+        colunas = max(contagens, default=0)
+        series[nome] = {"posicao": posicao, "colunas": colunas, "contagens": contagens}
+        posicao += len(resultados) * colunas
+
+    cabecalho = {
+        "configuracao": dados["configuracao"],
+        "num_pontos": [r["num_pontos"] for r in resultados],
+        "escalares": {nome: [r.get(nome) for r in resultados] for nome in nomes_escalares},
+        "series": series
+    }
+    texto = json.dumps(cabecalho, ensure_ascii=False).encode('utf-8')
+    texto += b" " * (-len(texto) % 8)
+
+    with open(arquivo, 'wb') as f:
+        f.write(_ASSINATURA)
+        f.write(struct.pack("<Q", len(texto)))
+        f.write(texto)
+        for nome in nomes_series:
+            matriz = np.full((len(resultados), series[nome]["colunas"]), np.nan, dtype='<f8')
+            for i, r in enumerate(resultados):
+                valores = r.get(nome, ())
+                matriz[i, :len(valores)] = valores
+            f.write(matriz.tobytes())
+
+def carregar_dados_binario(arquivo):
+    """
+    Carrega um arquivo binário na mesma estrutura do dados.json.
+    As séries de cada resultado são views (sem cópia) de matrizes np.memmap, e as matrizes
+    completas (tamanhos x medições, com NaN onde não há medição) ficam em dados["matrizes"].
+    """
+    with open(arquivo, 'rb') as f:
+        if f.read(len(_ASSINATURA)) != _ASSINATURA:
+            raise ValueError(f"{arquivo} não está no formato binário de dados.")
+        (tamanho_cabecalho,) = struct.unpack("<Q", f.read(8))
+        cabecalho = json.loads(f.read(tamanho_cabecalho).decode('utf-8'))
+    inicio_dados = len(_ASSINATURA) + 8 + tamanho_cabecalho
+
+    num_pontos = cabecalho["num_pontos"]
+    matrizes = {}
+    for nome, serie in cabecalho["series"].items():
+        forma = (len(num_pontos), serie["colunas"])
+        if forma[0] * forma[1] == 0:
+            matrizes[nome] = np.empty(forma, dtype='<f8')
+            continue
+        matrizes[nome] = np.memmap(arquivo, dtype='<f8', mode='r',
+                                   offset=inicio_dados + 8 * serie["posicao"], shape=forma)
+
+    resultados = []
+    for i, n in enumerate(num_pontos):
+        resultado = {"num_pontos": n}
+        for nome, serie in cabecalho["series"].items():
+            resultado[nome] = matrizes[nome][i, :serie["contagens"][i]]
+        for nome, valores in cabecalho["escalares"].items():
+            if valores[i] is not None:
+                resultado[nome] = valores[i]
+        resultados.append(resultado)
+
+    return {"configuracao": cabecalho["configuracao"], "resultados": resultados, "matrizes": matrizes}
+
+def converter_json_para_binario(arquivo_json, arquivo_binario):
+    """Converte um dados.json existente para o formato binário."""
+    with open(arquivo_json, 'r', encoding='utf-8') as f:
+        dados = json.load(f)
+    salvar_dados_binario(dados, arquivo_binario)
+    return arquivo_binario
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Uso: python armazenamento.py dados.json dados.bin")
+        sys.exit(1)
+    print(f"Dados convertidos para: {converter_json_para_binario(sys.argv[1], sys.argv[2])}")
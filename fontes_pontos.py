@@ -0,0 +1,99 @@
+# Fontes de pontos vetorizadas (NumPy) para alimentar os algoritmos.
+# Distribuições: gaussiana, uniforme, anel e aglomerados, todas recortadas a um retângulo.
+# A rejeição (pontos fora dos limites) é feita em lote: os candidatos são sorteados em blocos de
+# tamanho fixo e só os que caem dentro do retângulo são aproveitados.
+# Como os blocos de candidatos não dependem do tamanho pedido, a mesma seed gera sempre a mesma
+# sequência de pontos, seja tudo de uma vez (gerar_pontos) ou em pedaços (gerar_blocos).
+
+import numpy as np
+
+_CANDIDATOS_POR_LOTE = 65536  # candidatos sorteados por vez na rejeição
+
+def _sortear_gaussiana(rng, m, sigma=0.1, centro=(0.0, 0.0)):
+    """Candidatos de uma normal 2D isotrópica."""
+    return rng.normal(centro, sigma, size=(m, 2))
+
+def _sortear_uniforme(rng, m, limites):
+    """Candidatos uniformes no retângulo (nunca são rejeitados)."""
+    x_min, x_max, y_min, y_max = limites
+    return rng.uniform((x_min, y_min), (x_max, y_max), size=(m, 2))
+
+def _sortear_anel(rng, m, raio=0.5, largura=0.05, centro=(0.0, 0.0)):
+    """Candidatos em um anel: ângulo uniforme e raio normal em torno de raio."""
+    angulos = rng.uniform(0.0, 2 * np.pi, m)
+    raios = rng.normal(raio, largura, m)
+    return np.column_stack((centro[0] + raios * np.cos(angulos), centro[1] + raios * np.sin(angulos)))
+
+def _sortear_aglomerados(rng, m, centros, sigma=0.05):
+    """Candidatos de uma mistura de normais com os centros dados (mesmo peso para todos)."""
+    escolhidos = rng.integers(0, len(centros), m)
+    return centros[escolhidos] + rng.normal(0.0, sigma, size=(m, 2))
+
+DISTRIBUICOES = ("gaussiana", "uniforme", "anel", "aglomerados")
+
+def _sorteador(distribuicao, rng, limites, parametros):
+    """Função m -> candidatos (m, 2) da distribuição pedida."""
+    if distribuicao == "gaussiana":
+        return lambda m: _sortear_gaussiana(rng, m, **parametros)
+    if distribuicao == "uniforme":
+        return lambda m: _sortear_uniforme(rng, m, limites)
+    if distribuicao == "anel":
+        return lambda m: _sortear_anel(rng, m, **parametros)
+    if distribuicao == "aglomerados":
+        parametros = dict(parametros)
+        num_aglomerados = parametros.pop("num_aglomerados", 5)
+        # Os centros dos aglomerados são sorteados uma vez, ocupando o miolo do retângulo
+        x_min, x_max, y_min, y_max = limites
+        meio = ((x_min + x_max) / 2, (y_min + y_max) / 2)
+        meia_largura = ((x_max - x_min) / 4, (y_max - y_min) / 4)
+        centros = rng.uniform(np.subtract(meio, meia_largura), np.add(meio, meia_largura), size=(num_aglomerados, 2))
+        return lambda m: _sortear_aglomerados(rng, m, centros, **parametros)
+    raise ValueError(f"Distribuição desconhecida: {distribuicao!r}. Use uma de {DISTRIBUICOES}.")
+
+def gerar_blocos(distribuicao="gaussiana", n=None, tamanho_bloco=65536, seed=None,
+                 limites=(-1, 1, -1, 1), **parametros):
+    """
+    Gera pontos em blocos (arrays (m, 2) de float64, com m <= tamanho_bloco).
+
+    Parâmetros
+    ----------
+    distribuicao : "gaussiana" (sigma, centro), "uniforme", "anel" (raio, largura, centro)
+                   ou "aglomerados" (num_aglomerados, sigma)
+    n : total de pontos; None gera indefinidamente (entradas maiores que a memória)
+    tamanho_bloco : pontos por bloco entregue
+    seed : int opcional - para reprodutibilidade
+    limites : (x_min, x_max, y_min, y_max); candidatos fora do retângulo são rejeitados
+    """
+    rng = np.random.default_rng(seed)
+    sortear = _sorteador(distribuicao, rng, limites, parametros)
+    x_min, x_max, y_min, y_max = limites
+
+    pendentes = np.empty((0, 2))  # aceitos que sobraram do bloco anterior
+    entregues = 0
+    while n is None or entregues < n:
+        m = tamanho_bloco if n is None else min(tamanho_bloco, n - entregues)
+        # Os lotes aceitos são juntados uma única vez por bloco (concatenar a cada lote seria
+        # quadrático no tamanho do bloco)
+        partes = [pendentes]
+        disponiveis = len(pendentes)
+        while disponiveis < m:
+            candidatos = sortear(_CANDIDATOS_POR_LOTE)
+            x, y = candidatos[:, 0], candidatos[:, 1]
+            dentro = (x_min <= x) & (x <= x_max) & (y_min <= y) & (y <= y_max)
+            partes.append(candidatos[dentro])
+            disponiveis += len(partes[-1])
+        if len(partes) > 1:
+            pendentes = np.concatenate(partes)
+        bloco, pendentes = pendentes[:m], pendentes[m:]
+        entregues += m
+        yield bloco
+
+def gerar_pontos(distribuicao="gaussiana", n=100, seed=None, limites=(-1, 1, -1, 1), **parametros):
+    """
+    Gera n pontos de uma vez, como array (n, 2) de float64.
+    Para a mesma seed, é igual à concatenação dos blocos de gerar_blocos.
+    """
+    if n == 0:
+        return np.empty((0, 2))
+    # Com tamanho_bloco = n há um único bloco, entregue sem mais uma cópia
+    return next(gerar_blocos(distribuicao, n, tamanho_bloco=n, seed=seed, limites=limites, **parametros))
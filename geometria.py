@@ -2,12 +2,19 @@
 # estou assumindo que as operações serão feitas em um plano 2D
 
 import math
+import numpy as np
 
 class Ponto:
-    """Ponto 2D com coordenadas x e y."""
+    """
+    Ponto 2D com coordenadas x e y.
+    Imutável e compacto (__slots__, sem __dict__); igualdade e hash pelas coordenadas,
+    então pode ser usado como chave de dicionário ou em caches.
+    """
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
+        _atribuir_x(self, x)
+        _atribuir_y(self, y)
 
     def distancia(self, outro_ponto):
         """Calcula a distância entre o ponto corrente e um outro ponto."""
@@ -15,11 +22,64 @@ class Ponto:
         dy = self.y - outro_ponto.y
         return math.sqrt(dx**2 + dy**2)
 
+    def __setattr__(self, nome, valor):
+        raise AttributeError("Ponto é imutável.")
+
+    def __delattr__(self, nome):
+        raise AttributeError("Ponto é imutável.")
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def __eq__(self, outro):
+        if not isinstance(outro, Ponto):
+            return NotImplemented
+        return self.x == outro.x and self.y == outro.y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+    def __repr__(self):
+        return f"Ponto(x={self.x!r}, y={self.y!r})"
+
+    def __reduce__(self):
+        return (Ponto, (self.x, self.y))
+
+# Os atributos são gravados direto pelos descritores dos slots (mais rápido que object.__setattr__)
+_atribuir_x = Ponto.x.__set__
+_atribuir_y = Ponto.y.__set__
+
 class Circulo:
-    """Círculo com um centro (Ponto) e um raio."""
+    """
+    Círculo com um centro (Ponto) e um raio.
+    Imutável e compacto como o Ponto; igualdade e hash pelo centro e pelo raio.
+    """
+    __slots__ = ("centro", "raio")
+
     def __init__(self, centro: Ponto, raio: float):
-        self.centro = centro
-        self.raio = raio
+        _atribuir_centro(self, centro)
+        _atribuir_raio(self, raio)
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError("Circulo é imutável.")
+
+    def __delattr__(self, nome):
+        raise AttributeError("Circulo é imutável.")
+
+    def __eq__(self, outro):
+        if not isinstance(outro, Circulo):
+            return NotImplemented
+        return self.centro == outro.centro and self.raio == outro.raio
+
+    def __hash__(self):
+        return hash((self.centro, self.raio))
+
+    def __repr__(self):
+        return f"Circulo(centro={self.centro!r}, raio={self.raio!r})"
+
+    def __reduce__(self):
+        return (Circulo, (self.centro, self.raio))
 
     def contem(self, ponto: Ponto, tolerancia=1e-6) -> bool:
         """
@@ -27,4 +87,70 @@ class Circulo:
         Mede a distância até o centro e compara com o raio (com uma tolerância para evitar erro de cálculo). 
         Se estiver perto o suficiente, retorna True; senão, False.
         """
-        return self.centro.distancia(ponto) <= self.raio + tolerancia
\ No newline at end of file
+        return self.centro.distancia(ponto) <= self.raio + tolerancia
+
+    def contem_muitos(self, pontos, tolerancia=1e-6) -> np.ndarray:
+        """
+        Versão vetorizada de contem: máscara booleana dos pontos (lista de Ponto, PontoArray ou
+        array (n, 2)) que estão dentro ou em cima do círculo.
+        Compara distâncias ao quadrado (d² <= (raio + tolerância)²), sem raiz quadrada.
+        """
+        coordenadas = como_coordenadas(pontos)
+        dx = coordenadas[:, 0] - self.centro.x
+        dy = coordenadas[:, 1] - self.centro.y
+        limite = self.raio + tolerancia
+        return dx * dx + dy * dy <= limite * limite
+
+_atribuir_centro = Circulo.centro.__set__
+_atribuir_raio = Circulo.raio.__set__
+
+class PontoArray:
+    """
+    Conjunto compacto de pontos 2D guardado em um único array (n, 2) de float64.
+    Evita criar um objeto Ponto por ponto quando o conjunto é grande.
+    """
+    def __init__(self, coordenadas):
+        coordenadas = np.ascontiguousarray(coordenadas, dtype=np.float64)
+        if coordenadas.ndim != 2 or coordenadas.shape[1] != 2:
+            raise ValueError("As coordenadas devem ter formato (n, 2).")
+        self.coordenadas = coordenadas
+
+    @classmethod
+    def de_pontos(cls, pontos: list[Ponto]) -> "PontoArray":
+        """Cria o conjunto a partir de uma lista de Ponto."""
+        coordenadas = np.empty((len(pontos), 2), dtype=np.float64)
+        coordenadas[:, 0] = [p.x for p in pontos]
+        coordenadas[:, 1] = [p.y for p in pontos]
+        return cls(coordenadas)
+
+    @property
+    def x(self) -> np.ndarray:
+        """Coordenadas x (view, sem cópia)."""
+        return self.coordenadas[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Coordenadas y (view, sem cópia)."""
+        return self.coordenadas[:, 1]
+
+    def __len__(self):
+        return self.coordenadas.shape[0]
+
+    def __getitem__(self, i) -> Ponto:
+        x, y = self.coordenadas[i]
+        return Ponto(float(x), float(y))
+
+    def __iter__(self):
+        for x, y in self.coordenadas.tolist():
+            yield Ponto(x, y)
+
+def como_coordenadas(pontos) -> np.ndarray:
+    """
+    Converte uma lista de Ponto, um PontoArray ou um array (n, 2) para um array (n, 2) de float64.
+    Arrays que já estão no formato certo são devolvidos sem cópia.
+    """
+    if isinstance(pontos, PontoArray):
+        return pontos.coordenadas
+    if isinstance(pontos, np.ndarray):
+        return PontoArray(pontos).coordenadas
+    return PontoArray.de_pontos(pontos).coordenadas
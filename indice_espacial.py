@@ -0,0 +1,125 @@
+# Índice espacial (grade uniforme) para consultas em lote do tipo "quais círculos contêm este ponto".
+# Cada círculo é registrado em todas as células da grade que a sua caixa envolvente toca.
+# Na consulta, cada ponto só é testado contra os círculos registrados na célula onde ele cai.
+# Construção e consulta são vetorizadas com NumPy (formato CSR: células -> lista de círculos).
+
+import numpy as np
+from geometria import Circulo, como_coordenadas
+
+_CELULAS_POR_CIRCULO = 4  # limite do tamanho da grade em relação ao número de círculos
+_PONTOS_POR_LOTE = 65536  # pontos consultados por vez (limita a memória dos pares candidatos)
+
+class IndiceCirculos:
+    """
+    Grade uniforme sobre um conjunto de círculos, para testes de pertencimento em lote.
+
+    Parâmetros
+    ----------
+    centros : array (m, 2) com os centros
+    raios : array (m,) com os raios
+    tolerancia : mesma tolerância de Circulo.contem (d² <= (raio + tolerância)²)
+    """
+    def __init__(self, centros, raios, tolerancia=1e-6):
+        self.centros = np.ascontiguousarray(centros, dtype=np.float64).reshape(-1, 2)
+        self.raios = np.ascontiguousarray(raios, dtype=np.float64).reshape(-1)
+        if len(self.centros) != len(self.raios):
+            raise ValueError("centros e raios devem ter o mesmo número de círculos.")
+        self.tolerancia = tolerancia
+        self._limites2 = (self.raios + tolerancia) ** 2
+        self._construir()
+
+    @classmethod
+    def de_circulos(cls, circulos: list[Circulo], tolerancia=1e-6) -> "IndiceCirculos":
+        """Cria o índice a partir de uma lista de Circulo."""
+        centros = np.array([(c.centro.x, c.centro.y) for c in circulos], dtype=np.float64)
+        raios = np.array([c.raio for c in circulos], dtype=np.float64)
+        return cls(centros, raios, tolerancia)
+
+    def __len__(self):
+        return len(self.raios)
+
+    def _construir(self):
+        """Escolhe o tamanho das células e registra cada círculo nas células que ele toca."""
+        m = len(self.raios)
+        alcance = self.raios + self.tolerancia
+        if m == 0:
+            self._origem = np.zeros(2)
+            self._lado = 1.0
+            self._dimensoes = (0, 0)
+            self._inicios = np.zeros(1, dtype=np.int64)
+            self._circulos = np.empty(0, dtype=np.int64)
+            return
+
+        minimo = (self.centros - alcance[:, None]).min(axis=0)
+        maximo = (self.centros + alcance[:, None]).max(axis=0)
+        extensao = np.maximum(maximo - minimo, np.finfo(np.float64).tiny)
+
+        # Células do tamanho de um círculo típico, sem passar de _CELULAS_POR_CIRCULO * m células
+        lado = max(2.0 * float(np.median(alcance)), float(np.sqrt(extensao[0] * extensao[1] / (_CELULAS_POR_CIRCULO * m))))
+        lado = max(lado, float(extensao.max()) * 1e-9)
+        dimensoes = np.maximum(np.ceil(extensao / lado).astype(np.int64), 1)
+
+        primeira = np.clip(((self.centros - alcance[:, None] - minimo) // lado).astype(np.int64), 0, dimensoes - 1)
+        ultima = np.clip(((self.centros + alcance[:, None] - minimo) // lado).astype(np.int64), 0, dimensoes - 1)
+        largura = ultima - primeira + 1
+        quantidades = largura[:, 0] * largura[:, 1]
+
+        # Expande cada círculo nas suas células: (círculo, posição k dentro da caixa de células)
+        circulos = np.repeat(np.arange(m), quantidades)
+        k = np.arange(len(circulos)) - np.repeat(np.cumsum(quantidades) - quantidades, quantidades)
+        ix = primeira[circulos, 0] + k % largura[circulos, 0]
+        iy = primeira[circulos, 1] + k // largura[circulos, 0]
+        celulas = iy * dimensoes[0] + ix
+
+        ordem = np.argsort(celulas, kind='stable')
+        contagens = np.bincount(celulas, minlength=int(dimensoes[0] * dimensoes[1]))
+        self._origem = minimo
+        self._lado = lado
+        self._dimensoes = (int(dimensoes[0]), int(dimensoes[1]))
+        self._inicios = np.concatenate(([0], np.cumsum(contagens)))
+        self._circulos = circulos[ordem]
+
+    def _pares_lote(self, coordenadas: np.ndarray, deslocamento: int) -> tuple[np.ndarray, np.ndarray]:
+        """Pares (ponto, círculo) com o ponto dentro do círculo, para um lote de pontos."""
+        nx, ny = self._dimensoes
+        celula = np.floor((coordenadas - self._origem) / self._lado)
+        na_grade = (celula[:, 0] >= 0) & (celula[:, 0] < nx) & (celula[:, 1] >= 0) & (celula[:, 1] < ny)
+        pontos = np.flatnonzero(na_grade)
+        celula = celula[pontos].astype(np.int64)
+        celula = celula[:, 1] * nx + celula[:, 0]
+
+        inicio = self._inicios[celula]
+        quantidades = self._inicios[celula + 1] - inicio
+        pontos = np.repeat(pontos, quantidades)
+        k = np.arange(len(pontos)) - np.repeat(np.cumsum(quantidades) - quantidades, quantidades)
+        circulos = self._circulos[np.repeat(inicio, quantidades) + k]
+
+        dx = coordenadas[pontos, 0] - self.centros[circulos, 0]
+        dy = coordenadas[pontos, 1] - self.centros[circulos, 1]
+        dentro = dx * dx + dy * dy <= self._limites2[circulos]
+        return pontos[dentro] + deslocamento, circulos[dentro]
+
+    def consultar(self, pontos) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Todos os pares (ponto, círculo) em que o ponto está dentro ou em cima do círculo.
+
+        Retorna
+        -------
+        (indices_pontos, indices_circulos) : arrays de mesmo tamanho, ordenados por ponto.
+        """
+        coordenadas = como_coordenadas(pontos)
+        if len(self) == 0 or len(coordenadas) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        partes = [self._pares_lote(coordenadas[i:i + _PONTOS_POR_LOTE], i)
+                  for i in range(0, len(coordenadas), _PONTOS_POR_LOTE)]
+        return np.concatenate([p for p, _ in partes]), np.concatenate([c for _, c in partes])
+
+    def contar(self, pontos) -> np.ndarray:
+        """Quantos círculos contêm cada ponto (array (n,) de inteiros)."""
+        coordenadas = como_coordenadas(pontos)
+        indices_pontos, _ = self.consultar(coordenadas)
+        return np.bincount(indices_pontos, minlength=len(coordenadas))
+
+    def contidos(self, pontos) -> np.ndarray:
+        """Máscara dos pontos que estão dentro de pelo menos um círculo."""
+        return self.contar(pontos) > 0
@@ -0,0 +1,122 @@
+# Leitura de arquivos de pontos grandes (maiores que a memória) por mapeamento em memória.
+# Formatos aceitos:
+#   .npy  : array (n, 2) de float64 em ordem C (o formato é reconhecido pela assinatura do NumPy)
+#   bruto : pares x, y de float64 (little-endian por padrão) gravados em sequência, sem cabeçalho
+# ler_blocos mapeia uma janela do arquivo por vez (np.memmap com offset): cada bloco entregue é
+# uma view dos bytes do arquivo, sem cópia, e a janela é desfeita quando o bloco deixa de ser
+# usado, então o RSS fica limitado pelo tamanho do bloco e não pelo tamanho do arquivo.
+# Os blocos alimentam o heurístico em fluxo (CirculoStream) e o eficiente com pré-filtro: a
+# envoltória convexa é acumulada bloco a bloco e só os seus vértices chegam ao algoritmo exato.
+
+import os
+import numpy as np
+from geometria import Circulo
+from fontes_pontos import gerar_blocos
+from algoritmos.eficiente import calcular_circulo_eficiente
+from algoritmos.envoltoria import prefiltrar_envoltoria
+from algoritmos.heuristico import CirculoStream
+
+_ASSINATURA_NPY = b"\x93NUMPY"
+
+def _descrever_arquivo(arquivo, dtype='<f8') -> tuple[int, int, np.dtype]:
+    """(num_pontos, offset dos dados em bytes, dtype) de um arquivo .npy ou bruto."""
+    with open(arquivo, 'rb') as f:
+        eh_npy = f.read(len(_ASSINATURA_NPY)) == _ASSINATURA_NPY
+    if eh_npy:
+        mapa = np.load(arquivo, mmap_mode='r')
+        if mapa.ndim != 2 or mapa.shape[1] != 2 or mapa.dtype.kind != 'f' or mapa.dtype.itemsize != 8:
+            raise ValueError(f"{arquivo}: esperado array (n, 2) de float64, encontrado {mapa.shape} {mapa.dtype}.")
+        if mapa.shape[0] > 1 and not mapa.flags.c_contiguous:
+            raise ValueError(f"{arquivo}: o array precisa estar em ordem C (fortran_order=False).")
+        return mapa.shape[0], mapa.offset, mapa.dtype
+
+    dtype = np.dtype(dtype)
+    tamanho = os.path.getsize(arquivo)
+    if dtype.kind != 'f' or dtype.itemsize != 8:
+        raise ValueError(f"dtype deve ser float64 (com qualquer ordem de bytes), recebido {dtype}.")
+    if tamanho % (2 * dtype.itemsize):
+        raise ValueError(f"{arquivo}: {tamanho} bytes não é um número inteiro de pares float64.")
+    return tamanho // (2 * dtype.itemsize), 0, dtype
+
+def contar_pontos(arquivo, dtype='<f8') -> int:
+    """Número de pontos de um arquivo .npy ou bruto (só lê o cabeçalho/tamanho)."""
+    return _descrever_arquivo(arquivo, dtype)[0]
+
+def mapear_pontos(arquivo, dtype='<f8') -> np.ndarray:
+    """
+    O arquivo inteiro como array (n, 2) mapeado em memória (somente leitura, sem cópia).
+    As páginas lidas continuam contando no RSS enquanto o mapa existir; para percorrer
+    arquivos grandes com memória limitada, use ler_blocos.
+    """
+    n, offset, dtype = _descrever_arquivo(arquivo, dtype)
+    if n == 0:
+        return np.empty((0, 2), dtype=dtype)
+    return np.memmap(arquivo, dtype=dtype, mode='r', offset=offset, shape=(n, 2))
+
+def ler_blocos(arquivo, tamanho_bloco: int = 1 << 20, dtype='<f8'):
+    """
+    Percorre o arquivo em blocos (arrays (m, 2), m <= tamanho_bloco), cada um mapeado
+    separadamente. Não guarde referências aos blocos se a memória importa: a janela de cada
+    bloco só é desfeita quando ele deixa de ser usado.
+    """
+    n, offset, dtype = _descrever_arquivo(arquivo, dtype)
+    for inicio in range(0, n, tamanho_bloco):
+        m = min(tamanho_bloco, n - inicio)
+        bloco = np.memmap(arquivo, dtype=dtype, mode='r', offset=offset + inicio * 2 * dtype.itemsize,
+                          shape=(m, 2))
+        yield bloco
+        del bloco
+
+def envoltoria_arquivo(arquivo, tamanho_bloco: int = 1 << 20, dtype='<f8') -> np.ndarray:
+    """
+    Vértices da envoltória convexa de todos os pontos do arquivo, acumulada bloco a bloco:
+    a envoltória de cada bloco é juntada à acumulada e reduzida de novo aos vértices.
+    Mesmo array (mesmos vértices, mesma ordem) que prefiltrar_envoltoria do arquivo inteiro.
+    """
+    vertices = np.empty((0, 2))
+    for bloco in ler_blocos(arquivo, tamanho_bloco, dtype):
+        vertices_bloco, _ = prefiltrar_envoltoria(bloco)
+        vertices, _ = prefiltrar_envoltoria(np.concatenate((vertices, vertices_bloco)))
+    return vertices
+
+def circulo_eficiente_arquivo(arquivo, seed: int | None = None, tamanho_bloco: int = 1 << 20,
+                              dtype='<f8') -> Circulo:
+    """
+    Círculo mínimo exato dos pontos do arquivo, com memória limitada pelo bloco e pela envoltória.
+    Igual a calcular_circulo_eficiente(mapear_pontos(arquivo), seed, prefiltro=True).
+    """
+    vertices = envoltoria_arquivo(arquivo, tamanho_bloco, dtype)
+    if len(vertices) == 0:
+        raise ValueError(f"{arquivo}: o arquivo não tem pontos.")
+    return calcular_circulo_eficiente(vertices, seed=seed, prefiltro=True)
+
+def circulo_heuristico_arquivo(arquivo, num_direcoes: int = 0, tamanho_bloco: int = 1 << 20,
+                               dtype='<f8') -> Circulo:
+    """
+    Círculo envolvente heurístico dos pontos do arquivo, pelo CirculoStream (estado O(1)).
+    Com num_direcoes >= 3, o círculo é refinado pelos extremos no final (ver CirculoStream).
+    """
+    fluxo = CirculoStream(num_direcoes=num_direcoes)
+    for bloco in ler_blocos(arquivo, tamanho_bloco, dtype):
+        fluxo.update(bloco)
+    if fluxo.circulo is None:
+        raise ValueError(f"{arquivo}: o arquivo não tem pontos.")
+    return fluxo.refinar() if num_direcoes else fluxo.circulo
+
+def gravar_pontos_brutos(arquivo, blocos) -> int:
+    """
+    Grava blocos (arrays (m, 2)) no formato bruto (float64 little-endian), um de cada vez.
+    Retorna o número de pontos gravados.
+    """
+    total = 0
+    with open(arquivo, 'wb') as f:
+        for bloco in blocos:
+            np.ascontiguousarray(bloco, dtype='<f8').tofile(f)
+            total += len(bloco)
+    return total
+
+def gerar_arquivo_pontos(arquivo, n: int, distribuicao: str = "gaussiana", seed: int | None = None,
+                         tamanho_bloco: int = 1 << 20, **parametros) -> int:
+    """Gera n pontos (fontes_pontos.gerar_blocos) direto para um arquivo bruto, bloco a bloco."""
+    return gravar_pontos_brutos(arquivo, gerar_blocos(distribuicao, n, tamanho_bloco=tamanho_bloco,
+                                                      seed=seed, **parametros))
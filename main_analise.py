@@ -1,13 +1,24 @@
+import hashlib
 import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 from datetime import datetime
+from armazenamento import eh_arquivo_binario, carregar_dados_binario
+from algoritmos.registro import descrever_algoritmo
 
 def carregar_dados(arquivo_json="dados.json"):
     """
-    Carrega os dados do arquivo JSON.
+    Carrega os dados do arquivo JSON (ou do formato binário de armazenamento.py,
+    lido com memmap e sem cópia dos tempos).
     """
     try:
+        if eh_arquivo_binario(arquivo_json):
+            return carregar_dados_binario(arquivo_json)
         with open(arquivo_json, 'r', encoding='utf-8') as f:
             return json.load(f)
     except FileNotFoundError:
@@ -23,341 +34,560 @@ def calcular_complexidade_estimada(numeros_pontos, tempos):
     if len(numeros_pontos) < 2:
         return None
     
-    # Converte para logaritmos
-    log_n = np.log(numeros_pontos)
-    log_t = np.log(tempos)
-    
-    # Regressão linear
-    coeffs = np.polyfit(log_n, log_t, 1)
-    estimativa = coeffs[0]  # Coeficiente angular = potência estimada
-    
-    return estimativa
+    # Coeficiente angular = potência estimada
+    estimativa, _ = ajustar_loglog(numeros_pontos, np.asarray(tempos, dtype=float))
+    return float(estimativa)
+
+def _algoritmos_dos_dados(dados):
+    """
+    Nomes dos algoritmos presentes nos dados (chaves "tempos_<nome>"), na ordem em que aparecem.
+    As chaves "tempos_cpu_<nome>" (tempo de CPU da medição adaptativa) não contam como algoritmo.
+    """
+    algoritmos = []
+    for resultado in dados["resultados"]:
+        for chave in resultado:
+            if chave.startswith("tempos_cpu_"):
+                continue
+            if chave.startswith("tempos_") and chave[len("tempos_"):] not in algoritmos:
+                algoritmos.append(chave[len("tempos_"):])
+    return algoritmos
+
+def montar_matriz_tempos(dados, algoritmos, prefixo="tempos_"):
+    """
+    Monta o array (tamanhos x algoritmos x medições) dos tempos, com NaN onde não há medição
+    (a medição adaptativa gera números de amostras diferentes por tamanho e algoritmo).
+    Com dados binários, as linhas vêm direto das matrizes memmap.
+    prefixo="tempos_cpu_" monta o array dos tempos de CPU.
+    """
+    resultados = dados["resultados"]
+    matrizes = dados.get("matrizes", {})
+    colunas = max((len(r.get(f"{prefixo}{nome}", ())) for r in resultados for nome in algoritmos), default=0)
+    tempos = np.full((len(resultados), len(algoritmos), colunas), np.nan)
+    for j, nome in enumerate(algoritmos):
+        chave = f"{prefixo}{nome}"
+        if chave in matrizes:
+            tempos[:, j, :matrizes[chave].shape[1]] = matrizes[chave]
+            continue
+        for i, resultado in enumerate(resultados):
+            valores = resultado.get(chave, ())
+            tempos[i, j, :len(valores)] = valores
+    return tempos
+
+def ajustar_loglog(numeros_pontos, valores):
+    """
+    Regressão linear log(valor) = a·log(n) + b para várias séries de uma vez.
+    valores tem forma (..., tamanhos); retorna (a, b) com forma (...,).
+    O coeficiente a é a complexidade estimada (ex: 1.0 para O(n)).
+    """
+    log_n = np.log(np.asarray(numeros_pontos, dtype=float))
+    log_v = np.log(valores)
+    x = log_n - log_n.mean()
+    a = (log_v * x).sum(axis=-1) / (x * x).sum()
+    b = log_v.mean(axis=-1) - a * log_n.mean()
+    return a, b
+
+def _bootstrap_expoentes(numeros_pontos, tempos, num_amostras=1000, lote=100, seed=0):
+    """
+    Intervalo de confiança (95%) do expoente de complexidade de cada algoritmo por bootstrap:
+    reamostra as medições de cada tamanho, recalcula as médias e refaz o ajuste log-log.
+    tempos tem forma (tamanhos x algoritmos x medições) com NaN nas posições vazias.
+    """
+    rng = np.random.default_rng(seed)
+    # As medições válidas ocupam o começo de cada linha (o NaN de preenchimento fica no fim)
+    contagens = np.sum(~np.isnan(tempos), axis=2)                      # (S, A)
+    expoentes = []
+    for inicio in range(0, num_amostras, lote):
+        b = min(lote, num_amostras - inicio)
+        sorteio = rng.random((b,) + tempos.shape)                      # (B, S, A, M)
+        indices = (sorteio * contagens[None, :, :, None]).astype(np.int64)
+        amostras = np.take_along_axis(tempos[None], indices, axis=3)
+        medias = amostras.mean(axis=3)                                 # (B, S, A)
+        a, _ = ajustar_loglog(numeros_pontos, np.moveaxis(medias, 1, -1))
+        expoentes.append(a)
+    expoentes = np.concatenate(expoentes)                              # (num_amostras, A)
+    return np.percentile(expoentes, [2.5, 97.5], axis=0).T             # (A, 2)
+
+# Medidas de memória do dados.json (chaves "memoria_<medida>_<nome>", ver medicao.medir_memoria)
+MEDIDAS_MEMORIA = {
+    "pico": "Pico do tracemalloc",
+    "rss": "Pico de RSS",
+    "blocos": "Blocos retidos"
+}
+
+def _memoria(dados, algoritmos):
+    """
+    Medidas de memória (algoritmos x tamanhos) de cada tipo presente nos dados, com NaN onde
+    não há medida (ou onde o pico de RSS não pôde ser medido). None se os dados não têm memória.
+    """
+    resultados = dados["resultados"]
+    memoria = {}
+    for medida in MEDIDAS_MEMORIA:
+        chaves = [f"memoria_{medida}_{nome}" for nome in algoritmos]
+        if any(chave in r for r in resultados for chave in chaves):
+            memoria[medida] = np.array([[np.nan if r.get(chave) is None else r[chave] for r in resultados]
+                                        for chave in chaves], dtype=float).reshape(len(algoritmos), len(resultados))
+    return memoria or None
+
+def _ajustar_positivos(numeros_pontos, valores):
+    """
+    Ajuste log-log de cada linha de valores (séries x tamanhos) usando só os valores positivos
+    (o pico de RSS pode ser 0 quando a chamada reaproveita memória já reservada).
+    Retorna (expoentes, interceptos), com NaN nas séries com menos de dois valores positivos.
+    """
+    numeros_pontos = np.asarray(numeros_pontos, dtype=float)
+    expoentes = np.full(len(valores), np.nan)
+    interceptos = np.full(len(valores), np.nan)
+    for j, linha in enumerate(valores):
+        validos = linha > 0
+        if validos.sum() >= 2:
+            expoentes[j], interceptos[j] = ajustar_loglog(numeros_pontos[validos], linha[validos])
+    return expoentes, interceptos
+
+def _correlacao_postos(a, b):
+    """Correlação de Spearman (Pearson sobre os postos) entre duas séries; NaN se uma for constante."""
+    if len(a) < 2 or np.all(a == a[0]) or np.all(b == b[0]):
+        return np.nan
+    postos_a = np.argsort(np.argsort(a)).astype(float)
+    postos_b = np.argsort(np.argsort(b)).astype(float)
+    postos_a -= postos_a.mean()
+    postos_b -= postos_b.mean()
+    denominador = np.sqrt((postos_a * postos_a).sum() * (postos_b * postos_b).sum())
+    return float((postos_a * postos_b).sum() / denominador) if denominador > 0 else np.nan
+
+def _contadores(dados, algoritmos, tempos):
+    """
+    Contadores internos (coleta com --contadores) de cada algoritmo que os tem, cruzados com os
+    tempos medição a medição. Para cada contador e tamanho: média, correlação de Spearman com o
+    tempo e média nas medições lentas (acima do percentil 95 do tempo) e nas demais.
+    Retorna {nome: {"medias"|"correlacoes"|"lentas"|"demais": {contador: array (tamanhos,)}}}, ou None.
+    """
+    resultados = dados["resultados"]
+    saida = {}
+    for j, nome in enumerate(algoritmos):
+        chave = f"contadores_{nome}"
+        if not all(chave in r for r in resultados):
+            continue
+        contadores = list(resultados[0][chave])
+        estatisticas = {tipo: {c: np.full(len(resultados), np.nan) for c in contadores}
+                        for tipo in ("medias", "correlacoes", "lentas", "demais")}
+        for i, resultado in enumerate(resultados):
+            t = tempos[i, j][~np.isnan(tempos[i, j])]
+            lentas = t > np.percentile(t, 95) if len(t) else np.zeros(0, dtype=bool)
+            for c in contadores:
+                valores = np.asarray(resultado[chave][c], dtype=float)[:len(t)]
+                if len(valores) != len(t) or not len(t):
+                    continue
+                estatisticas["medias"][c][i] = valores.mean()
+                estatisticas["correlacoes"][c][i] = _correlacao_postos(t, valores)
+                if lentas.any() and (~lentas).any():
+                    estatisticas["lentas"][c][i] = valores[lentas].mean()
+                    estatisticas["demais"][c][i] = valores[~lentas].mean()
+        saida[nome] = estatisticas
+    return saida or None
+
+def _razoes_pares(tempos, pares):
+    """
+    Razão de performance tempos[j] / tempos[i] de cada par (i, j), medição a medição
+    (só onde as duas medições existem). Retorna (razoes, desvios), cada um (pares x tamanhos).
+    """
+    if not pares:
+        vazio = np.empty((0, tempos.shape[0]))
+        return vazio, vazio
+    denominadores = tempos[:, [i for i, _ in pares], :]                 # (S, P, M)
+    numeradores = tempos[:, [j for _, j in pares], :]
+    validas = (denominadores > 0) & ~np.isnan(numeradores)
+    razoes_medicao = np.where(validas, numeradores / np.where(validas, denominadores, 1.0), 0.0)
+    divisor = np.maximum(validas.sum(axis=2), 1)
+    razoes = razoes_medicao.sum(axis=2) / divisor
+    desvios = np.sqrt((np.where(validas, razoes_medicao - razoes[:, :, None], 0.0) ** 2).sum(axis=2) / divisor)
+    return razoes.T, desvios.T
+
+def _referencia_raios(algoritmos):
+    """Índice do algoritmo usado como referência dos raios: o primeiro exato, ou o primeiro de todos."""
+    for j, nome in enumerate(algoritmos):
+        if descrever_algoritmo(nome)["exato"]:
+            return j
+    return 0
 
 def calcular_estatisticas(dados):
     """
     Calcula estatísticas a partir dos dados brutos.
+    Todos os agregados saem de um único array (tamanhos x algoritmos x medições), e os ajustes
+    log-log ficam guardados para os gráficos e o relatório não precisarem refazê-los.
+    Vale para qualquer conjunto de algoritmos: razões para todos os pares (i, j), i < j, na
+    ordem dos dados, e raios comparados com os do algoritmo de referência (o primeiro exato).
     """
     resultados = dados["resultados"]
-    
+    algoritmos = _algoritmos_dos_dados(dados)
+
     # Extrai dados brutos para análise
     numeros_pontos = [r["num_pontos"] for r in resultados]
-    
-    # Calcula médias e desvios padrão dos tempos
-    medias_tempos_heuristico = []
-    medias_tempos_eficiente = []
-    desvios_tempos_heuristico = []
-    desvios_tempos_eficiente = []
-    
-    for resultado in resultados:
-        # Médias dos tempos
-        media_heur = sum(resultado["tempos_heuristico"]) / len(resultado["tempos_heuristico"])
-        media_ef = sum(resultado["tempos_eficiente"]) / len(resultado["tempos_eficiente"])
-        medias_tempos_heuristico.append(media_heur)
-        medias_tempos_eficiente.append(media_ef)
-        
-        # Desvios padrão dos tempos
-        desvio_heur = (sum((x - media_heur)**2 for x in resultado["tempos_heuristico"]) / len(resultado["tempos_heuristico"]))**0.5
-        desvio_ef = (sum((x - media_ef)**2 for x in resultado["tempos_eficiente"]) / len(resultado["tempos_eficiente"]))**0.5
-        desvios_tempos_heuristico.append(desvio_heur)
-        desvios_tempos_eficiente.append(desvio_ef)
-    
-    # Calcula razões de performance e seus desvios padrão
-    razoes = []
-    desvios_razoes = []
-    
-    for resultado in resultados:
-        tempos_heur = resultado["tempos_heuristico"]
-        tempos_ef = resultado["tempos_eficiente"]
-        
-        # Calcula razões para cada medição individual
-        razoes_medicao = []
-        for t_ef, t_heur in zip(tempos_ef, tempos_heur):
-            if t_heur > 0:
-                razao = t_ef / t_heur
-                razoes_medicao.append(razao)
-        
-        # Média e desvio padrão das razões
-        if razoes_medicao:
-            razoes.append(np.mean(razoes_medicao))
-            desvios_razoes.append(np.std(razoes_medicao))
-        else:
-            razoes.append(0)
-            desvios_razoes.append(0)
-    
-    # Calcula complexidade estimada
-    complexidade_heur = calcular_complexidade_estimada(numeros_pontos, medias_tempos_heuristico)
-    complexidade_ef = calcular_complexidade_estimada(numeros_pontos, medias_tempos_eficiente)
-    
-    # Calcula diferenças percentuais dos raios
-    diferencas_perc_raios = []
-    for resultado in resultados:
-        raio_heur = resultado["raio_heuristico"]
-        raio_ef = resultado["raio_eficiente"]
-        diff_perc = ((raio_heur - raio_ef) / raio_ef) * 100 if raio_ef > 0 else 0
-        diferencas_perc_raios.append(diff_perc)
-    
-    # Calcula complexidade teórica
-    # O(n) para ambos, mas com constantes diferentes
-    complexidade_teorica = [n for n in numeros_pontos]
-    
-    return {
+    tempos = montar_matriz_tempos(dados, algoritmos)
+
+    # Agregados por tamanho e algoritmo (forma: algoritmos x tamanhos)
+    medias = np.nanmean(tempos, axis=2).T
+    desvios = np.nanstd(tempos, axis=2).T
+    medianas = np.nanmedian(tempos, axis=2).T
+    percentis = {p: v.T for p, v in zip((5, 25, 75, 95), np.nanpercentile(tempos, [5, 25, 75, 95], axis=2))}
+    mad = np.nanmedian(np.abs(tempos - medianas.T[:, :, None]), axis=2).T
+
+    # Tempo de CPU (medição adaptativa), quando os dados têm
+    if any(f"tempos_cpu_{nome}" in r for r in resultados for nome in algoritmos):
+        with np.errstate(all='ignore'):
+            medianas_cpu = np.nanmedian(montar_matriz_tempos(dados, algoritmos, "tempos_cpu_"), axis=2).T
+    else:
+        medianas_cpu = None
+
+    # Contadores internos (coleta com --contadores) cruzados com os tempos
+    contadores = _contadores(dados, algoritmos, tempos)
+
+    # Memória (coleta com --memoria) e expoentes de crescimento dos picos
+    memoria = _memoria(dados, algoritmos)
+    ajustes_memoria = None
+    if memoria is not None:
+        with np.errstate(invalid='ignore'):
+            ajustes_memoria = {medida: _ajustar_positivos(numeros_pontos, valores)
+                               for medida, valores in memoria.items() if medida != "blocos"}
+
+    # Complexidade estimada (e intervalo de confiança por bootstrap)
+    if len(numeros_pontos) >= 2:
+        expoentes, interceptos = ajustar_loglog(numeros_pontos, medias)
+        ic_expoentes = _bootstrap_expoentes(numeros_pontos, tempos)
+    else:
+        expoentes = interceptos = np.full(len(algoritmos), np.nan)
+        ic_expoentes = np.full((len(algoritmos), 2), np.nan)
+
+    # Razões de performance para todos os pares de algoritmos
+    pares = [(i, j) for i in range(len(algoritmos)) for j in range(i + 1, len(algoritmos))]
+    razoes_pares, desvios_razoes_pares = _razoes_pares(tempos, pares)
+
+    # Raios (algoritmos x tamanhos) e diferenças percentuais em relação à referência
+    raios = np.array([[r.get(f"raio_{nome}", np.nan) for r in resultados] for nome in algoritmos],
+                     dtype=float).reshape(len(algoritmos), len(resultados))
+    referencia = _referencia_raios(algoritmos)
+    if len(algoritmos):
+        raios_ref = raios[referencia]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            diferencas_perc = np.where(raios_ref > 0, (raios - raios_ref) / raios_ref * 100, 0.0)
+    else:
+        diferencas_perc = raios
+
+    estatisticas = {
         "numeros_pontos": numeros_pontos,
-        "medias_tempos_heuristico": medias_tempos_heuristico,
-        "medias_tempos_eficiente": medias_tempos_eficiente,
-        "desvios_tempos_heuristico": desvios_tempos_heuristico,
-        "desvios_tempos_eficiente": desvios_tempos_eficiente,
-        "razoes": razoes,
-        "desvios_razoes": desvios_razoes,
-        "diferencas_perc_raios": diferencas_perc_raios,
-        "complexidade_teorica": complexidade_teorica,
-        "complexidade_estimada_heur": complexidade_heur,
-        "complexidade_estimada_ef": complexidade_ef
+        "algoritmos": algoritmos,
+        "rotulos": [descrever_algoritmo(nome)["rotulo"] for nome in algoritmos],
+        "medias": medias,
+        "desvios": desvios,
+        "medianas": medianas,
+        "percentis": percentis,
+        "mad": mad,
+        "medianas_cpu": medianas_cpu,
+        "memoria": memoria,
+        "contadores": contadores,
+        "ajustes_memoria": ajustes_memoria,
+        "expoentes": expoentes,
+        "interceptos": interceptos,
+        "ic_expoentes": ic_expoentes,
+        "pares": pares,
+        "razoes_pares": razoes_pares,
+        "desvios_razoes_pares": desvios_razoes_pares,
+        "raios": raios,
+        "referencia_raios": referencia,
+        "diferencas_perc": diferencas_perc,
+        # Calcula complexidade teórica
+        # O(n) para ambos, mas com constantes diferentes
+        "complexidade_teorica": list(numeros_pontos)
     }
 
-def gerar_grafico_comparacao_log(estatisticas, nome_arquivo="plot_comparacao_log.png"):
-    """
-    Gera o gráfico de comparação de performance dos algoritmos em escala log-log.
-    """
-    fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-    
-    # Adiciona envelopes de desvio padrão transparentes
+    if "heuristico" in algoritmos and "eficiente" in algoritmos:
+        h = algoritmos.index("heuristico")
+        e = algoritmos.index("eficiente")
+
+        # Chaves da versão com dois algoritmos fixos (Eficiente / Heurístico)
+        (razoes,), (desvios_razoes,) = _razoes_pares(tempos, [(h, e)])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            diferencas_perc_raios = np.where(raios[e] > 0, (raios[h] - raios[e]) / raios[e] * 100, 0.0)
+
+        estatisticas.update({
+            "medias_tempos_heuristico": medias[h].tolist(),
+            "medias_tempos_eficiente": medias[e].tolist(),
+            "desvios_tempos_heuristico": desvios[h].tolist(),
+            "desvios_tempos_eficiente": desvios[e].tolist(),
+            "razoes": razoes.tolist(),
+            "desvios_razoes": desvios_razoes.tolist(),
+            "diferencas_perc_raios": diferencas_perc_raios.tolist(),
+            "complexidade_estimada_heur": float(expoentes[h]) if len(numeros_pontos) >= 2 else None,
+            "complexidade_estimada_ef": float(expoentes[e]) if len(numeros_pontos) >= 2 else None
+        })
+
+    return estatisticas
+
+def _linha_complexidade(estatisticas, nome):
+    """Curva ajustada exp(b)·n^a de um algoritmo, a partir do ajuste já guardado nas estatísticas."""
+    j = estatisticas["algoritmos"].index(nome)
+    n = np.asarray(estatisticas["numeros_pontos"], dtype=float)
+    return np.exp(estatisticas["interceptos"][j]) * n ** estatisticas["expoentes"][j]
+
+# Cada gráfico é descrito por uma especificação (dicionário só com listas, números e textos):
+#   arquivo, titulo, eixo_x, eixo_y, escala ("loglog", "semilogx" ou "linear"), legenda,
+#   envelopes: faixas ±1σ (x, inferior, superior, cor, rotulo)
+#   series:    linhas (x, y, formato, cor, rotulo, alpha, destaque)
+#   linha_zero: desenha a referência horizontal em y = 0
+# As especificações são renderizadas por _renderizar_grafico, em paralelo, e um gráfico só é
+# refeito quando o hash da sua especificação muda.
+
+_CACHE_GRAFICOS = ".cache_graficos.json"
+
+def _envelope(numeros_pontos, valores, desvios, cor, rotulo):
+    """Faixa ±1σ em torno de uma série."""
+    valores = np.asarray(valores, dtype=float)
+    desvios = np.asarray(desvios, dtype=float)
+    return {"x": list(numeros_pontos), "inferior": (valores - desvios).tolist(),
+            "superior": (valores + desvios).tolist(), "cor": cor, "rotulo": rotulo}
+
+def _serie(x, y, formato, cor, rotulo, alpha=1.0, destaque=True):
+    """Linha de um gráfico; com destaque, usa linha grossa e marcadores grandes."""
+    return {"x": list(x), "y": np.asarray(y, dtype=float).tolist(), "formato": formato, "cor": cor,
+            "rotulo": rotulo, "alpha": alpha, "destaque": destaque}
+
+_MARCADORES = ['o', 's', '^', 'D', 'v', 'P', 'X', '*']
+
+def _cores(estatisticas):
+    """Cor de cada algoritmo nos gráficos (a do registro; 'gray' para nomes desconhecidos)."""
+    return [descrever_algoritmo(nome)["cor"] or 'gray' for nome in estatisticas["algoritmos"]]
+
+def _especificacao_comparacao(estatisticas, arquivo, escala, subtitulo):
+    """Tempos médios de todos os algoritmos, com envelopes ±1σ e as curvas de complexidade ajustadas."""
     numeros_pontos = estatisticas["numeros_pontos"]
-    medias_heur = estatisticas["medias_tempos_heuristico"]
-    desvios_heur = estatisticas["desvios_tempos_heuristico"]
-    medias_ef = estatisticas["medias_tempos_eficiente"]
-    desvios_ef = estatisticas["desvios_tempos_eficiente"]
-    
-    # Envelope superior e inferior para heurístico
-    ax.fill_between(numeros_pontos, 
-                     [m - d for m, d in zip(medias_heur, desvios_heur)],
-                     [m + d for m, d in zip(medias_heur, desvios_heur)],
-                     alpha=0.2, color='blue', label='±1σ Heurístico')
-    
-    # Envelope superior e inferior para eficiente
-    ax.fill_between(numeros_pontos, 
-                     [m - d for m, d in zip(medias_ef, desvios_ef)],
-                     [m + d for m, d in zip(medias_ef, desvios_ef)],
-                     alpha=0.2, color='orange', label='±1σ Eficiente')
-    
-    # Linhas principais dos algoritmos
-    ax.loglog(numeros_pontos, medias_heur, 
-               'o-', label='Algoritmo Heurístico', linewidth=2, markersize=8, color='blue')
-    ax.loglog(numeros_pontos, medias_ef, 
-               's-', label='Algoritmo Eficiente', linewidth=2, markersize=8, color='orange')
-    
-    # Linhas de complexidade estimada
-    if estatisticas["complexidade_estimada_heur"] is not None:
-        # Calcula linha de complexidade estimada para heurístico
-        log_n = np.log(estatisticas["numeros_pontos"])
-        log_t = np.log(estatisticas["medias_tempos_heuristico"])
-        coeffs_heur = np.polyfit(log_n, log_t, 1)
-        y_heur_est = np.exp(coeffs_heur[1]) * (estatisticas["numeros_pontos"] ** coeffs_heur[0])
-        ax.loglog(estatisticas["numeros_pontos"], y_heur_est, ':', 
-                   label=f'O(n^{estatisticas["complexidade_estimada_heur"]:.2f}) Heurístico', 
-                   alpha=0.8, color='blue')
-    
-    if estatisticas["complexidade_estimada_ef"] is not None:
-        # Calcula linha de complexidade estimada para eficiente
-        log_n = np.log(estatisticas["numeros_pontos"])
-        log_t = np.log(estatisticas["medias_tempos_eficiente"])
-        coeffs_ef = np.polyfit(log_n, log_t, 1)
-        y_ef_est = np.exp(coeffs_ef[1]) * (estatisticas["numeros_pontos"] ** coeffs_ef[0])
-        ax.loglog(estatisticas["numeros_pontos"], y_ef_est, ':', 
-                   label=f'O(n^{estatisticas["complexidade_estimada_ef"]:.2f}) Eficiente', 
-                   alpha=0.8, color='orange')
-    
-    ax.set_xlabel('Número de Pontos')
-    ax.set_ylabel('Tempo de Execução (segundos)')
-    ax.set_title('Comparação de Performance dos Algoritmos\n(escalas log-log)')
-    ax.legend(loc='upper left', fontsize=14)
-    ax.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig(nome_arquivo, dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return nome_arquivo
+    rotulos = estatisticas["rotulos"]
+    cores = _cores(estatisticas)
+    series = [_serie(numeros_pontos, estatisticas["medias"][j], _MARCADORES[j % len(_MARCADORES)] + '-',
+                     cores[j], f'Algoritmo {rotulo}')
+              for j, rotulo in enumerate(rotulos)]
+    if len(numeros_pontos) >= 2:
+        for j, nome in enumerate(estatisticas["algoritmos"]):
+            series.append(_serie(numeros_pontos, _linha_complexidade(estatisticas, nome), ':', cores[j],
+                                 f'O(n^{float(estatisticas["expoentes"][j]):.2f}) {rotulos[j]}', 0.8, False))
+    return {
+        "arquivo": arquivo,
+        "titulo": f'Comparação de Performance dos Algoritmos\n({subtitulo})',
+        "eixo_x": 'Número de Pontos',
+        "eixo_y": 'Tempo de Execução (segundos)',
+        "escala": escala,
+        "legenda": 'upper left',
+        "envelopes": [_envelope(numeros_pontos, estatisticas["medias"][j], estatisticas["desvios"][j],
+                                cores[j], f'±1σ {rotulo}')
+                      for j, rotulo in enumerate(rotulos)],
+        "series": series,
+        "linha_zero": False
+    }
 
-def gerar_grafico_razao_performance(estatisticas, nome_arquivo="plot_razao_semilogx.png"):
+def _especificacao_razao(estatisticas, arquivo, escala, titulo):
     """
-    Gera o gráfico de razão de performance entre os algoritmos com envelopes de desvio padrão.
+    Razão de performance de cada algoritmo em relação ao primeiro, com envelope ±1σ.
+    Com dois algoritmos, é o gráfico original (uma série vermelha).
     """
-    fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-    
-    # Dados das razões e seus desvios padrão
     numeros_pontos = estatisticas["numeros_pontos"]
-    razoes = estatisticas["razoes"]
-    desvios_razoes = estatisticas["desvios_razoes"]
-    
-    # Envelope superior e inferior para as razões (±1σ)
-    ax.fill_between(numeros_pontos, 
-                     [r - d for r, d in zip(razoes, desvios_razoes)],
-                     [r + d for r, d in zip(razoes, desvios_razoes)],
-                     alpha=0.2, color='red', label='±1σ Razão')
-    
-    # Linha principal das razões
-    ax.semilogx(numeros_pontos, razoes, 
-                 'o-', color='red', linewidth=2, markersize=8, label='Razão Eficiente/Heurístico')
-
-    ax.set_xlabel('Número de Pontos')
-    ax.set_ylabel('Razão (Eficiente / Heurístico)')
-    ax.set_title('Razão de Performance: Eficiente vs Heurístico')
-    ax.legend(loc='upper left', fontsize=14)
-    ax.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig(nome_arquivo, dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return nome_arquivo
+    rotulos = estatisticas["rotulos"]
+    cores = _cores(estatisticas)
+    base = rotulos[0]
+    indices = [k for k, (i, _) in enumerate(estatisticas["pares"]) if i == 0]
+    envelopes = []
+    series = []
+    for k in indices:
+        j = estatisticas["pares"][k][1]
+        unica = len(indices) == 1
+        cor = 'red' if unica else cores[j]
+        envelopes.append(_envelope(numeros_pontos, estatisticas["razoes_pares"][k], estatisticas["desvios_razoes_pares"][k],
+                                   cor, '±1σ Razão' if unica else f'±1σ {rotulos[j]}'))
+        series.append(_serie(numeros_pontos, estatisticas["razoes_pares"][k], 'o-', cor, f'Razão {rotulos[j]}/{base}'))
+    return {
+        "arquivo": arquivo,
+        "titulo": titulo,
+        "eixo_x": 'Número de Pontos',
+        "eixo_y": f'Razão ({rotulos[1]} / {base})' if len(indices) == 1 else f'Razão (algoritmo / {base})',
+        "escala": escala,
+        "legenda": 'upper left',
+        "envelopes": envelopes,
+        "series": series,
+        "linha_zero": False
+    }
+
+def _especificacao_raios(estatisticas):
+    """Diferença percentual dos raios de cada algoritmo em relação ao de referência."""
+    rotulos = estatisticas["rotulos"]
+    cores = _cores(estatisticas)
+    referencia = estatisticas["referencia_raios"]
+    outros = [j for j in range(len(rotulos)) if j != referencia]
+    if len(outros) == 1:
+        titulo = f'Diferença Percentual dos Raios: {rotulos[outros[0]]} vs {rotulos[referencia]}'
+        series = [_serie(estatisticas["numeros_pontos"], estatisticas["diferencas_perc"][outros[0]],
+                         'o-', 'green', 'Diferença % dos Raios')]
+    else:
+        titulo = f'Diferença Percentual dos Raios em relação ao {rotulos[referencia]}'
+        series = [_serie(estatisticas["numeros_pontos"], estatisticas["diferencas_perc"][j],
+                         _MARCADORES[j % len(_MARCADORES)] + '-', cores[j], rotulos[j])
+                  for j in outros]
+    return {
+        "arquivo": "plot_diferenca_raios.png",
+        "titulo": titulo,
+        "eixo_x": 'Número de Pontos',
+        "eixo_y": 'Diferença Percentual (%)',
+        "escala": "semilogx",
+        "legenda": 'best',
+        "envelopes": [],
+        "series": series,
+        "linha_zero": True
+    }
 
-def gerar_grafico_diferenca_raios(estatisticas, nome_arquivo="plot_diferenca_raios.png"):
+def _especificacao_memoria(estatisticas):
     """
-    Gera o gráfico de diferença percentual dos raios entre os algoritmos.
+    Picos de memória por tamanho (log-log): tracemalloc em linha cheia, RSS tracejado, e as
+    curvas ajustadas do pico do tracemalloc.
     """
-    fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-    
-    ax.semilogx(estatisticas["numeros_pontos"], estatisticas["diferencas_perc_raios"], 
-                 'o-', color='green', linewidth=2, markersize=8, label='Diferença % dos Raios')
-    ax.set_xlabel('Número de Pontos')
-    ax.set_ylabel('Diferença Percentual (%)')
-    ax.set_title('Diferença Percentual dos Raios: Heurístico vs Eficiente')
-    ax.legend(fontsize=14)
-    ax.grid(True, alpha=0.3)
-    
-    # Adiciona linha horizontal em y=0 para referência
-    ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig(nome_arquivo, dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return nome_arquivo
+    numeros_pontos = estatisticas["numeros_pontos"]
+    rotulos = estatisticas["rotulos"]
+    cores = _cores(estatisticas)
+    memoria = estatisticas["memoria"]
+    ajustes = estatisticas["ajustes_memoria"]
+    n = np.asarray(numeros_pontos, dtype=float)
+    series = []
+    for j, rotulo in enumerate(rotulos):
+        marcador = _MARCADORES[j % len(_MARCADORES)]
+        if "pico" in memoria:
+            series.append(_serie(numeros_pontos, memoria["pico"][j], marcador + '-', cores[j], f'{rotulo} (tracemalloc)'))
+            expoente, intercepto = ajustes["pico"][0][j], ajustes["pico"][1][j]
+            if not np.isnan(expoente):
+                series.append(_serie(numeros_pontos, np.exp(intercepto) * n ** expoente, ':', cores[j],
+                                     f'O(n^{float(expoente):.2f}) {rotulo}', 0.8, False))
+        if "rss" in memoria:
+            # Picos de RSS nulos não aparecem na escala log
+            rss = np.where(memoria["rss"][j] > 0, memoria["rss"][j], np.nan)
+            series.append(_serie(numeros_pontos, rss, marcador + '--', cores[j], f'{rotulo} (RSS)', 0.5, False))
+    return {
+        "arquivo": "plot_memoria_log.png",
+        "titulo": 'Pico de Memória dos Algoritmos\n(escalas log-log)',
+        "eixo_x": 'Número de Pontos',
+        "eixo_y": 'Memória (bytes)',
+        "escala": "loglog",
+        "legenda": 'upper left',
+        "envelopes": [],
+        "series": series,
+        "linha_zero": False
+    }
 
-def gerar_grafico_razao_decimal(estatisticas, nome_arquivo="plot_razao_decimal.png"):
+def especificacoes_graficos(estatisticas):
     """
-    Gera o gráfico de razão de performance entre os algoritmos com eixo x em escala decimal.
+    Especificações dos gráficos gerados pela análise: comparação de tempos (log-log e decimal),
+    picos de memória (quando medidos) e, com dois ou mais algoritmos, razões de performance
+    e diferença dos raios.
     """
+    especificacoes = [
+        _especificacao_comparacao(estatisticas, "plot_comparacao_log.png", "loglog", "escalas log-log"),
+        _especificacao_comparacao(estatisticas, "plot_comparacao_decimal.png", "linear", "escalas decimais"),
+    ]
+    if estatisticas["memoria"] is not None:
+        especificacoes.append(_especificacao_memoria(estatisticas))
+    rotulos = estatisticas["rotulos"]
+    if len(rotulos) < 2:
+        return especificacoes
+    titulo = (f'Razão de Performance: {rotulos[1]} vs {rotulos[0]}' if len(rotulos) == 2
+              else f'Razão de Performance em relação ao {rotulos[0]}')
+    especificacoes += [
+        _especificacao_razao(estatisticas, "plot_razao_semilogx.png", "semilogx", titulo),
+        _especificacao_razao(estatisticas, "plot_razao_decimal.png", "linear", f'{titulo}\n(escala decimal)'),
+        _especificacao_raios(estatisticas),
+    ]
+    return especificacoes
+
+def _hash_especificacao(especificacao):
+    """Hash estável do conteúdo de uma especificação."""
+    texto = json.dumps(especificacao, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+def _renderizar_grafico(especificacao):
+    """Desenha um gráfico a partir da sua especificação e salva em arquivo (backend Agg)."""
     fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-    
-    # Dados das razões e seus desvios padrão
-    numeros_pontos = estatisticas["numeros_pontos"]
-    razoes = estatisticas["razoes"]
-    desvios_razoes = estatisticas["desvios_razoes"]
-    
-    # Envelope superior e inferior para as razões (±1σ)
-    ax.fill_between(numeros_pontos, 
-                     [r - d for r, d in zip(razoes, desvios_razoes)],
-                     [r + d for r, d in zip(razoes, desvios_razoes)],
-                     alpha=0.2, color='red', label='±1σ Razão')
-    
-    # Linha principal das razões (escala decimal)
-    ax.plot(numeros_pontos, razoes, 
-            'o-', color='red', linewidth=2, markersize=8, label='Razão Eficiente/Heurístico')
-    
-    ax.set_xlabel('Número de Pontos')
-    ax.set_ylabel('Razão (Eficiente / Heurístico)')
-    ax.set_title('Razão de Performance: Eficiente vs Heurístico\n(escala decimal)')
-    ax.legend(loc='upper left', fontsize=14)
+
+    for envelope in especificacao["envelopes"]:
+        ax.fill_between(envelope["x"], envelope["inferior"], envelope["superior"],
+                        alpha=0.2, color=envelope["cor"], label=envelope["rotulo"])
+
+    desenhar = {"loglog": ax.loglog, "semilogx": ax.semilogx, "linear": ax.plot}[especificacao["escala"]]
+    for serie in especificacao["series"]:
+        estilo = {"linewidth": 2, "markersize": 8} if serie["destaque"] else {}
+        desenhar(serie["x"], serie["y"], serie["formato"], label=serie["rotulo"],
+                 color=serie["cor"], alpha=serie["alpha"], **estilo)
+
+    ax.set_xlabel(especificacao["eixo_x"])
+    ax.set_ylabel(especificacao["eixo_y"])
+    ax.set_title(especificacao["titulo"])
+    ax.legend(loc=especificacao["legenda"], fontsize=14)
     ax.grid(True, alpha=0.3)
-    
+
+    if especificacao["linha_zero"]:
+        # Adiciona linha horizontal em y=0 para referência
+        ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+
     plt.tight_layout()
-    plt.savefig(nome_arquivo, dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return nome_arquivo
+    plt.savefig(especificacao["arquivo"], dpi=300, bbox_inches='tight')
+    plt.close(fig)
+
+    return especificacao["arquivo"]
 
-def gerar_grafico_comparacao_decimal(estatisticas, nome_arquivo="plot_comparacao_decimal.png"):
+def renderizar_graficos(especificacoes, workers=None, arquivo_cache=_CACHE_GRAFICOS):
     """
-    Gera o gráfico de comparação de performance dos algoritmos em escalas decimais.
+    Renderiza as especificações em processos separados, pulando os gráficos cujo arquivo já existe
+    e cuja especificação não mudou desde a última vez (hash guardado em arquivo_cache).
+    Retorna a lista de arquivos que foram (re)gerados.
     """
-    fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-    
-    # Adiciona envelopes de desvio padrão transparentes
-    numeros_pontos = estatisticas["numeros_pontos"]
-    medias_heur = estatisticas["medias_tempos_heuristico"]
-    desvios_heur = estatisticas["desvios_tempos_heuristico"]
-    medias_ef = estatisticas["medias_tempos_eficiente"]
-    desvios_ef = estatisticas["desvios_tempos_eficiente"]
-    
-    # Envelope superior e inferior para heurístico
-    ax.fill_between(numeros_pontos, 
-                     [m - d for m, d in zip(medias_heur, desvios_heur)],
-                     [m + d for m, d in zip(medias_heur, desvios_heur)],
-                     alpha=0.2, color='blue', label='±1σ Heurístico')
-    
-    # Envelope superior e inferior para eficiente
-    ax.fill_between(numeros_pontos, 
-                     [m - d for m, d in zip(medias_ef, desvios_ef)],
-                     [m + d for m, d in zip(medias_ef, desvios_ef)],
-                     alpha=0.2, color='orange', label='±1σ Eficiente')
-    
-    # Linhas principais dos algoritmos
-    ax.plot(numeros_pontos, medias_heur, 
-            'o-', label='Algoritmo Heurístico', linewidth=2, markersize=8, color='blue')
-    ax.plot(numeros_pontos, medias_ef, 
-            's-', label='Algoritmo Eficiente', linewidth=2, markersize=8, color='orange')
-    
-    # Linhas de complexidade estimada
-    if estatisticas["complexidade_estimada_heur"] is not None:
-        # Calcula linha de complexidade estimada para heurístico
-        log_n = np.log(estatisticas["numeros_pontos"])
-        log_t = np.log(estatisticas["medias_tempos_heuristico"])
-        coeffs_heur = np.polyfit(log_n, log_t, 1)
-        y_heur_est = np.exp(coeffs_heur[1]) * (estatisticas["numeros_pontos"] ** coeffs_heur[0])
-        ax.plot(estatisticas["numeros_pontos"], y_heur_est, ':', 
-                label=f'O(n^{estatisticas["complexidade_estimada_heur"]:.2f}) Heurístico', 
-                alpha=0.8, color='blue')
-    
-    if estatisticas["complexidade_estimada_ef"] is not None:
-        # Calcula linha de complexidade estimada para eficiente
-        log_n = np.log(estatisticas["numeros_pontos"])
-        log_t = np.log(estatisticas["medias_tempos_eficiente"])
-        coeffs_ef = np.polyfit(log_n, log_t, 1)
-        y_ef_est = np.exp(coeffs_ef[1]) * (estatisticas["numeros_pontos"] ** coeffs_ef[0])
-        ax.plot(estatisticas["numeros_pontos"], y_ef_est, ':', 
-                label=f'O(n^{estatisticas["complexidade_estimada_ef"]:.2f}) Eficiente', 
-                alpha=0.8, color='orange')
-    
-    ax.set_xlabel('Número de Pontos')
-    ax.set_ylabel('Tempo de Execução (segundos)')
-    ax.set_title('Comparação de Performance dos Algoritmos\n(escalas decimais)')
-    ax.legend(loc='upper left', fontsize=14)
-    ax.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig(nome_arquivo, dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return nome_arquivo
+    try:
+        with open(arquivo_cache, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
+
+    hashes = {e["arquivo"]: _hash_especificacao(e) for e in especificacoes}
+    pendentes = [e for e in especificacoes
+                 if cache.get(e["arquivo"]) != hashes[e["arquivo"]] or not os.path.exists(e["arquivo"])]
+
+    workers = min(len(pendentes), workers or os.cpu_count() or 1)
+    if workers <= 1:
+        gerados = [_renderizar_grafico(e) for e in pendentes]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            gerados = list(pool.map(_renderizar_grafico, pendentes))
+
+    cache.update({arquivo: hashes[arquivo] for arquivo in gerados})
+    with open(arquivo_cache, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+    return gerados
 
 def gerar_graficos(estatisticas):
     """
-    Gera os cinco gráficos separadamente e salva cada um em um arquivo.
+    Gera os gráficos separadamente e salva cada um em um arquivo.
+    Gráficos cujos dados não mudaram desde a última execução não são refeitos.
     """
     print("\nGerando gráficos...")
-    
-    # Gráfico 1: Comparação de performance em escala log
-    arquivo1 = gerar_grafico_comparacao_log(estatisticas, "plot_comparacao_log.png")
-    print(f"  Gráfico de comparação (log-log) salvo em: {arquivo1}")
-    
-    # Gráfico 2: Comparação de performance em escala decimal
-    arquivo2 = gerar_grafico_comparacao_decimal(estatisticas, "plot_comparacao_decimal.png")
-    print(f"  Gráfico de comparação (decimal) salvo em: {arquivo2}")
-    
-    # Gráfico 3: Razão de performance (semi-log)
-    arquivo3 = gerar_grafico_razao_performance(estatisticas, "plot_razao_semilogx.png")
-    print(f"  Gráfico de razão (semi-log) salvo em: {arquivo3}")
-    
-    # Gráfico 4: Razão de performance (decimal)
-    arquivo4 = gerar_grafico_razao_decimal(estatisticas, "plot_razao_decimal.png")
-    print(f"  Gráfico de razão (decimal) salvo em: {arquivo4}")
-    
-    # Gráfico 5: Diferença dos raios
-    arquivo5 = gerar_grafico_diferenca_raios(estatisticas, "plot_diferenca_raios.png")
-    print(f"  Gráfico de diferença dos raios salvo em: {arquivo5}")
-    
-    return [arquivo1, arquivo2, arquivo3, arquivo4, arquivo5]
+
+    especificacoes = especificacoes_graficos(estatisticas)
+    gerados = renderizar_graficos(especificacoes)
+    for especificacao in especificacoes:
+        situacao = "salvo em" if especificacao["arquivo"] in gerados else "sem alterações, mantido"
+        print(f"  Gráfico {situacao}: {especificacao['arquivo']}")
+
+    return [e["arquivo"] for e in especificacoes]
+
+def _formatar_memoria(medida, valor):
+    """Texto de uma medida de memória: blocos como contagem, picos em KiB."""
+    if np.isnan(valor):
+        return "-"
+    if medida == "blocos":
+        return f"{int(valor)}"
+    return f"{valor / 1024:.1f} KiB"
+
+# Diferença relativa de raio abaixo da qual dois raios são considerados iguais (arredondamento)
+_TOL_RAIOS = 1e-9
 
 def gerar_relatorio(dados, estatisticas, nome_arquivo="relatorio.txt"):
     """
@@ -375,105 +605,152 @@ def gerar_relatorio(dados, estatisticas, nome_arquivo="relatorio.txt"):
         f.write(f"Limites X: [{config['x_min']}, {config['x_max']}]\n")
         f.write(f"Limites Y: [{config['y_min']}, {config['y_max']}]\n")
         f.write(f"Sigma (distribuição Gaussiana): {config['sigma']}\n")
-        f.write(f"Número de medições por teste: {config['num_medicoes']}\n")
+        medicao = config.get("medicao", {"modo": "fixo"})
+        if medicao["modo"] == "adaptativo":
+            f.write(f"Medição adaptativa: até {medicao['max_amostras']} amostras por teste, "
+                    f"parando com IC 95% da mediana em ±{medicao['precisao'] * 100:g}% "
+                    f"(amostras de pelo menos {medicao['tempo_amostra'] * 1000:g} ms)\n")
+        else:
+            f.write(f"Número de medições por teste: {config['num_medicoes']}\n")
         
         # Resultados detalhados
         f.write("\nRESULTADOS DETALHADOS:\n")
         f.write("-" * 30 + "\n")
         
+        algoritmos = estatisticas["algoritmos"]
+        rotulos = estatisticas["rotulos"]
+        pares = estatisticas["pares"]
+        referencia = estatisticas["referencia_raios"]
+        outros = [j for j in range(len(algoritmos)) if j != referencia]
+        largura = max((len(rotulo) for rotulo in rotulos), default=0) + 1
+        
+        def _nome_razao(k):
+            i, j = pares[k]
+            return "Razão" if len(pares) == 1 else f"Razão {rotulos[j]}/{rotulos[i]}"
+        
+        def _nome_dif(j):
+            return "Dif. raio" if len(outros) == 1 else f"Dif. raio {rotulos[j]}"
+        
         for i, resultado in enumerate(dados["resultados"]):
             f.write(f"\nTeste {i+1}: {resultado['num_pontos']} pontos\n")
-            f.write(f"  Heurístico: {estatisticas['medias_tempos_heuristico'][i]:.6f}s ± {estatisticas['desvios_tempos_heuristico'][i]:.6f}s")
-            f.write(f" (raio: {resultado['raio_heuristico']:.6f})\n")
-            f.write(f"  Eficiente:  {estatisticas['medias_tempos_eficiente'][i]:.6f}s ± {estatisticas['desvios_tempos_eficiente'][i]:.6f}s")
-            f.write(f" (raio: {resultado['raio_eficiente']:.6f})\n")
-            f.write(f"  Razão:      {estatisticas['razoes'][i]:.3f} ± {estatisticas['desvios_razoes'][i]:.3f}\n")
+            for j, nome in enumerate(algoritmos):
+                f.write(f"  {rotulos[j] + ':':<{largura}} {estatisticas['medias'][j][i]:.6f}s ± {estatisticas['desvios'][j][i]:.6f}s")
+                f.write(f" (raio: {resultado[f'raio_{nome}']:.6f})\n")
+            for k in range(len(pares)):
+                f.write(f"  {_nome_razao(k) + ':':<11} {estatisticas['razoes_pares'][k][i]:.3f} ± {estatisticas['desvios_razoes_pares'][k][i]:.3f}\n")
+            medianas = ", ".join(f"{rotulos[j]} {estatisticas['medianas'][j][i]:.6f}s (MAD {estatisticas['mad'][j][i]:.6f}s)"
+                                 for j in range(len(algoritmos)))
+            f.write(f"  Mediana:    {medianas}\n")
+            if estatisticas["medianas_cpu"] is not None:
+                cpu = ", ".join(f"{rotulos[j]} {estatisticas['medianas_cpu'][j][i]:.6f}s" for j in range(len(algoritmos)))
+                f.write(f"  CPU:        {cpu}\n")
+            if estatisticas["memoria"] is not None:
+                for medida, valores in estatisticas["memoria"].items():
+                    texto = ", ".join(f"{rotulos[j]} {_formatar_memoria(medida, valores[j][i])}"
+                                      for j in range(len(algoritmos)))
+                    f.write(f"  {MEDIDAS_MEMORIA[medida] + ':':<21} {texto}\n")
             
-            # Calcula diferenças dos raios para este teste
-            raio_heur = resultado['raio_heuristico']
-            raio_ef = resultado['raio_eficiente']
-            diff_abs = raio_heur - raio_ef
-            diff_perc = (diff_abs / raio_ef) * 100 if raio_ef > 0 else 0
-            
-            f.write(f"  Dif. raio:  {diff_abs:+.6f} ({diff_perc:+.2f}%)\n")
-            
-            # Verifica se há erro (raio heurístico menor que eficiente)
-            if raio_heur < raio_ef:
-                f.write(f"  ERRO: Raio heurístico menor que eficiente!\n")
+            # Calcula diferenças dos raios para este teste (em relação ao algoritmo de referência)
+            for j in outros:
+                raio = estatisticas["raios"][j][i]
+                raio_ref = estatisticas["raios"][referencia][i]
+                diff_abs = raio - raio_ref
+                diff_perc = estatisticas["diferencas_perc"][j][i]
+                f.write(f"  {_nome_dif(j) + ':':<11} {diff_abs:+.6f} ({diff_perc:+.2f}%)\n")
+                
+                # Verifica se há erro (raio menor que o mínimo, para quem envolve todos os pontos)
+                if raio < raio_ref - _TOL_RAIOS * raio_ref and descrever_algoritmo(algoritmos[j])["envolve_todos"]:
+                    f.write(f"  ERRO: Raio {rotulos[j].lower()} menor que {rotulos[referencia].lower()}!\n")
         
         # Análise geral
         f.write("\nANÁLISE DOS TEMPOS DE EXECUÇÃO:\n")
         f.write("-" * 30 + "\n")
         
-        media_razao = np.mean(estatisticas["razoes"])
-        
-        f.write(f"Razão média (Eficiente/Heurístico): {media_razao:.3f}\n")
+        for k, (i, j) in enumerate(pares):
+            media_razao = np.mean(estatisticas["razoes_pares"][k])
+            f.write(f"Razão média ({rotulos[j]}/{rotulos[i]}): {media_razao:.3f}\n")
         
         # Análise dos raios
         f.write("\nANÁLISE DOS RAIOS:\n")
         f.write("-" * 30 + "\n")
         
-        # Calcula estatísticas dos raios
-        raios_heuristico = [r["raio_heuristico"] for r in dados["resultados"]]
-        raios_eficiente = [r["raio_eficiente"] for r in dados["resultados"]]
-        
-        # Usa as diferenças percentuais já calculadas
-        diferencas_abs = []
-        diferencas_perc = estatisticas["diferencas_perc_raios"]
-        erros_encontrados = []
-        
-        for i in range(len(raios_heuristico)):
-            raio_heur = raios_heuristico[i]
-            raio_ef = raios_eficiente[i]
-            diff_abs = raio_heur - raio_ef
+        for j in outros:
+            if len(outros) > 1:
+                f.write(f"{rotulos[j]} vs {rotulos[referencia]}:\n")
             
-            diferencas_abs.append(diff_abs)
+            # Usa as diferenças já calculadas
+            diferencas_abs = estatisticas["raios"][j] - estatisticas["raios"][referencia]
+            diferencas_perc = estatisticas["diferencas_perc"][j]
+            envolve_todos = descrever_algoritmo(algoritmos[j])["envolve_todos"]
+            menores = diferencas_abs < -_TOL_RAIOS * estatisticas["raios"][referencia]
+            erros_encontrados = (np.flatnonzero(menores) + 1).tolist() if envolve_todos else []
             
-            # Verifica se há erro
-            if raio_heur < raio_ef:
-                erros_encontrados.append(i+1)
-        
-        # Estatísticas das diferenças
-        if diferencas_abs:
-            media_diff_abs = np.mean(diferencas_abs)
-            media_diff_perc = np.mean(diferencas_perc)
-            min_diff_abs = min(diferencas_abs)
-            max_diff_abs = max(diferencas_abs)
-            min_diff_perc = min(diferencas_perc)
-            max_diff_perc = max(diferencas_perc)
-            
-            f.write(f"Diferença absoluta média: {media_diff_abs:+.6f}\n")
-            f.write(f"Diferença percentual média: {media_diff_perc:+.2f}%\n")
-            f.write(f"Variação absoluta: [{min_diff_abs:+.6f}, {max_diff_abs:+.6f}]\n")
-            f.write(f"Variação percentual: [{min_diff_perc:+.2f}%, {max_diff_perc:+.2f}%]\n")
+            # Estatísticas das diferenças
+            if len(diferencas_abs):
+                media_diff_perc = np.mean(diferencas_perc)
+                f.write(f"Diferença absoluta média: {np.mean(diferencas_abs):+.6f}\n")
+                f.write(f"Diferença percentual média: {media_diff_perc:+.2f}%\n")
+                f.write(f"Variação absoluta: [{min(diferencas_abs):+.6f}, {max(diferencas_abs):+.6f}]\n")
+                f.write(f"Variação percentual: [{min(diferencas_perc):+.2f}%, {max(diferencas_perc):+.2f}%]\n")
+                
+                # Interpretação
+                if media_diff_perc > 0:
+                    f.write(f"O algoritmo {rotulos[j].lower()} produziu círculos, em média, {media_diff_perc:.2f}% maiores.\n")
+                else:
+                    f.write(f"O algoritmo {rotulos[j].lower()} produziu círculos, em média, {abs(media_diff_perc):.2f}% menores.\n")
             
-            # Interpretação
-            if media_diff_perc > 0:
-                f.write(f"O algoritmo heurístico produziu círculos, em média, {media_diff_perc:.2f}% maiores.\n")
+            # Verificação de erros (algoritmos robustos deixam pontos de fora e podem ter raio menor)
+            if not envolve_todos:
+                f.write(f"Algoritmo que deixa pontos de fora: raio menor que o mínimo não é erro.\n")
+            elif erros_encontrados:
+                f.write(f"  ERROS ENCONTRADOS:\n")
+                f.write(f"  - Testes com raio {rotulos[j].lower()} menor que {rotulos[referencia].lower()}: {erros_encontrados}\n")
+                f.write(f"  - Total de erros: {len(erros_encontrados)}/{len(diferencas_abs)}\n")
+                f.write(f"  - Isso indica um problema no algoritmo {rotulos[j].lower()}!\n")
             else:
-                f.write(f"O algoritmo heurístico produziu círculos, em média, {abs(media_diff_perc):.2f}% menores.\n")
-        
-        # Verificação de erros
-        if erros_encontrados:
-            f.write(f"  ERROS ENCONTRADOS:\n")
-            f.write(f"  - Testes com raio heurístico menor que eficiente: {erros_encontrados}\n")
-            f.write(f"  - Total de erros: {len(erros_encontrados)}/{len(raios_heuristico)}\n")
-            f.write(f"  - Isso indica um problema no algoritmo heurístico!\n")
-        else:
-            f.write(f"Nenhum erro encontrado: todos os raios heurísticos são >= eficientes.\n")
+                f.write(f"Nenhum erro encontrado: todos os raios do algoritmo {rotulos[j].lower()} "
+                        f"são >= os do {rotulos[referencia].lower()}.\n")
         
         # Complexidade
         f.write("\nCOMPLEXIDADE ESTIMADA:\n")
         f.write("-" * 30 + "\n")
-        if estatisticas["complexidade_estimada_heur"] is not None:
-            f.write(f"  - Algoritmo Heurístico: O(n^{estatisticas['complexidade_estimada_heur']:.3f})\n")
-        else:
-            f.write("  - Algoritmo Heurístico: Não foi possível calcular\n")
-            
-        if estatisticas["complexidade_estimada_ef"] is not None:
-            f.write(f"  - Algoritmo Eficiente: O(n^{estatisticas['complexidade_estimada_ef']:.3f})\n")
-        else:
-            f.write("  - Algoritmo Eficiente: Não foi possível calcular\n")
+        for j, rotulo in enumerate(rotulos):
+            if len(estatisticas["numeros_pontos"]) >= 2:
+                ic = estatisticas["ic_expoentes"][j]
+                f.write(f"  - Algoritmo {rotulo}: O(n^{float(estatisticas['expoentes'][j]):.3f})")
+                f.write(f" (IC 95% bootstrap: [{ic[0]:.3f}, {ic[1]:.3f}])\n")
+            else:
+                f.write(f"  - Algoritmo {rotulo}: Não foi possível calcular\n")
+        
+        # Contadores internos x tempo (de onde vêm as medições lentas)
+        if estatisticas["contadores"] is not None:
+            f.write("\nCONTADORES INTERNOS:\n")
+            f.write("-" * 30 + "\n")
+            f.write("Média por chamada; ρ = correlação de Spearman com o tempo; lentas = medições acima do p95 do tempo.\n")
+            for nome, contagens in estatisticas["contadores"].items():
+                f.write(f"Algoritmo {rotulos[algoritmos.index(nome)]}:\n")
+                for i, n in enumerate(estatisticas["numeros_pontos"]):
+                    f.write(f"  {n} pontos:\n")
+                    for c in contagens["medias"]:
+                        if c == "pontos":
+                            continue
+                        f.write(f"    {c + ':':<22} {contagens['medias'][c][i]:12.1f}  ρ = {contagens['correlacoes'][c][i]:+.2f}"
+                                f"  (lentas {contagens['lentas'][c][i]:.1f} / demais {contagens['demais'][c][i]:.1f})\n")
+        
+        # Crescimento da memória com n (picos por chamada)
+        if estatisticas["ajustes_memoria"] is not None:
+            f.write("\nCOMPLEXIDADE ESTIMADA DA MEMÓRIA:\n")
+            f.write("-" * 30 + "\n")
+            for medida, (expoentes, _) in estatisticas["ajustes_memoria"].items():
+                f.write(f"{MEDIDAS_MEMORIA[medida]}:\n")
+                for j, rotulo in enumerate(rotulos):
+                    if np.isnan(expoentes[j]):
+                        f.write(f"  - Algoritmo {rotulo}: Não foi possível calcular\n")
+                    else:
+                        f.write(f"  - Algoritmo {rotulo}: O(n^{float(expoentes[j]):.3f})\n")
+            if "rss" in estatisticas["ajustes_memoria"]:
+                f.write("O pico de RSS não conta memória que o processo já tinha reservado e reaproveitou "
+                        "(tamanhos com pico 0 ficam fora do ajuste).\n")
     
     return nome_arquivo
 
@@ -504,4 +781,4 @@ def executar_analise(arquivo_json="dados.json"):
     print("\nAnálise concluída!")
 
 if __name__ == "__main__":
-    executar_analise()
+    executar_analise(sys.argv[1] if len(sys.argv) > 1 else "dados.json")
@@ -0,0 +1,65 @@
+import argparse
+import time
+from fontes_pontos import DISTRIBUICOES
+from medicao import _ler_status
+from leitura_pontos import (contar_pontos, circulo_eficiente_arquivo, circulo_heuristico_arquivo,
+                            gerar_arquivo_pontos)
+
+def _formatar_bytes(valor):
+    """Bytes em MiB, ou "n/d" quando o sistema não informa."""
+    return "n/d" if valor is None else f"{valor / 2**20:.1f} MiB"
+
+def processar_arquivo(arquivo, algoritmos=("eficiente", "heuristico"), seed=0, tamanho_bloco=1 << 20,
+                      num_direcoes=64, dtype='<f8'):
+    """
+    Calcula o círculo dos pontos de um arquivo (.npy ou bruto) lendo-o em blocos mapeados.
+    Mostra, para cada algoritmo, o círculo, o tempo e o pico de RSS do processo até ali.
+    """
+    num_pontos = contar_pontos(arquivo, dtype)
+    print(f"Arquivo: {arquivo} ({num_pontos} pontos, blocos de {tamanho_bloco})")
+    print("=" * 50)
+    resultados = {}
+    for algoritmo in algoritmos:
+        inicio = time.perf_counter()
+        if algoritmo == "eficiente":
+            circulo = circulo_eficiente_arquivo(arquivo, seed=seed, tamanho_bloco=tamanho_bloco, dtype=dtype)
+        else:
+            circulo = circulo_heuristico_arquivo(arquivo, num_direcoes=num_direcoes, tamanho_bloco=tamanho_bloco,
+                                                 dtype=dtype)
+        duracao = time.perf_counter() - inicio
+        resultados[algoritmo] = circulo
+        print(f"{algoritmo}:")
+        print(f"  Centro: ({circulo.centro.x:.17g}, {circulo.centro.y:.17g})")
+        print(f"  Raio: {circulo.raio:.17g}")
+        print(f"  Tempo: {duracao:.3f} s")
+        print(f"  Pico de RSS do processo: {_formatar_bytes(_ler_status('VmHWM'))}")
+    return resultados
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Círculo mínimo de um arquivo de pontos grande (.npy ou float64 bruto), com memória limitada.")
+    parser.add_argument("arquivo",
+                        help="arquivo .npy com array (n, 2) de float64 ou arquivo bruto com pares x, y em float64")
+    parser.add_argument("--algoritmos", nargs="+", default=["eficiente", "heuristico"],
+                        choices=("eficiente", "heuristico"),
+                        help="algoritmos executados (padrão: eficiente heuristico)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed do embaralhamento do eficiente (padrão: 0)")
+    parser.add_argument("--bloco", type=int, default=1 << 20,
+                        help="pontos por bloco mapeado; o RSS cresce com ele (padrão: 1048576)")
+    parser.add_argument("--direcoes", type=int, default=64,
+                        help="direções dos extremos usados para refinar o heurístico; 0 desliga (padrão: 64)")
+    parser.add_argument("--dtype", default="<f8",
+                        help="tipo dos arquivos brutos: <f8 (little-endian, padrão) ou >f8 (big-endian)")
+    parser.add_argument("--gerar", type=int, default=None, metavar="N",
+                        help="antes de processar, grava N pontos no arquivo (formato bruto), bloco a bloco")
+    parser.add_argument("--distribuicao", default="gaussiana", choices=DISTRIBUICOES,
+                        help="distribuição dos pontos gerados com --gerar (padrão: gaussiana)")
+    args = parser.parse_args()
+    if args.gerar is not None:
+        if args.dtype != "<f8":
+            parser.error("--gerar grava sempre float64 little-endian; não use --dtype junto")
+        gerar_arquivo_pontos(args.arquivo, args.gerar, distribuicao=args.distribuicao, seed=42,
+                             tamanho_bloco=args.bloco)
+    processar_arquivo(args.arquivo, algoritmos=args.algoritmos, seed=args.seed, tamanho_bloco=args.bloco,
+                      num_direcoes=args.direcoes, dtype=args.dtype)
@@ -1,9 +1,17 @@
+import argparse
+import multiprocessing
+import os
+import queue
 import random
 import json
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from geometria import Ponto, Circulo
-from algoritmos.heuristico import calcular_circulo_heuristico
-from algoritmos.eficiente import calcular_circulo_eficiente
+from armazenamento import salvar_dados_binario
+from medicao import medir, medir_memoria
+from fontes_pontos import DISTRIBUICOES, gerar_pontos
+from algoritmos.cache import CacheResultados
+from algoritmos.registro import executar_algoritmo, nomes_algoritmos, obter_algoritmo
 
 def gerar_pontos_gaussiana(n=100, x_min=-1, x_max=1, y_min=-1, y_max=1, sigma=0.1):
     """
@@ -22,20 +30,452 @@ def gerar_pontos_gaussiana(n=100, x_min=-1, x_max=1, y_min=-1, y_max=1, sigma=0.
     
     return pontos
 
-def executar_testes():
+# Cache, por processo, dos pontos de cada tamanho (os workers reaproveitam entre jobs)
+_cache_pontos = {}
+
+def _pontos_do_teste(num_pontos, config):
+    """
+    Gera (ou devolve do cache do processo) os pontos de um teste.
+    Usa sempre a seed 42, então os pontos são os mesmos em qualquer processo.
+    Com config["distribuicao"] = "legado" (padrão) usa gerar_pontos_gaussiana, como nas coletas
+    antigas; com outra distribuição usa o gerador vetorizado de fontes_pontos (array (n, 2)).
+    """
+    if num_pontos not in _cache_pontos:
+        _cache_pontos.clear()
+        distribuicao = config.get("distribuicao", "legado")
+        if distribuicao == "legado":
+            random.seed(42)
+            _cache_pontos[num_pontos] = gerar_pontos_gaussiana(
+                num_pontos, config["x_min"], config["x_max"], config["y_min"], config["y_max"], config["sigma"])
+        else:
+            parametros = {"sigma": config["sigma"]} if distribuicao == "gaussiana" else {}
+            _cache_pontos[num_pontos] = gerar_pontos(
+                distribuicao, num_pontos, seed=42,
+                limites=(config["x_min"], config["x_max"], config["y_min"], config["y_max"]), **parametros)
+    return _cache_pontos[num_pontos]
+
+# Algoritmos medidos por padrão (nomes do registro em algoritmos/registro.py),
+# na ordem em que aparecem no dados.json
+ALGORITMOS = ["heuristico", "eficiente"]
+
+def _job_raios(num_pontos, config, algoritmos):
+    """Calcula os raios de um teste para os algoritmos dados (são determinísticos), como na execução serial."""
+    pontos = _pontos_do_teste(num_pontos, config)
+    registro = {"tipo": "raios", "num_pontos": num_pontos}
+    random.seed(42)
+    for nome in algoritmos:
+        registro[f"raio_{nome}"] = executar_algoritmo(nome, pontos, 42).raio
+    return registro
+
+def _contar_eventos(nome_algoritmo, pontos, inicio, fim):
+    """
+    Contadores internos do algoritmo para as medições [inicio, fim), um valor por medição e por
+    contador. Cada chamada repete a seed da medição cronometrada (mesma execução), mas fora
+    do cronômetro, então os tempos não mudam.
+    """
+    eventos = {}
+    for medicao in range(inicio, fim):
+        contadores = {}
+        executar_algoritmo(nome_algoritmo, pontos, 42 + medicao, contadores=contadores)
+        for chave, valor in contadores.items():
+            eventos.setdefault(chave, []).append(valor)
+    return eventos
+
+def _com_contadores(nome_algoritmo, config):
+    """Diz se a coleta deve guardar os contadores internos deste algoritmo."""
+    return config.get("contadores", False) and obter_algoritmo(nome_algoritmo)["contadores"]
+
+def _job_medicoes(num_pontos, nome_algoritmo, inicio, fim, config):
+    """
+    Mede as medições [inicio, fim) de um algoritmo para um tamanho, com um warm-up antes.
+    Com config["contadores"], guarda também os contadores internos de cada medição.
+    """
+    pontos = _pontos_do_teste(num_pontos, config)
+    _ = executar_algoritmo(nome_algoritmo, pontos, 42)
+
+    tempos = []
+    for medicao in range(inicio, fim):
+        random.seed(42 + medicao)
+        inicio_medicao = time.perf_counter()
+        _ = executar_algoritmo(nome_algoritmo, pontos, 42 + medicao)
+        tempos.append(time.perf_counter() - inicio_medicao)
+    registro = {
+        "tipo": "medicoes",
+        "num_pontos": num_pontos,
+        "algoritmo": nome_algoritmo,
+        "inicio": inicio,
+        "tempos": tempos
+    }
+    if _com_contadores(nome_algoritmo, config):
+        registro["contadores"] = _contar_eventos(nome_algoritmo, pontos, inicio, fim)
+    return registro
+
+def _job_medicoes_adaptativo(num_pontos, nome_algoritmo, config):
+    """
+    Mede um algoritmo para um tamanho com o motor adaptativo de medicao.py: várias chamadas por
+    amostra nos casos rápidos, GC desligado e parada quando o IC da mediana fica estreito.
+    """
+    pontos = _pontos_do_teste(num_pontos, config)
+    _ = executar_algoritmo(nome_algoritmo, pontos, 42)
+
+    parametros = {k: v for k, v in config["medicao"].items() if k != "modo"}
+    medida = medir(lambda i: executar_algoritmo(nome_algoritmo, pontos, 42 + i), **parametros)
+    return {
+        "tipo": "medicoes",
+        "num_pontos": num_pontos,
+        "algoritmo": nome_algoritmo,
+        "inicio": 0,
+        "tempos": medida["tempos"],
+        "tempos_cpu": medida["tempos_cpu"],
+        "chamadas": medida["chamadas"]
+    }
+
+def _medir_memoria_processo(num_pontos, nome_algoritmo, config):
+    """Gera os pontos e mede a memória de uma chamada (executada em um processo novo)."""
+    pontos = _pontos_do_teste(num_pontos, config)
+    return medir_memoria(lambda: executar_algoritmo(nome_algoritmo, pontos, 42))
+
+def _job_memoria(num_pontos, nome_algoritmo, config):
+    """
+    Mede a memória de uma chamada de um algoritmo para um tamanho (pico de RSS, pico do
+    tracemalloc e blocos que continuam alocados).
+    A medida roda em um processo novo (spawn): num processo que já executou os algoritmos, a
+    memória liberada pelas chamadas anteriores continua no RSS e é reaproveitada, e o pico
+    de RSS sairia perto de zero.
+    """
+    contexto = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=contexto) as pool:
+        medida = pool.submit(_medir_memoria_processo, num_pontos, nome_algoritmo, config).result()
+    registro = {"tipo": "memoria", "num_pontos": num_pontos, "algoritmo": nome_algoritmo}
+    registro.update(medida)
+    return registro
+
+def _gerar_jobs(numeros_pontos, config, tamanho_lote, registros=()):
+    """
+    Lista os jobs (função, argumentos) que faltam para completar os testes.
+    Raios e medições já presentes em registros (de um checkpoint) não são refeitos.
+    Os tamanhos maiores vêm primeiro para equilibrar a carga entre processos.
+    No modo adaptativo há um job por (tamanho, algoritmo), que decide sozinho quantas amostras medir.
+    Com config["memoria"], há também um job de memória por (tamanho, algoritmo).
+    """
+    num_medicoes = config["num_medicoes"]
+    algoritmos = config["algoritmos"]
+    com_raios = {}
+    for r in registros:
+        if r["tipo"] == "raios":
+            com_raios.setdefault(r["num_pontos"], set()).update(
+                chave[len("raio_"):] for chave in r if chave.startswith("raio_"))
+    feitas = {}
+    for r in registros:
+        if r["tipo"] == "medicoes":
+            chave = (r["num_pontos"], r["algoritmo"])
+            feitas.setdefault(chave, set()).update(range(r["inicio"], r["inicio"] + len(r["tempos"])))
+    com_memoria = {(r["num_pontos"], r["algoritmo"]) for r in registros if r["tipo"] == "memoria"}
+
+    jobs = []
+    for n in sorted(numeros_pontos, reverse=True):
+        sem_raio = [nome for nome in algoritmos if nome not in com_raios.get(n, ())]
+        if sem_raio:
+            jobs.append((_job_raios, (n, config, sem_raio)))
+        for nome in algoritmos:
+            if config.get("memoria") and (n, nome) not in com_memoria:
+                jobs.append((_job_memoria, (n, nome, config)))
+            if _adaptativo(config):
+                if (n, nome) not in feitas:
+                    jobs.append((_job_medicoes_adaptativo, (n, nome, config)))
+                continue
+            ja_feitas = feitas.get((n, nome), ())
+            # Agrupa as medições que faltam em lotes contíguos de até tamanho_lote
+            lote = []
+            for m in range(num_medicoes):
+                if m in ja_feitas:
+                    continue
+                if lote and (m != lote[-1] + 1 or len(lote) == tamanho_lote):
+                    jobs.append((_job_medicoes, (n, nome, lote[0], lote[-1] + 1, config)))
+                    lote = []
+                lote.append(m)
+            if lote:
+                jobs.append((_job_medicoes, (n, nome, lote[0], lote[-1] + 1, config)))
+    return jobs
+
+def _adaptativo(config):
+    """Diz se a configuração usa o motor de medição adaptativo."""
+    return config.get("medicao", {}).get("modo") == "adaptativo"
+
+def _medicoes_exigidas(config):
+    """Medições que cada (tamanho, algoritmo) precisa ter; None no modo adaptativo (número variável)."""
+    return None if _adaptativo(config) else config["num_medicoes"]
+
+def _fixar_cpu(cpus_livres):
+    """Inicializador dos workers: prende cada processo a uma CPU própria (quando o SO permite)."""
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            cpu = cpus_livres.get_nowait()
+        except queue.Empty:
+            print(f"Aviso: sem CPU livre para o worker {os.getpid()}; ele roda sem afinidade fixa.")
+            return
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except OSError as erro:
+            print(f"Aviso: não foi possível prender o worker {os.getpid()} à CPU {cpu} ({erro}); "
+                  f"ele roda sem afinidade fixa.")
+
+def _rodar_jobs(jobs, workers):
+    """
+    Executa os jobs e devolve os registros à medida que ficam prontos.
+    Com workers > 1 usa um pool de processos, cada um preso a uma CPU.
+    """
+    if workers <= 1:
+        for concluidos, (funcao, args) in enumerate(jobs, 1):
+            yield funcao(*args)
+            print(f"  Jobs concluídos: {concluidos}/{len(jobs)}", end="\r")
+        print()
+        return
+
+    cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count() or 1))
+    gerenciador = multiprocessing.Manager()
+    cpus_livres = gerenciador.Queue()
+    for cpu in cpus[:workers]:
+        cpus_livres.put(cpu)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_fixar_cpu, initargs=(cpus_livres,)) as pool:
+        futuros = [pool.submit(funcao, *args) for funcao, args in jobs]
+        for concluidos, futuro in enumerate(as_completed(futuros), 1):
+            yield futuro.result()
+            print(f"  Jobs concluídos: {concluidos}/{len(futuros)}", end="\r")
+    gerenciador.shutdown()
+    print()
+
+def _montar_resultados(registros, numeros_pontos, algoritmos, num_medicoes=None):
+    """
+    Junta os registros (raios e lotes de medições) no formato de "resultados" do dados.json.
+    Só entram os tamanhos com raios e com as medições 0..num_medicoes-1 de todos os algoritmos;
+    medições além de num_medicoes (checkpoint de uma coleta com mais medições) ficam de fora.
+    No modo adaptativo (num_medicoes=None) basta o registro de medições de cada algoritmo.
+    """
+    raios = {}
+    lotes = {}
+    memoria = {}
+    for r in registros:
+        if r["tipo"] == "raios":
+            raios.setdefault(r["num_pontos"], {}).update(r)
+        elif r["tipo"] == "memoria":
+            memoria[(r["num_pontos"], r["algoritmo"])] = r
+        else:
+            lotes.setdefault((r["num_pontos"], r["algoritmo"]), {})[r["inicio"]] = r
+
+    def _completo(n, nome):
+        if f"raio_{nome}" not in raios.get(n, {}) or (n, nome) not in lotes:
+            return False
+        if num_medicoes is None:
+            return True
+        feitas = set()
+        for inicio, r in lotes[(n, nome)].items():
+            feitas.update(range(inicio, inicio + len(r["tempos"])))
+        return feitas.issuperset(range(num_medicoes))
+
+    # Os lotes não se sobrepõem: em ordem de início, a lista cortada em num_medicoes tem
+    # exatamente as medições 0..num_medicoes-1
+    corte = slice(None) if num_medicoes is None else slice(num_medicoes)
+    resultados = []
+    for n in sorted(numeros_pontos):
+        if not all(_completo(n, nome) for nome in algoritmos):
+            continue
+        resultado_teste = {"num_pontos": n}
+        for nome in algoritmos:
+            resultado_teste[f"tempos_{nome}"] = [
+                t for inicio in sorted(lotes[(n, nome)]) for t in lotes[(n, nome)][inicio]["tempos"]][corte]
+        for nome in algoritmos:
+            resultado_teste[f"raio_{nome}"] = raios[n][f"raio_{nome}"]
+        # Medições adaptativas: tempo de CPU por chamada e chamadas por amostra
+        for nome in algoritmos:
+            registros_alg = [lotes[(n, nome)][inicio] for inicio in sorted(lotes[(n, nome)])]
+            if all("tempos_cpu" in r for r in registros_alg):
+                resultado_teste[f"tempos_cpu_{nome}"] = [t for r in registros_alg for t in r["tempos_cpu"]]
+                resultado_teste[f"chamadas_{nome}"] = registros_alg[0]["chamadas"]
+            # Contadores internos, medição a medição (só se todos os lotes os têm)
+            if all("contadores" in r for r in registros_alg):
+                resultado_teste[f"contadores_{nome}"] = {
+                    chave: [v for r in registros_alg for v in r["contadores"][chave]][corte]
+                    for chave in registros_alg[0]["contadores"]}
+        # Memória, quando medida
+        for nome in algoritmos:
+            if (n, nome) in memoria:
+                resultado_teste.update(_chaves_memoria(nome, memoria[(n, nome)]))
+        resultados.append(resultado_teste)
+    return resultados
+
+def _chaves_memoria(nome, medida):
+    """Chaves do dados.json com a medida de memória de um algoritmo."""
+    return {
+        f"memoria_rss_{nome}": medida["pico_rss"],
+        f"memoria_pico_{nome}": medida["pico_tracemalloc"],
+        f"memoria_blocos_{nome}": medida["blocos"]
+    }
+
+def _executar_testes_paralelo(numeros_pontos, config, workers, tamanho_lote=100):
+    """
+    Distribui os jobs (tamanho, algoritmo, lote de medições) entre um pool de processos
+    e junta os resultados no mesmo formato da execução serial.
+    """
+    registros = list(_rodar_jobs(_gerar_jobs(numeros_pontos, config, tamanho_lote), workers))
+    return _montar_resultados(registros, numeros_pontos, config["algoritmos"], _medicoes_exigidas(config))
+
+def _carregar_checkpoint(arquivo_checkpoint, config):
+    """
+    Lê os registros de um checkpoint (um JSON por linha). A primeira linha guarda a configuração
+    dos pontos, do modo de medição e dos contadores, que precisa ser a mesma da execução atual. Uma última linha incompleta
+    (queda no meio da escrita) é removida do arquivo.
+    """
+    if not os.path.exists(arquivo_checkpoint):
+        return []
+    with open(arquivo_checkpoint, 'r', encoding='utf-8') as f:
+        linhas = f.read().splitlines()
+
+    registros = []
+    for linha in linhas:
+        try:
+            registros.append(json.loads(linha))
+        except json.JSONDecodeError:
+            # Descarta a linha incompleta para que os próximos registros não sejam colados nela
+            with open(arquivo_checkpoint, 'w', encoding='utf-8') as f:
+                f.writelines(json.dumps(r) + "\n" for r in registros)
+            break
+    if not registros:
+        return []
+
+    config_salva = registros[0]["configuracao"]
+    chaves = ("x_min", "x_max", "y_min", "y_max", "sigma", "distribuicao")
+    if any(config_salva.get(k, "legado") != config.get(k, "legado") for k in chaves):
+        raise ValueError(f"O checkpoint {arquivo_checkpoint} foi gerado com outra configuração de pontos: {config_salva}")
+    if config_salva.get("medicao", {"modo": "fixo"})["modo"] != config.get("medicao", {"modo": "fixo"})["modo"]:
+        raise ValueError(f"O checkpoint {arquivo_checkpoint} foi gerado com outro modo de medição: {config_salva.get('medicao')}")
+    # Os lotes já salvos não são refeitos: com ou sem contadores, todos precisam ter sido medidos igual
+    if bool(config_salva.get("contadores", False)) != bool(config.get("contadores", False)):
+        situacao = "com" if config_salva.get("contadores") else "sem"
+        raise ValueError(f"O checkpoint {arquivo_checkpoint} foi gerado {situacao} --contadores; "
+                         f"retome com a mesma opção ou use outro arquivo de checkpoint.")
+    return registros[1:]
+
+def _executar_testes_checkpoint(numeros_pontos, config, workers, arquivo_checkpoint, tamanho_lote=50):
+    """
+    Executa os testes gravando cada lote concluído em um arquivo de checkpoint (só acréscimos).
+    Ao reiniciar, o que já está no checkpoint é pulado; também permite estender um conjunto
+    de dados com novos tamanhos ou mais medições sem refazer os antigos.
+    Os resultados incluem todos os tamanhos do checkpoint, não só os da execução atual; os que
+    ficaram incompletos (queda no meio, ou menos medições que num_medicoes) são completados.
+    """
+    registros = _carregar_checkpoint(arquivo_checkpoint, config)
+    todos_tamanhos = set(numeros_pontos) | {r["num_pontos"] for r in registros}
+    jobs = _gerar_jobs(todos_tamanhos, config, tamanho_lote, registros)
+    print(f"Checkpoint: {len(registros)} registros já salvos, {len(jobs)} jobs pendentes")
+
+    novo_arquivo = not registros
+    with open(arquivo_checkpoint, 'a' if not novo_arquivo else 'w', encoding='utf-8') as f:
+        if novo_arquivo:
+            f.write(json.dumps({"configuracao": config}) + "\n")
+        for registro in _rodar_jobs(jobs, workers):
+            f.write(json.dumps(registro) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+            registros.append(registro)
+
+    return _montar_resultados(registros, todos_tamanhos, config["algoritmos"], _medicoes_exigidas(config))
+
+def _executar_testes_serial(numeros_pontos, config):
+    """
+    Executa os testes em um único processo, alternando os algoritmos a cada medição.
+    """
+    algoritmos = config["algoritmos"]
+    resultados = []
+
+    for i, num_pontos in enumerate(numeros_pontos):
+        print(f"Teste {i+1}/{len(numeros_pontos)}: {num_pontos} pontos")
+        
+        # Gera pontos uma vez (mesmos pontos para todas as medições)
+        pontos = _pontos_do_teste(num_pontos, config)
+        
+        # Warm-up: executa cada algoritmo uma vez antes das medições.
+        # Passa pelo cache para que os raios abaixo (mesmas chamadas) não recalculem nada.
+        cache = CacheResultados(max_entradas=len(algoritmos))
+        memoizados = {nome: cache.memoizar(obter_algoritmo(nome)["funcao"], nome=nome) for nome in algoritmos}
+        for nome in algoritmos:
+            _ = memoizados[nome](pontos, 42)
+        
+        # Listas para armazenar os tempos de execução
+        tempos = {nome: [] for nome in algoritmos}
+        
+        # Calcula os raios uma única vez (são determinísticos)
+        random.seed(42)
+        raios = {nome: memoizados[nome](pontos, 42).raio for nome in algoritmos}
+        
+        for medicao in range(config["num_medicoes"]):
+            random.seed(42 + medicao)
+            for nome in algoritmos:
+                inicio = time.perf_counter()
+                _ = executar_algoritmo(nome, pontos, 42 + medicao)
+                tempos[nome].append(time.perf_counter() - inicio)
+        
+        # Salva os dados brutos deste teste
+        resultado_teste = {"num_pontos": num_pontos}
+        for nome in algoritmos:
+            resultado_teste[f"tempos_{nome}"] = tempos[nome]
+        for nome in algoritmos:
+            resultado_teste[f"raio_{nome}"] = raios[nome]
+        
+        # Contadores internos de cada medição (execuções repetidas fora do cronômetro)
+        for nome in algoritmos:
+            if _com_contadores(nome, config):
+                resultado_teste[f"contadores_{nome}"] = _contar_eventos(nome, pontos, 0, config["num_medicoes"])
+        
+        # Memória: uma chamada por algoritmo, cada uma em um processo novo
+        if config.get("memoria"):
+            for nome in algoritmos:
+                resultado_teste.update(_chaves_memoria(nome, _job_memoria(num_pontos, nome, config)))
+        
+        resultados.append(resultado_teste)
+
+    return resultados
+
+def executar_testes(workers=1, checkpoint=None, num_medicoes=1000, expoente_min=10, expoente_max=20,
+                    arquivo_saida="dados.json", distribuicao="legado", algoritmos=None,
+                    adaptativo=False, precisao=0.03, tempo_amostra=0.005, tempo_maximo=10.0, memoria=False,
+                    contadores=False):
     """
-    Executa os testes e salva os dados em arquivo JSON.
+    Executa os testes e salva os dados em arquivo JSON
+    (ou no formato binário de armazenamento.py, se arquivo_saida terminar em .bin).
+    Com workers > 1, as medições são distribuídas entre processos (ver _executar_testes_paralelo).
+    Com checkpoint, cada lote concluído é gravado no arquivo indicado e uma nova execução
+    continua de onde a anterior parou (ver _executar_testes_checkpoint).
+    algoritmos: nomes do registro (algoritmos/registro.py) a medir; padrão ALGORITMOS.
+    Com adaptativo, cada (tamanho, algoritmo) é medido pelo motor de medicao.py até o IC 95% da
+    mediana ficar dentro de ±precisao ou gastar tempo_maximo segundos (num_medicoes passa a ser
+    o máximo de amostras).
+    Com memoria, mede também uma chamada de cada algoritmo por tamanho quanto à memória
+    (ver medicao.medir_memoria); as medidas ficam em memoria_rss_<nome>, memoria_pico_<nome>
+    e memoria_blocos_<nome>.
+    Com contadores, guarda os contadores internos (recomeços, testes de pertencimento...) de
+    cada medição dos algoritmos que os têm, em contadores_<nome>; só no modo fixo, em que cada
+    tempo corresponde a uma seed.
+    Algoritmos que criam os próprios processos (como "paralelo") só podem ser medidos com workers=1.
     """
+    if contadores and adaptativo:
+        raise ValueError("Os contadores precisam do modo fixo de medição (um tempo por seed).")
+    algoritmos = list(algoritmos or ALGORITMOS)
+    for nome in algoritmos:
+        if obter_algoritmo(nome)["usa_processos"] and workers > 1:  # também falha cedo com nome desconhecido
+            raise ValueError(f"O algoritmo {nome!r} cria os próprios processos e precisa ser medido com workers=1 "
+                             f"(com vários workers, cada um fica preso a uma CPU e os processos dele também).")
     # Configuração
     X_MIN, X_MAX = -1, 1
     Y_MIN, Y_MAX = -1, 1
     SIGMA = 0.1
-    NUM_MEDICOES = 1000
+    NUM_MEDICOES = num_medicoes
     
     # Lista de pontos para teste
     numeros_pontos = []
-    n = 2**10
-    while n <= 2**20:
+    n = 2**expoente_min
+    while n <= 2**expoente_max:
         numeros_pontos.append(n)
         n *= 2
     
@@ -47,7 +487,15 @@ def executar_testes():
             "y_min": Y_MIN,
             "y_max": Y_MAX,
             "sigma": SIGMA,
-            "num_medicoes": NUM_MEDICOES
+            "num_medicoes": NUM_MEDICOES,
+            "distribuicao": distribuicao,
+            "algoritmos": algoritmos,
+            "medicao": ({"modo": "adaptativo", "precisao": precisao, "tempo_amostra": tempo_amostra,
+                         "min_amostras": min(10, NUM_MEDICOES), "max_amostras": NUM_MEDICOES,
+                         "tempo_maximo": tempo_maximo}
+                        if adaptativo else {"modo": "fixo"}),
+            "memoria": memoria,
+            "contadores": contadores
         },
         "resultados": []
     }
@@ -55,65 +503,72 @@ def executar_testes():
     print("Iniciando coleta de dados de performance...")
     print(f"Total de testes: {len(numeros_pontos)}")
     print(f"Medições por teste: {NUM_MEDICOES}")
+    print(f"Algoritmos: {', '.join(algoritmos)}")
     print("=" * 50)
+
+    if checkpoint is not None:
+        dados_teste["resultados"] = _executar_testes_checkpoint(numeros_pontos, dados_teste["configuracao"], workers, checkpoint)
+    elif workers > 1 or adaptativo:
+        if workers > 1:
+            print(f"Executando em paralelo com {workers} processos...")
+        dados_teste["resultados"] = _executar_testes_paralelo(numeros_pontos, dados_teste["configuracao"], workers)
+    else:
+        dados_teste["resultados"] = _executar_testes_serial(numeros_pontos, dados_teste["configuracao"])
     
-    for i, num_pontos in enumerate(numeros_pontos):
-        print(f"Teste {i+1}/{len(numeros_pontos)}: {num_pontos} pontos")
-        
-        # Gera pontos uma vez (mesmos pontos para todas as medições)
-        random.seed(42)
-        pontos = gerar_pontos_gaussiana(num_pontos, X_MIN, X_MAX, Y_MIN, Y_MAX, SIGMA)
-        
-        # Warm-up: executa cada algoritmo uma vez antes das medições
-        _ = calcular_circulo_heuristico(pontos)
-        _ = calcular_circulo_eficiente(pontos, seed=42)
-        
-        # Listas para armazenar os tempos de execução
-        tempos_heuristico = []
-        tempos_eficiente = []
-        
-        # Calcula os raios uma única vez (são determinísticos)
-        random.seed(42)
-        circulo_heuristico = calcular_circulo_heuristico(pontos)
-        circulo_eficiente = calcular_circulo_eficiente(pontos, seed=42)
-        raio_heuristico = circulo_heuristico.raio
-        raio_eficiente = circulo_eficiente.raio
-        
-        for medicao in range(NUM_MEDICOES):
-            # Testa algoritmo heurístico
-            random.seed(42 + medicao)
-            inicio_heuristico = time.perf_counter()
-            _ = calcular_circulo_heuristico(pontos)
-            fim_heuristico = time.perf_counter()
-            tempo_heuristico = fim_heuristico - inicio_heuristico
-            tempos_heuristico.append(tempo_heuristico)
-            
-            # Testa algoritmo eficiente
-            inicio_eficiente = time.perf_counter()
-            _ = calcular_circulo_eficiente(pontos, seed=42 + medicao)
-            fim_eficiente = time.perf_counter()
-            tempo_eficiente = fim_eficiente - inicio_eficiente
-            tempos_eficiente.append(tempo_eficiente)
-        
-        # Salva os dados brutos deste teste
-        resultado_teste = {
-            "num_pontos": num_pontos,
-            "tempos_heuristico": tempos_heuristico,
-            "tempos_eficiente": tempos_eficiente,
-            "raio_heuristico": raio_heuristico,
-            "raio_eficiente": raio_eficiente
-        }
-        
-        dados_teste["resultados"].append(resultado_teste)
-    
-    # Salva os dados em arquivo JSON
-    nome_arquivo = "dados.json"
-    with open(nome_arquivo, 'w', encoding='utf-8') as f:
-        json.dump(dados_teste, f, indent=2, ensure_ascii=False)
+    # Salva os dados em arquivo JSON (ou binário)
+    nome_arquivo = arquivo_saida
+    if nome_arquivo.endswith(".bin"):
+        salvar_dados_binario(dados_teste, nome_arquivo)
+    else:
+        with open(nome_arquivo, 'w', encoding='utf-8') as f:
+            json.dump(dados_teste, f, indent=2, ensure_ascii=False)
     
     print("=" * 50)
     print(f"Dados salvos em: {nome_arquivo}")
     print("Coleta de dados concluída!")
 
 if __name__ == "__main__":
-    executar_testes()
+    parser = argparse.ArgumentParser(description="Coleta de dados de performance dos algoritmos de círculo mínimo.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="número de processos para as medições (padrão: 1, execução serial)")
+    parser.add_argument("--checkpoint", default=None,
+                        help="arquivo de checkpoint (JSON por linha); retoma/estende uma coleta interrompida")
+    parser.add_argument("--medicoes", type=int, default=1000,
+                        help="número de medições por teste (padrão: 1000)")
+    parser.add_argument("--expoente-min", type=int, default=10,
+                        help="menor tamanho testado é 2**expoente_min (padrão: 10)")
+    parser.add_argument("--expoente-max", type=int, default=20,
+                        help="maior tamanho testado é 2**expoente_max (padrão: 20)")
+    parser.add_argument("--saida", default="dados.json",
+                        help="arquivo de saída; termine em .bin para o formato binário (padrão: dados.json)")
+    parser.add_argument("--distribuicao", default="legado", choices=("legado",) + DISTRIBUICOES,
+                        help="distribuição dos pontos; \"legado\" usa gerar_pontos_gaussiana (padrão), "
+                             "as demais usam o gerador vetorizado de fontes_pontos.py")
+    parser.add_argument("--algoritmos", nargs="+", default=ALGORITMOS, choices=nomes_algoritmos(),
+                        metavar="NOME",
+                        help=f"algoritmos medidos (padrão: {' '.join(ALGORITMOS)}); "
+                             f"disponíveis: {', '.join(nomes_algoritmos())}")
+    parser.add_argument("--adaptativo", action="store_true",
+                        help="mede com repetição adaptativa (várias chamadas por amostra, GC desligado, "
+                             "para quando o IC 95%% da mediana fica dentro de ±precisão ou o tempo acaba); "
+                             "--medicoes vira o máximo de amostras")
+    parser.add_argument("--precisao", type=float, default=0.03,
+                        help="meia largura relativa do IC da mediana no modo adaptativo (padrão: 0.03)")
+    parser.add_argument("--tempo-amostra", type=float, default=0.005,
+                        help="duração mínima de uma amostra no modo adaptativo, em segundos (padrão: 0.005)")
+    parser.add_argument("--tempo-maximo", type=float, default=10.0,
+                        help="orçamento de tempo por tamanho e algoritmo no modo adaptativo, em segundos, "
+                             "respeitado depois de 10 amostras (padrão: 10)")
+    parser.add_argument("--memoria", action="store_true",
+                        help="mede também a memória de uma chamada por tamanho e algoritmo "
+                             "(pico de RSS, pico do tracemalloc e blocos alocados)")
+    parser.add_argument("--contadores", action="store_true",
+                        help="guarda os contadores internos (recomeços, testes de pertencimento...) de cada "
+                             "medição dos algoritmos que os têm, contados fora do cronômetro")
+    args = parser.parse_args()
+    executar_testes(workers=args.workers, checkpoint=args.checkpoint, num_medicoes=args.medicoes,
+                    expoente_min=args.expoente_min, expoente_max=args.expoente_max, arquivo_saida=args.saida,
+                    distribuicao=args.distribuicao, algoritmos=args.algoritmos,
+                    adaptativo=args.adaptativo, precisao=args.precisao, tempo_amostra=args.tempo_amostra,
+                    tempo_maximo=args.tempo_maximo, memoria=args.memoria,
+                    contadores=args.contadores)
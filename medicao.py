@@ -0,0 +1,168 @@
+# Medição de tempo com repetição adaptativa.
+# Cada amostra executa a função várias vezes seguidas (o bastante para durar pelo menos
+# tempo_amostra segundos) e guarda o tempo médio por chamada, de relógio (perf_counter) e de
+# CPU (process_time). O coletor de lixo fica desligado durante cada amostra.
+# As amostras param quando o intervalo de confiança (95%) da mediana fica estreito o bastante
+# (meia largura <= precisao × mediana), ou ao atingir max_amostras ou o orçamento de tempo.
+# Algoritmos randomizados (seed diferente a cada chamada) têm tempos bem espalhados e podem
+# não atingir a precisão; para eles o orçamento de tempo é o que limita a coleta.
+#
+# medir_memoria mede uma chamada quanto à memória: pico de RSS (Linux), pico do tracemalloc
+# (objetos Python e arrays NumPy) e blocos que continuam alocados depois da chamada.
+
+import gc
+import math
+import sys
+import time
+import tracemalloc
+
+def _calibrar(executar, tempo_amostra: float) -> int:
+    """Número de chamadas por amostra para que uma amostra dure pelo menos tempo_amostra."""
+    chamadas = 1
+    while True:
+        inicio = time.perf_counter()
+        for i in range(chamadas):
+            executar(i)
+        duracao = time.perf_counter() - inicio
+        if duracao >= tempo_amostra:
+            return chamadas
+        # Estima quantas chamadas faltam (com folga), sem crescer mais que 10x por vez
+        estimativa = chamadas * tempo_amostra * 1.2 / max(duracao, 1e-9)
+        chamadas = max(chamadas + 1, min(int(math.ceil(estimativa)), chamadas * 10))
+
+def intervalo_mediana(valores, confianca_z: float = 1.96) -> tuple[float, float]:
+    """
+    Intervalo de confiança da mediana pelas estatísticas de ordem (sem supor distribuição):
+    posições n/2 ± z·√n/2 dos valores ordenados.
+    """
+    ordenados = sorted(valores)
+    n = len(ordenados)
+    meia = confianca_z * math.sqrt(n) / 2
+    inferior = max(int(math.floor(n / 2 - meia)), 0)
+    superior = min(int(math.ceil(n / 2 + meia)), n - 1)
+    return ordenados[inferior], ordenados[superior]
+
+def medir(executar, precisao: float = 0.03, tempo_amostra: float = 0.005, min_amostras: int = 10,
+          max_amostras: int = 1000, tempo_maximo: float | None = None) -> dict:
+    """
+    Mede executar(i) (i = índice da chamada, para variar a seed) com repetição adaptativa.
+
+    Parâmetros
+    ----------
+    precisao : meia largura relativa do IC 95% da mediana para parar (ex.: 0.03 = ±3%)
+    tempo_amostra : duração mínima de uma amostra; chamadas rápidas são agrupadas até atingi-la
+    min_amostras, max_amostras : limites do número de amostras
+    tempo_maximo : orçamento de tempo total (segundos), opcional; só vale depois de min_amostras
+
+    Retorna
+    -------
+    dict com "tempos" e "tempos_cpu" (segundos por chamada, um valor por amostra),
+    "chamadas" (chamadas por amostra) e "ic_mediana" (IC 95% da mediana dos tempos).
+    """
+    chamadas = _calibrar(executar, tempo_amostra)
+    tempos = []
+    tempos_cpu = []
+    proxima = chamadas  # índice da próxima chamada (a calibração usou os anteriores)
+    inicio_total = time.perf_counter()
+    gc_ligado = gc.isenabled()
+    try:
+        while len(tempos) < max_amostras:
+            gc.collect()
+            gc.disable()
+            inicio = time.perf_counter()
+            inicio_cpu = time.process_time()
+            for i in range(proxima, proxima + chamadas):
+                executar(i)
+            fim_cpu = time.process_time()
+            fim = time.perf_counter()
+            if gc_ligado:
+                gc.enable()
+            proxima += chamadas
+            tempos.append((fim - inicio) / chamadas)
+            tempos_cpu.append((fim_cpu - inicio_cpu) / chamadas)
+
+            if len(tempos) < min_amostras:
+                continue
+            inferior, superior = intervalo_mediana(tempos)
+            mediana = sorted(tempos)[len(tempos) // 2]
+            if (superior - inferior) / 2 <= precisao * mediana:
+                break
+            if tempo_maximo is not None and time.perf_counter() - inicio_total >= tempo_maximo:
+                break
+    finally:
+        if gc_ligado:
+            gc.enable()
+
+    return {
+        "tempos": tempos,
+        "tempos_cpu": tempos_cpu,
+        "chamadas": chamadas,
+        "ic_mediana": list(intervalo_mediana(tempos))
+    }
+
+def _ler_status(campo: str) -> int | None:
+    """Valor (em bytes) de um campo de /proc/self/status, como VmRSS ou VmHWM; None fora do Linux."""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for linha in f:
+                if linha.startswith(campo + ":"):
+                    return int(linha.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+def _zerar_pico_rss() -> bool:
+    """Zera o pico de RSS do processo (VmHWM := VmRSS) escrevendo 5 em /proc/self/clear_refs."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def medir_memoria(executar) -> dict:
+    """
+    Mede a memória usada por uma chamada executar() (executada duas vezes: uma para o RSS e
+    outra sob o tracemalloc, que deixa a chamada mais lenta e ocupa memória própria).
+
+    Retorna
+    -------
+    dict com
+    "pico_rss": quanto o pico de RSS do processo subiu acima do RSS de antes da chamada (bytes).
+        Memória que o processo já tinha reservado e reaproveitou não aparece. None quando o
+        sistema não permite zerar o pico (fora do Linux).
+    "pico_tracemalloc": pico de memória alocada (Python e NumPy) durante a chamada, acima do
+        que já estava alocado antes (bytes).
+    "blocos": blocos de memória do Python que continuam alocados depois da chamada, com o
+        resultado ainda vivo (o resultado em si e o que a chamada deixou guardado). É um saldo:
+        alocações temporárias liberadas durante a chamada não entram.
+    """
+    gc.collect()
+    pico_rss = None
+    rss_antes = _ler_status("VmRSS")
+    if rss_antes is not None and _zerar_pico_rss():
+        resultado = executar()
+        pico_rss = max(_ler_status("VmHWM") - rss_antes, 0)
+        del resultado
+        gc.collect()
+
+    rastreando = tracemalloc.is_tracing()
+    if not rastreando:
+        tracemalloc.start()
+    try:
+        blocos_antes = sys.getallocatedblocks()
+        atual_antes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        resultado = executar()
+        _, pico = tracemalloc.get_traced_memory()
+        blocos = sys.getallocatedblocks() - blocos_antes
+        del resultado
+    finally:
+        if not rastreando:
+            tracemalloc.stop()
+
+    return {
+        "pico_rss": pico_rss,
+        "pico_tracemalloc": max(pico - atual_antes, 0),
+        "blocos": blocos
+    }